@@ -1,25 +1,29 @@
-
-# Local / Colab-friendly — 4 modèles (Régression)
-# KNN, SVR, Decision Tree, Random Forest
+# Local / Colab-friendly — 5 modèles (Régression)
+# KNN, SVR, Decision Tree, Random Forest, HistGradientBoosting
 # X = toutes les colonnes sauf Task_Success_Rate
 # y = Task_Success_Rate
+import argparse
+import time
 import numpy as np
 import pandas as pd
 from pathlib import Path
 
 from sklearn.model_selection import train_test_split
-from sklearn.pipeline import Pipeline
-from sklearn.compose import ColumnTransformer
-from sklearn.impute import SimpleImputer
-from sklearn.preprocessing import StandardScaler
-from sklearn.compose import TransformedTargetRegressor
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 
-from sklearn.neighbors import KNeighborsRegressor
-from sklearn.svm import SVR
-from sklearn.tree import DecisionTreeRegressor
-from sklearn.ensemble import RandomForestRegressor
+from artifact import model_size, save_artifact
+from candidates import PreparedSplit, make_models, make_preprocess, wrap_regressor
+from tournament import format_summary, run_tournament
+from search import format_history, search_all
+from predict import align, new_data, print_predictions
 
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+# Options : python Machine_Learning.py [--search] [--budget 300] [--seed 42] [--ann]
+parser = argparse.ArgumentParser(description="Entraîner et sélectionner le modèle Task_Success_Rate")
+parser.add_argument("--search", action="store_true", help="régler les hyperparamètres (successive halving)")
+parser.add_argument("--budget", type=float, default=None, help="temps max de la recherche, en secondes")
+parser.add_argument("--seed", type=int, default=42)
+parser.add_argument("--ann", action="store_true", help="ajouter le KNN approché (ann.py) aux candidats")
+args = parser.parse_args()
 
 # -------- Partie 1: Train les models et chercher le plus performant --------
 
@@ -56,93 +60,68 @@ X_train, X_test, y_train, y_test = train_test_split(
 # -------- 4) Préprocessing (imputation + scaling) --------
 numeric_features = X.columns.tolist()
 
-numeric_preprocess = Pipeline(steps=[
-    ("imputer", SimpleImputer(strategy="median")),
-    ("scaler", StandardScaler()),
-])
+preprocess = make_preprocess(numeric_features)
 
-preprocess = ColumnTransformer(
-    transformers=[("num", numeric_preprocess, numeric_features)],
-    remainder="drop"
-)
+# -------- 5) Modèles (voir candidates.py) --------
+models = make_models(ann=args.ann)
+
+if args.search:
+    # Hyperparamètres réglés sur le train set uniquement (voir search.py)
+    models, search_history = search_all(X_train, y_train, models, time_budget=args.budget, seed=args.seed)
+    print("\n=== Successive halving (meilleur candidat par tour) ===")
+    print(format_history(search_history))
 
-# -------- 5) Modèles --------
-models = {
-    "KNN": KNeighborsRegressor(n_neighbors=7),
-    "SVM(SVR-RBF)": SVR(kernel="rbf", C=10, gamma="scale", epsilon=0.1),
-    "DecisionTree": DecisionTreeRegressor(random_state=42, max_depth=None),
-    "RandomForest": RandomForestRegressor(
-        random_state=42, n_estimators=300, max_depth=None, n_jobs=-1
-    ),
-}
-
-def wrap_model(name, model):
-    # Pour SVR, scaler y aide souvent
-    if "SVR" in name:
-        return Pipeline(steps=[
-            ("preprocess", preprocess),
-            ("reg", TransformedTargetRegressor(
-                regressor=model,
-                transformer=StandardScaler()
-            ))
-        ])
-    else:
-        return Pipeline(steps=[
-            ("preprocess", preprocess),
-            ("reg", model)
-        ])
-
-# -------- 6) Entraîner + évaluer --------
+# -------- 6) Sélection par validation croisée (5 folds, en parallèle) --------
+cv_summary, cv_scores = run_tournament(X_train, y_train, models, n_splits=5)
+
+print("\n=== Validation croisée 5 folds (train set) ===")
+print(format_summary(cv_summary))
+
+best_model_name = cv_summary.iloc[0]["Model"]
+print("\nMeilleur modèle (selon R2 moyen en CV):", best_model_name)
+
+# -------- 7) Entraîner + évaluer sur le test set --------
+# Préprocessing entraîné une seule fois ; tous les modèles partent des mêmes matrices transformées
+split = PreparedSplit(preprocess, X_train, y_train, X_test, y_test)
 results = []
+# Régresseurs déjà entraînés, gardés pour ne pas ré-entraîner le meilleur
+fitted = {}
 
 for name, model in models.items():
-    pipe = wrap_model(name, model)
-    pipe.fit(X_train, y_train)
-    y_pred = pipe.predict(X_test)
+    reg = wrap_regressor(name, model)
+    X_tr, X_te = split.arrays(name)
+    reg.fit(X_tr, split.y_train)
+    fitted[name] = reg
+    t0 = time.perf_counter()
+    y_pred = reg.predict(X_te)
+    predict_s = time.perf_counter() - t0
 
     mae = mean_absolute_error(y_test, y_pred)
     rmse = np.sqrt(mean_squared_error(y_test, y_pred))
     r2 = r2_score(y_test, y_pred)
 
-    results.append({"Model": name, "MAE": mae, "RMSE": rmse, "R2": r2})
+    # Coût de service : taille sérialisée et latence de prédiction par ligne (lot du test set)
+    results.append({"Model": name, "MAE": mae, "RMSE": rmse, "R2": r2,
+                    "size_kB": model_size(reg) / 1024, "us_per_row": predict_s / len(X_te) * 1e6})
 
 results_df = pd.DataFrame(results).sort_values(by="R2", ascending=False)
 
 print("\n=== Résultats (test set) ===")
-print(results_df.to_string(index=False))
-
-best_model_name = results_df.iloc[0]["Model"]
-print("\nMeilleur modèle (selon R2):", best_model_name)
-
+print(results_df.round({"size_kB": 1, "us_per_row": 2}).to_string(index=False))
 
-# -------- Partie 2: Predire avec RandomForest Task_Success_Rate --------
 
-# -------- 7) Refit meilleur modèle + prédire new_data --------
-best_model_pipeline = wrap_model(best_model_name, models[best_model_name])
-best_model_pipeline.fit(X_train, y_train)
+# -------- Partie 2: Sauvegarder le meilleur modèle et prédire Task_Success_Rate --------
 
-new_data = pd.DataFrame({
-    'Hours_Coding': [7],
-    'Lines_of_Code': [200],
-    'Bugs_Found': [10],
-    'Bugs_Fixed': [3],
-    'AI_Usage_Hours': [1],
-    'Sleep_Hours': [5],
-    'Cognitive_Load': [10],
-    'Coffee_Intake': [3],
-    'Stress_Level': [10],
-    'Task_Duration_Hours': [3],
-    'Commits': [10],
-    'Errors': [50]
-})
+# -------- 8) Sauvegarder le meilleur pipeline (déjà entraîné) --------
+# predict.py recharge ensuite cet artefact sans refaire l'entraînement
+best_model_pipeline = split.pipeline(fitted[best_model_name])
+best_metrics = results_df.set_index("Model").loc[best_model_name].to_dict()
+artifact_path = save_artifact(best_model_pipeline, best_model_name, X.columns, target, best_metrics)
+print("Modèle sauvegardé :", artifact_path)
 
-# Aligner automatiquement sur les colonnes de X (évite KeyError si colonnes manquantes)
-new_data_aligned = new_data.reindex(columns=X.columns, fill_value=np.nan)
+# -------- 9) Prédire new_data (ligne d'exemple de predict.py) --------
+new_data_aligned = align(new_data, X.columns)
 
 predictions = best_model_pipeline.predict(new_data_aligned)
 
-print("\n--- Prédictions pour de nouvelles données ---")
-for i, pred in enumerate(predictions, start=1):
-    print(f"\nEntrée Ligne {i}:")
-    print(new_data_aligned.iloc[[i-1]].to_string(index=False))
-    print(f"Taux de succès de la tâche prédit: {pred:.2f}")
+print_predictions(new_data_aligned, predictions)
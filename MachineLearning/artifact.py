@@ -0,0 +1,80 @@
+# Sauvegarde / chargement du modèle entraîné par Machine_Learning.py
+# Un artefact = le pipeline complet (ColumnTransformer + régresseur) + le schéma des features
+# + les métriques du test set, dans models/model_v<N>.joblib (N incrémenté à chaque entraînement).
+# Un fichier model_v<N>.json à côté décrit l'artefact sans avoir à le charger.
+import io
+import json
+import re
+import time
+from pathlib import Path
+
+import joblib
+import sklearn
+
+# À incrémenter si le contenu de l'artefact change
+ARTIFACT_FORMAT = 1
+
+MODELS_DIR = Path(__file__).resolve().parent / "models"
+_NAME = re.compile(r"model_v(\d+)\.joblib$")
+
+
+def list_versions(models_dir=MODELS_DIR):
+    versions = []
+    for path in Path(models_dir).glob("model_v*.joblib"):
+        match = _NAME.match(path.name)
+        if match:
+            versions.append(int(match.group(1)))
+    return sorted(versions)
+
+
+def save_artifact(pipeline, model_name, features, target, metrics, models_dir=MODELS_DIR):
+    """Enregistre le pipeline entraîné dans une nouvelle version et retourne son chemin."""
+    models_dir = Path(models_dir)
+    models_dir.mkdir(parents=True, exist_ok=True)
+    versions = list_versions(models_dir)
+    version = versions[-1] + 1 if versions else 1
+
+    meta = {
+        "format": ARTIFACT_FORMAT,
+        "version": version,
+        "model": model_name,
+        "features": list(features),
+        "target": target,
+        "metrics": {k: float(v) for k, v in metrics.items()},
+        "sklearn_version": sklearn.__version__,
+        "trained_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    path = models_dir / f"model_v{version}.joblib"
+    # Écriture dans un fichier temporaire puis renommage : pas d'artefact à moitié écrit
+    tmp = path.with_suffix(".tmp")
+    joblib.dump({"meta": meta, "pipeline": pipeline}, tmp)
+    tmp.replace(path)
+    path.with_suffix(".json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    return path
+
+
+def load_artifact(path=None, models_dir=MODELS_DIR):
+    """
+    Charge un artefact (par défaut la dernière version de models_dir).
+    Retourne (pipeline, meta).
+    """
+    if path is None:
+        versions = list_versions(models_dir)
+        if not versions:
+            raise FileNotFoundError(f"Aucun modèle dans {models_dir} : lancer d'abord Machine_Learning.py")
+        path = Path(models_dir) / f"model_v{versions[-1]}.joblib"
+    artifact = joblib.load(path)
+    meta = artifact["meta"]
+    if meta["format"] != ARTIFACT_FORMAT:
+        raise ValueError(f"Format d'artefact {meta['format']} non supporté (attendu {ARTIFACT_FORMAT})")
+    if meta["sklearn_version"] != sklearn.__version__:
+        print(f"Attention : modèle entraîné avec scikit-learn {meta['sklearn_version']}, "
+              f"version installée {sklearn.__version__}")
+    return artifact["pipeline"], meta
+
+
+def model_size(model):
+    # Taille (octets) du modèle une fois sérialisé par joblib, comme dans l'artefact
+    buffer = io.BytesIO()
+    joblib.dump(model, buffer)
+    return buffer.getbuffer().nbytes
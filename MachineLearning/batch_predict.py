@@ -0,0 +1,129 @@
+# Prédiction par lots de Task_Success_Rate sur de gros CSV
+# Le CSV est lu par chunks, chaque chunk est aligné sur les features du modèle
+# (reindex(columns=...) comme dans predict.py) puis prédit, éventuellement dans un pool de processus.
+# Les prédictions sont écrites au fil de l'eau dans un fichier .npy (une colonne float64,
+# dans l'ordre des lignes du CSV), relisible avec np.load(path, mmap_mode="r").
+# Usage : python batch_predict.py lignes.csv [--output pred.npy] [--chunksize 200000] [--workers 4]
+import argparse
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from artifact import load_artifact
+from predict import align
+
+# Taille réservée pour l'en-tête .npy (réécrit à la fin, quand le nombre de lignes est connu)
+NPY_HEADER_SIZE = 128
+
+
+class NpyColumnWriter:
+    """Écrit un tableau 1-D .npy par morceaux, sans connaître sa longueur à l'avance."""
+
+    def __init__(self, path, dtype=np.float64):
+        self.path = Path(path)
+        self.dtype = np.dtype(dtype)
+        self.rows = 0
+        self.tmp = self.path.with_name(self.path.name + ".tmp")
+        self.f = open(self.tmp, "wb")
+        self.f.write(b"\0" * NPY_HEADER_SIZE)
+
+    def write(self, values):
+        values = np.ascontiguousarray(values, dtype=self.dtype)
+        self.f.write(values.tobytes())
+        self.rows += len(values)
+
+    def _header(self):
+        header = repr({"descr": self.dtype.str, "fortran_order": False, "shape": (self.rows,)})
+        # magic + version 1.0 + longueur (2 octets), puis le dict complété par des espaces et '\n'
+        header = header.ljust(NPY_HEADER_SIZE - 10 - 1) + "\n"
+        return b"\x93NUMPY\x01\x00" + len(header).to_bytes(2, "little") + header.encode("latin1")
+
+    def close(self):
+        self.f.seek(0)
+        self.f.write(self._header())
+        self.f.close()
+        # Renommage atomique : pas de fichier de sortie à moitié écrit
+        os.replace(self.tmp, self.path)
+
+    def abort(self):
+        self.f.close()
+        os.remove(self.tmp)
+
+
+# ---------- Workers ----------
+
+_worker_model = None
+
+
+def _init_worker(model_path):
+    global _worker_model
+    pipeline, meta = load_artifact(model_path)
+    # Un seul thread par worker : le parallélisme vient du pool
+    pipeline.set_params(**{k: 1 for k in pipeline.get_params() if k.endswith("n_jobs")})
+    _worker_model = (pipeline, meta["features"])
+
+
+def _predict_chunk(chunk):
+    pipeline, features = _worker_model
+    return pipeline.predict(align(chunk, features))
+
+
+def score_csv(input_path, output_path=None, model_path=None, chunksize=200_000, workers=None):
+    """
+    Prédit toutes les lignes de input_path et écrit les prédictions dans output_path (.npy).
+    Un CSV sans lignes (en-tête seul) donne un .npy vide.
+    workers : None ou 1 = dans le processus courant, sinon taille du pool.
+    Retourne (output_path, nombre de lignes, durée en secondes).
+    """
+    input_path = Path(input_path)
+    if output_path is None:
+        output_path = input_path.with_name(input_path.stem + "_predictions.npy")
+    start = time.perf_counter()
+    chunks = pd.read_csv(input_path, chunksize=chunksize)
+    writer = NpyColumnWriter(output_path)
+    try:
+        if workers is None or workers <= 1:
+            _init_worker(model_path)
+            for chunk in chunks:
+                if len(chunk):
+                    writer.write(_predict_chunk(chunk))
+        else:
+            with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(model_path,)) as pool:
+                # Au plus 2 chunks en attente par worker : la mémoire reste bornée
+                pending = deque()
+                for chunk in chunks:
+                    if not len(chunk):
+                        continue
+                    pending.append(pool.submit(_predict_chunk, chunk))
+                    if len(pending) >= 2 * workers:
+                        writer.write(pending.popleft().result())
+                while pending:
+                    writer.write(pending.popleft().result())
+    except BaseException:
+        writer.abort()
+        raise
+    writer.close()
+    return output_path, writer.rows, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Prédiction par lots de Task_Success_Rate")
+    parser.add_argument("input", help="CSV des lignes à prédire")
+    parser.add_argument("--output", default=None, help="fichier .npy (défaut : <input>_predictions.npy)")
+    parser.add_argument("--model", default=None, help="artefact .joblib (défaut : dernière version)")
+    parser.add_argument("--chunksize", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, default=None, help="taille du pool de processus")
+    args = parser.parse_args(argv)
+
+    output, rows, seconds = score_csv(args.input, args.output, args.model, args.chunksize, args.workers)
+    print(f"{rows} lignes prédites en {seconds:.2f} s ({rows / max(seconds, 1e-9):,.0f} lignes/s)")
+    print("Prédictions :", output)
+
+
+if __name__ == "__main__":
+    main()
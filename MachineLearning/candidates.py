@@ -0,0 +1,92 @@
+# Modèles candidats et préprocessing, partagés par Machine_Learning.py et tournament.py
+# (dans un module importable pour que les workers d'un pool de processus puissent les charger)
+import numpy as np
+
+from sklearn.pipeline import Pipeline
+from sklearn.compose import ColumnTransformer
+from sklearn.impute import SimpleImputer
+from sklearn.preprocessing import StandardScaler
+from sklearn.compose import TransformedTargetRegressor
+
+from sklearn.neighbors import KNeighborsRegressor
+from sklearn.svm import SVR
+from sklearn.tree import DecisionTreeRegressor
+from sklearn.ensemble import HistGradientBoostingRegressor, RandomForestRegressor
+
+from ann import RPForestKNNRegressor
+
+
+def make_preprocess(numeric_features):
+    # Préprocessing (imputation + scaling)
+    numeric_preprocess = Pipeline(steps=[
+        ("imputer", SimpleImputer(strategy="median")),
+        ("scaler", StandardScaler()),
+    ])
+
+    return ColumnTransformer(
+        transformers=[("num", numeric_preprocess, numeric_features)],
+        remainder="drop"
+    )
+
+
+def make_models(n_jobs=-1, ann=False):
+    # ann=True : ajoute un KNN approché (RP forest, voir ann.py). Avec 8 arbres de feuilles 64,
+    # plus rapide que le kd_tree mais rappel@7 ~0.7 ; python ann.py compare les réglages
+    models = {
+        "KNN": KNeighborsRegressor(n_neighbors=7),
+        "SVM(SVR-RBF)": SVR(kernel="rbf", C=10, gamma="scale", epsilon=0.1),
+        "DecisionTree": DecisionTreeRegressor(random_state=42, max_depth=None),
+        "RandomForest": RandomForestRegressor(
+            random_state=42, n_estimators=300, max_depth=None, n_jobs=n_jobs
+        ),
+        # Boosting sur histogrammes : s'arrête quand le score sur 10 % du train (validation) ne progresse plus
+        "HistGradientBoosting": HistGradientBoostingRegressor(
+            random_state=42, max_iter=1000, learning_rate=0.05,
+            early_stopping=True, validation_fraction=0.1, n_iter_no_change=20
+        ),
+    }
+    if ann:
+        models["KNN(ANN)"] = RPForestKNNRegressor(n_neighbors=7, n_trees=8, leaf_size=64)
+    return models
+
+
+def wrap_regressor(name, model):
+    # Pour SVR, scaler y aide souvent
+    if "SVR" in name:
+        return TransformedTargetRegressor(regressor=model, transformer=StandardScaler())
+    return model
+
+
+# Type des matrices d'entrée par modèle : les arbres de sklearn travaillent en float32,
+# leur donner directement du float32 évite une conversion (et une copie) à chaque fit / predict
+INPUT_DTYPES = {"DecisionTree": np.float32, "RandomForest": np.float32}
+
+
+class PreparedSplit:
+    """
+    Un split train/test dont le préprocessing est entraîné une seule fois sur X_train.
+    Les matrices transformées sont gardées en cache (contiguës, une copie par dtype)
+    et partagées par tous les modèles candidats.
+    """
+
+    def __init__(self, preprocess, X_train, y_train, X_test, y_test):
+        self.preprocess = preprocess
+        self.y_train = np.ascontiguousarray(y_train, dtype=np.float64)
+        self.y_test = np.ascontiguousarray(y_test, dtype=np.float64)
+        train = preprocess.fit_transform(X_train)
+        self._arrays = {np.dtype(np.float64): (
+            np.ascontiguousarray(train, dtype=np.float64),
+            np.ascontiguousarray(preprocess.transform(X_test), dtype=np.float64),
+        )}
+
+    def arrays(self, name):
+        """(X_train, X_test) transformés, dans le dtype attendu par le modèle name."""
+        dtype = np.dtype(INPUT_DTYPES.get(name, np.float64))
+        if dtype not in self._arrays:
+            X_tr, X_te = self._arrays[np.dtype(np.float64)]
+            self._arrays[dtype] = (X_tr.astype(dtype), X_te.astype(dtype))
+        return self._arrays[dtype]
+
+    def pipeline(self, reg):
+        # Pipeline complet (préprocessing déjà entraîné + régresseur entraîné), pour l'artefact
+        return Pipeline(steps=[("preprocess", self.preprocess), ("reg", reg)])
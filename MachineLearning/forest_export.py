@@ -0,0 +1,241 @@
+# Export compact d'un RandomForestRegressor entraîné, pour la prédiction à faible latence
+# Tous les arbres sont aplatis dans quelques tableaux NumPy contigus (un nœud = une case) :
+#   feature (int16), threshold (float32), children (int32, ou int64 au-delà de 2**30 nœuds ;
+#   fils gauche / droit entrelacés),
+#   value (float32, float16 ou entier quantifié)
+# Une feuille pointe sur elle-même avec un seuil +inf : l'évaluation avance tous les arbres et
+# toutes les lignes d'un lot en même temps, depth fois, sans boucle Python par nœud.
+# Options : élagage (max_depth : un nœud à cette profondeur devient une feuille, avec la moyenne
+# de ses échantillons) et quantification des valeurs des feuilles.
+# Usage : python forest_export.py [--model models/model_v1.joblib] [--max-depth 12] [--quantize uint8] [--save]
+import argparse
+import time
+
+import numpy as np
+from sklearn.base import BaseEstimator, RegressorMixin
+
+QUANTIZED = {"uint8": np.uint8, "uint16": np.uint16}
+
+
+def _float32_floor(values):
+    # Arrondi vers -inf en float32 : pour x float32, x <= t32 équivaut à x <= t (float64),
+    # donc les décisions restent celles de sklearn (qui compare X converti en float32)
+    t32 = values.astype(np.float32)
+    up = t32.astype(np.float64) > values
+    t32[up] = np.nextafter(t32[up], np.float32(-np.inf))
+    return t32
+
+
+def _flatten_tree(tree, max_depth=None):
+    # Nœuds en ordre de parcours en largeur depuis la racine, un niveau à la fois (NumPy) ;
+    # les nœuds plus profonds que max_depth sont coupés
+    t = tree.tree_
+    children_left, children_right = t.children_left, t.children_right
+    levels = []
+    frontier = np.array([0], dtype=np.int64)
+    while len(frontier):
+        levels.append(frontier)
+        if max_depth is not None and len(levels) > max_depth:
+            break
+        inner = frontier[children_left[frontier] != -1]
+        # Fils gauche puis droit de chaque nœud, dans l'ordre du niveau (comme une file FIFO)
+        frontier = np.stack([children_left[inner], children_right[inner]], axis=1).ravel()
+    order = np.concatenate(levels)
+    depth = len(levels) - 1
+    node_depth = np.repeat(np.arange(len(levels)), [len(level) for level in levels])
+
+    # Nouvel indice de chaque nœud gardé
+    ids = np.full(t.node_count, -1, dtype=np.int64)
+    ids[order] = np.arange(len(order))
+    is_leaf = children_left[order] == -1
+    if max_depth is not None:
+        is_leaf |= node_depth >= max_depth
+    own = np.arange(len(order))
+    # Une feuille pointe sur elle-même, avec un seuil +inf
+    feature = np.where(is_leaf, 0, t.feature[order])
+    threshold = np.where(is_leaf, np.inf, t.threshold[order])
+    left = np.where(is_leaf, own, ids[children_left[order]])
+    right = np.where(is_leaf, own, ids[children_right[order]])
+    value = t.value[order, 0, 0].astype(np.float64)
+    return feature, threshold, left, right, value, depth
+
+
+def _index_dtype(largest):
+    # Plus petit entier signé qui contient largest (indices des nœuds / des features)
+    for dtype in (np.int16, np.int32):
+        if largest <= np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+class PackedForestRegressor(RegressorMixin, BaseEstimator):
+    """
+    Forêt aplatie. Utilisable à la place du RandomForestRegressor dans le Pipeline de
+    l'artefact (même entrée : la matrice préprocessée).
+    En général construite par export_forest(forêt déjà entraînée) ; fit(X, y) entraîne
+    forest (RandomForestRegressor par défaut) puis l'aplatit, comme un estimateur sklearn.
+    max_depth / quantize : voir export_forest.
+    """
+
+    def __init__(self, forest=None, max_depth=None, quantize=None, batch_size=4096):
+        self.forest = forest
+        self.max_depth = max_depth
+        self.quantize = quantize
+        self.batch_size = batch_size
+
+    def fit(self, X, y):
+        from sklearn.base import clone
+        from sklearn.ensemble import RandomForestRegressor
+
+        forest = clone(self.forest) if self.forest is not None else RandomForestRegressor(random_state=42)
+        return self._pack(forest.fit(X, y))
+
+    def _pack(self, forest):
+        trees = [_flatten_tree(est, self.max_depth) for est in forest.estimators_]
+        sizes = np.array([len(t[0]) for t in trees])
+        offsets = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+
+        self.feature_ = np.concatenate([t[0] for t in trees]).astype(_index_dtype(forest.n_features_in_ - 1))
+        self.threshold_ = _float32_floor(np.concatenate([t[1] for t in trees]))
+        # children[2 * nœud] = fils gauche, children[2 * nœud + 1] = fils droit
+        left = np.concatenate([t[2] + off for t, off in zip(trees, offsets)])
+        right = np.concatenate([t[3] + off for t, off in zip(trees, offsets)])
+        # predict calcule 2 * nœud + 1 dans le dtype des nœuds : int32 seulement s'il ne déborde pas,
+        # int64 au-delà (forêts de plus de 2**30 nœuds)
+        nodes = np.int32 if 2 * sizes.sum() <= np.iinfo(np.int32).max else np.int64
+        self.children_ = np.stack([left, right], axis=1).ravel().astype(nodes)
+        self.roots_ = offsets.astype(nodes)
+        self.depth_ = max(t[5] for t in trees)
+        self.n_features_in_ = forest.n_features_in_
+
+        value = np.concatenate([t[4] for t in trees])
+        self.value_scale_ = self.value_offset_ = None
+        if self.quantize in QUANTIZED:
+            levels = np.iinfo(QUANTIZED[self.quantize]).max
+            low, high = value.min(), value.max()
+            self.value_offset_ = low
+            self.value_scale_ = (high - low) / levels if high > low else 1.0
+            self.value_ = np.round((value - low) / self.value_scale_).astype(QUANTIZED[self.quantize])
+        elif self.quantize == "float16":
+            self.value_ = value.astype(np.float16)
+        elif self.quantize is None:
+            self.value_ = value.astype(np.float32)
+        else:
+            raise ValueError(f"quantize doit être None, 'float16', 'uint8' ou 'uint16' (reçu {self.quantize!r})")
+        return self
+
+    def leaf_values(self, nodes):
+        if self.value_scale_ is None:
+            return self.value_[nodes].astype(np.float64)
+        return self.value_offset_ + self.value_[nodes].astype(np.float64) * self.value_scale_
+
+    def predict(self, X):
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        out = np.empty(len(X))
+        for start in range(0, len(X), self.batch_size):
+            x = X[start:start + self.batch_size]
+            # nodes[i, j] : nœud courant de la ligne i dans l'arbre j
+            nodes = np.broadcast_to(self.roots_, (len(x), len(self.roots_))).copy()
+            row = (np.arange(len(x)) * x.shape[1])[:, None]
+            flat = x.ravel()
+            for _ in range(self.depth_):
+                go_right = flat[row + self.feature_[nodes]] > self.threshold_[nodes]
+                nodes = self.children_[2 * nodes + go_right]
+            out[start:start + len(x)] = self.leaf_values(nodes).mean(axis=1)
+        return out
+
+    def nbytes(self):
+        arrays = [self.feature_, self.threshold_, self.children_, self.value_, self.roots_]
+        return sum(a.nbytes for a in arrays)
+
+
+def export_forest(forest, max_depth=None, quantize=None):
+    """
+    Aplatit forest (RandomForestRegressor entraîné) en PackedForestRegressor.
+    max_depth : élagage à cette profondeur (None = arbres complets).
+    quantize : None (float32), "float16", "uint8" ou "uint16" pour les valeurs des nœuds.
+    """
+    # forest n'est pas gardée en paramètre : l'export ne contient que les tableaux aplatis
+    return PackedForestRegressor(max_depth=max_depth, quantize=quantize)._pack(forest)
+
+
+def best_time(model, X, repeat=3):
+    # Durée (s) de model.predict(X), meilleur de repeat essais
+    best = np.inf
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        model.predict(X)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def compare(forest, packed, X_test, y_test):
+    """
+    Tableau forêt sklearn vs export : R2 / MAE, écart max des prédictions, taille sérialisée,
+    débit sur tout X_test et latence d'une prédiction d'une seule ligne.
+    """
+    import pandas as pd
+    from sklearn.metrics import mean_absolute_error, r2_score
+    from artifact import model_size
+
+    reference = forest.predict(X_test)
+    rows = []
+    for name, model in [("sklearn RandomForest", forest), ("packed", packed)]:
+        pred = model.predict(X_test)
+        rows.append({
+            "Model": name,
+            "R2": r2_score(y_test, pred),
+            "MAE": mean_absolute_error(y_test, pred),
+            "max_diff": np.abs(pred - reference).max(),
+            "size_kB": model_size(model) / 1024,
+            "rows_per_s": len(X_test) / best_time(model, X_test),
+            "one_row_ms": best_time(model, X_test[:1], repeat=20) * 1000,
+        })
+    table = pd.DataFrame(rows)
+    table["size_ratio"] = table["size_kB"] / table["size_kB"].iloc[0]
+    return table
+
+
+def main(argv=None):
+    import pandas as pd
+    from pathlib import Path
+    from sklearn.model_selection import train_test_split
+    from artifact import load_artifact, save_artifact
+
+    parser = argparse.ArgumentParser(description="Export compact du RandomForest de l'artefact")
+    parser.add_argument("--model", default=None, help="artefact .joblib (défaut : dernière version)")
+    parser.add_argument("--max-depth", type=int, default=None, help="élagage des arbres à cette profondeur")
+    parser.add_argument("--quantize", default=None, choices=["float16", "uint8", "uint16"])
+    parser.add_argument("--save", action="store_true", help="enregistrer la forêt exportée comme nouvel artefact")
+    args = parser.parse_args(argv)
+
+    pipeline, meta = load_artifact(args.model)
+    forest = pipeline.named_steps["reg"]
+    if not hasattr(forest, "estimators_") or not hasattr(forest.estimators_[0], "tree_"):
+        raise ValueError(f"L'artefact v{meta['version']} contient un {meta['model']}, pas un RandomForest")
+
+    # Même test set que Machine_Learning.py
+    df = pd.read_csv(Path(__file__).resolve().parent / "data.csv")
+    X = df.drop(columns=[meta["target"]]).reindex(columns=meta["features"])
+    y = df[meta["target"]]
+    _, X_test, _, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    X_test = pipeline.named_steps["preprocess"].transform(X_test)
+
+    packed = export_forest(forest, args.max_depth, args.quantize)
+    print(compare(forest, packed, X_test, y_test).round(4).to_string(index=False))
+
+    if args.save:
+        from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+        pred = packed.predict(X_test)
+        metrics = {"MAE": mean_absolute_error(y_test, pred),
+                   "RMSE": np.sqrt(mean_squared_error(y_test, pred)), "R2": r2_score(y_test, pred)}
+        pipeline = type(pipeline)(steps=[("preprocess", pipeline.named_steps["preprocess"]), ("reg", packed)])
+        path = save_artifact(pipeline, f"{meta['model']}(packed)", meta["features"], meta["target"], metrics)
+        print("Modèle sauvegardé :", path)
+
+
+if __name__ == "__main__":
+    # Passer par le module importé : l'artefact (--save) doit référencer forest_export.PackedForestRegressor,
+    # pas __main__.PackedForestRegressor, pour que predict.py puisse le recharger
+    import forest_export
+    forest_export.main()
@@ -0,0 +1,64 @@
+# Prédire Task_Success_Rate sans ré-entraîner :
+# charge le pipeline sauvegardé par Machine_Learning.py (voir artifact.py) puis prédit.
+# Usage : python predict.py [--model models/model_v1.joblib] [--input lignes.csv]
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from artifact import load_artifact
+
+# Ligne d'exemple utilisée quand aucun --input n'est donné
+new_data = pd.DataFrame({
+    'Hours_Coding': [7],
+    'Lines_of_Code': [200],
+    'Bugs_Found': [10],
+    'Bugs_Fixed': [3],
+    'AI_Usage_Hours': [1],
+    'Sleep_Hours': [5],
+    'Cognitive_Load': [10],
+    'Coffee_Intake': [3],
+    'Stress_Level': [10],
+    'Task_Duration_Hours': [3],
+    'Commits': [10],
+    'Errors': [50]
+})
+
+
+def align(rows, features):
+    # Aligner automatiquement sur les colonnes du modèle (évite KeyError si colonnes manquantes)
+    return rows.reindex(columns=features, fill_value=np.nan)
+
+
+def print_predictions(rows, predictions):
+    print("\n--- Prédictions pour de nouvelles données ---")
+    for i, pred in enumerate(predictions, start=1):
+        print(f"\nEntrée Ligne {i}:")
+        print(rows.iloc[[i-1]].to_string(index=False))
+        print(f"Taux de succès de la tâche prédit: {pred:.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Prédire Task_Success_Rate avec le modèle sauvegardé")
+    parser.add_argument("--model", default=None, help="artefact .joblib (défaut : dernière version)")
+    parser.add_argument("--input", default=None, help="CSV des lignes à prédire (défaut : ligne d'exemple)")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    pipeline, meta = load_artifact(args.model)
+    t1 = time.perf_counter()
+
+    rows = new_data if args.input is None else pd.read_csv(args.input)
+    rows = align(rows, meta["features"])
+    predictions = pipeline.predict(rows)
+    t2 = time.perf_counter()
+
+    print(f"Modèle v{meta['version']} ({meta['model']}, R2 test = {meta['metrics']['R2']:.3f})")
+    print_predictions(rows, predictions)
+    print(f"\nChargement : {(t1 - t0) * 1000:.1f} ms | prédiction : {(t2 - t1) * 1000:.1f} ms")
+    return predictions
+
+
+if __name__ == "__main__":
+    main()
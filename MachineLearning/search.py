@@ -0,0 +1,172 @@
+# Recherche d'hyperparamètres par successive halving, pour chaque famille de modèles
+# Tour 0 : n_candidates configurations tirées au hasard (graine fixe) sont évaluées en CV
+# avec un petit budget (peu de lignes d'entraînement, ou peu d'arbres pour RandomForest).
+# À chaque tour, on garde le meilleur 1/factor des candidats et on multiplie le budget par factor,
+# jusqu'au budget complet. Les évaluations (candidat, fold) d'un tour tournent dans le pool
+# de tournament.py ; un tour n'est plus lancé une fois le temps alloué à la famille écoulé.
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.metrics import r2_score
+
+import tournament
+from candidates import wrap_regressor
+from tournament import fold_splits
+
+# Espaces de recherche (valeurs discrètes) par famille de models dans candidates.make_models()
+SEARCH_SPACES = {
+    "KNN": {
+        "n_neighbors": [3, 5, 7, 9, 11, 15, 21, 31],
+        "weights": ["uniform", "distance"],
+        "p": [1, 2],
+    },
+    "KNN(ANN)": {
+        "n_neighbors": [3, 5, 7, 9, 11, 15, 21, 31],
+        "weights": ["uniform", "distance"],
+        "n_trees": [4, 8, 16],
+        "leaf_size": [32, 64, 128],
+    },
+    "SVM(SVR-RBF)": {
+        "C": [0.3, 1, 3, 10, 30, 100, 300],
+        "gamma": ["scale", 0.01, 0.03, 0.1, 0.3],
+        "epsilon": [0.01, 0.05, 0.1, 0.3],
+    },
+    "DecisionTree": {
+        "max_depth": [None, 4, 6, 8, 12, 16],
+        "min_samples_leaf": [1, 2, 5, 10, 20],
+        "max_features": [None, 0.5, "sqrt"],
+    },
+    "RandomForest": {
+        "max_depth": [None, 8, 12, 16, 24],
+        "min_samples_leaf": [1, 2, 4],
+        "max_features": [1.0, 0.7, 0.5, "sqrt"],
+    },
+    "HistGradientBoosting": {
+        "learning_rate": [0.02, 0.05, 0.1, 0.2],
+        "max_leaf_nodes": [15, 31, 63],
+        "min_samples_leaf": [5, 10, 20, 40],
+        "l2_regularization": [0.0, 0.1, 1.0],
+    },
+}
+
+# Ressource augmentée à chaque tour : nombre de lignes d'entraînement, ou paramètre du modèle
+RESOURCES = {"RandomForest": "n_estimators"}
+
+
+def sample_candidates(space, n_candidates, rng):
+    # Tirage sans remise dans la grille (toutes les combinaisons si elle est plus petite)
+    keys = list(space)
+    sizes = [len(space[k]) for k in keys]
+    total = math.prod(sizes)
+    picks = rng.choice(total, size=min(n_candidates, total), replace=False)
+    candidates = []
+    for flat in picks:
+        params = {}
+        for key, size in zip(keys, sizes):
+            flat, i = divmod(int(flat), size)
+            params[key] = space[key][i]
+        candidates.append(params)
+    return candidates
+
+
+def _evaluate(name, model, params, fold, n_rows, seed):
+    # R2 d'un candidat sur un fold, entraîné sur n_rows lignes (None = toutes)
+    split = tournament._folds[fold]
+    X_tr, X_te = split.arrays(name)
+    y_tr = split.y_train
+    if n_rows is not None and n_rows < len(y_tr):
+        rows = np.sort(np.random.default_rng(seed + fold).permutation(len(y_tr))[:n_rows])
+        X_tr, y_tr = X_tr[rows], y_tr[rows]
+    reg = wrap_regressor(name, clone(model).set_params(**params))
+    reg.fit(X_tr, y_tr)
+    return r2_score(split.y_test, reg.predict(X_te))
+
+
+def halving_search(name, model, space, map_fn, n_folds, n_train, n_candidates=24, factor=3,
+                   min_resource=None, time_budget=None, seed=42):
+    """
+    Successive halving pour une famille. Retourne (meilleurs paramètres, historique des tours).
+    map_fn : map du pool de processus (ou map intégré), les folds étant déjà chargés dans les workers.
+    """
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    rng = np.random.default_rng(seed)
+    candidates = sample_candidates(space, n_candidates, rng)
+    resource = RESOURCES.get(name)
+    max_resource = model.get_params()[resource] if resource else n_train
+    n_rounds = max(1, math.ceil(math.log(len(candidates), factor)))
+    if min_resource is None:
+        min_resource = max(10 if resource else 2 * n_folds * factor, max_resource // factor ** (n_rounds - 1))
+
+    history = []
+    for round_ in range(n_rounds):
+        budget = min(max_resource, min_resource * factor ** round_)
+        if round_ == n_rounds - 1:
+            budget = max_resource
+        tasks = []
+        for params in candidates:
+            params = dict(params, **{resource: budget}) if resource else params
+            for fold in range(n_folds):
+                tasks.append((name, model, params, fold, None if resource else budget, seed))
+        scores = np.array(list(map_fn(_evaluate, *zip(*tasks)))).reshape(len(candidates), n_folds).mean(axis=1)
+        for params, score in zip(candidates, scores):
+            history.append({"Model": name, "round": round_, "budget": budget, "params": params, "R2": score})
+
+        order = np.argsort(-scores, kind="stable")
+        candidates = [candidates[i] for i in order]
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+        candidates = candidates[:max(1, len(candidates) // factor)]
+        if len(candidates) == 1 and budget == max_resource:
+            break
+
+    return candidates[0], pd.DataFrame(history)
+
+
+def search_all(X, y, models, n_splits=3, n_candidates=24, factor=3, time_budget=None,
+               workers=None, seed=42):
+    """
+    Successive halving pour toutes les familles de SEARCH_SPACES présentes dans models.
+    time_budget (secondes) est réparti également entre les familles.
+    Retourne ({nom: modèle réglé (non entraîné)}, historique).
+    """
+    folds = fold_splits(X, y, n_splits, seed)
+    names = [name for name in models if name in SEARCH_SPACES]
+    share = None if time_budget is None else time_budget / max(1, len(names))
+    workers = workers or os.cpu_count() or 1
+
+    pool = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(workers, initializer=tournament._init_worker, initargs=(folds,))
+    else:
+        tournament._init_worker(folds)
+    tuned, history = dict(models), []
+    try:
+        for name in names:
+            model = models[name]
+            if pool is not None and "n_jobs" in model.get_params():
+                # Un seul thread par modèle : le parallélisme vient du pool
+                model = clone(model).set_params(n_jobs=1)
+            best, rounds = halving_search(name, model, SEARCH_SPACES[name], pool.map if pool else map,
+                                          n_splits, len(folds[0].y_train), n_candidates, factor,
+                                          time_budget=share, seed=seed)
+            tuned[name] = clone(models[name]).set_params(**best)
+            history.append(rounds)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return tuned, pd.concat(history, ignore_index=True)
+
+
+def format_history(history):
+    # Meilleur score de chaque tour, par famille
+    best = history.loc[history.groupby(["Model", "round"])["R2"].idxmax()]
+    table = best[["Model", "round", "budget", "R2"]].copy()
+    table["candidats"] = history.groupby(["Model", "round"]).size().to_numpy()
+    table["params"] = best["params"].astype(str)
+    table["R2"] = table["R2"].round(4)
+    return table.to_string(index=False)
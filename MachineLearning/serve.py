@@ -0,0 +1,245 @@
+# Serveur HTTP local de prédiction de Task_Success_Rate (asyncio, sans dépendance externe)
+# Le pipeline sauvegardé (artifact.py) est chargé une seule fois au démarrage.
+# Les requêtes simultanées sont regroupées en micro-lots : un seul pipeline.predict par lot,
+# lancé dès que max_batch lignes sont en attente ou après max_wait_ms.
+#
+#   POST /predict  corps JSON : une ligne {"Hours_Coding": 7, ...}, une liste de lignes,
+#                  ou {"rows": [...]}  ->  {"predictions": [...], "model_version": N}
+#   GET  /stats    compteurs : requêtes, lignes, lots, latence p50 / p99 (ms), débit (lignes/s)
+#   GET  /health
+#
+# Usage : python serve.py [--model models/model_v1.joblib] [--port 8765] [--max-batch 256] [--max-wait-ms 5]
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from artifact import load_artifact
+from predict import align
+
+MAX_BODY = 16 * 1024 * 1024
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large"}
+
+
+class Stats:
+    # Compteurs du serveur ; les latences gardées sont les `window` dernières requêtes
+    def __init__(self, window=10_000):
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.rows = 0
+        self.batches = 0
+        self.batch_rows = 0
+        self.latencies = deque(maxlen=window)
+
+    def record(self, rows, seconds):
+        self.requests += 1
+        self.rows += rows
+        self.latencies.append(seconds)
+
+    def snapshot(self):
+        uptime = time.perf_counter() - self.started
+        lat = np.array(self.latencies) * 1000
+        return {
+            "requests": self.requests,
+            "rows": self.rows,
+            "batches": self.batches,
+            "mean_batch_rows": self.batch_rows / self.batches if self.batches else 0.0,
+            "p50_ms": float(np.percentile(lat, 50)) if len(lat) else None,
+            "p99_ms": float(np.percentile(lat, 99)) if len(lat) else None,
+            "rows_per_s": self.rows / uptime if uptime > 0 else 0.0,
+            "requests_per_s": self.requests / uptime if uptime > 0 else 0.0,
+            "uptime_s": uptime,
+        }
+
+
+class MicroBatcher:
+    """Regroupe les lignes des requêtes en attente et les prédit en un seul appel."""
+
+    def __init__(self, pipeline, features, stats, max_batch=256, max_wait_ms=5.0):
+        self.pipeline = pipeline
+        self.features = features
+        self.stats = stats
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.queue = asyncio.Queue()
+
+    async def predict(self, rows):
+        # rows : sortie de parse_rows (colonnes déjà alignées et numériques)
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((rows, future))
+        return await future
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await self.queue.get()]
+            size = len(pending[0][0])
+            deadline = loop.time() + self.max_wait
+            while size < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                pending.append(item)
+                size += len(item[0])
+
+            batch = pd.concat([rows for rows, _ in pending], ignore_index=True)
+            try:
+                # predict dans un thread : la boucle continue d'accepter des requêtes pendant le calcul
+                predictions = await loop.run_in_executor(None, self.pipeline.predict, batch)
+            except Exception:
+                # Lot en échec : chaque requête est relancée seule, seule la fautive reçoit l'erreur
+                for rows, future in pending:
+                    try:
+                        result = await loop.run_in_executor(None, self.pipeline.predict, rows)
+                    except Exception as exc:
+                        if not future.done():
+                            future.set_exception(exc)
+                    else:
+                        if not future.done():
+                            future.set_result(result.tolist())
+                continue
+            self.stats.batches += 1
+            self.stats.batch_rows += size
+            start = 0
+            for rows, future in pending:
+                if not future.done():
+                    future.set_result(predictions[start:start + len(rows)].tolist())
+                start += len(rows)
+
+
+def parse_rows(body, features):
+    """
+    Corps JSON -> DataFrame alignée sur features, en float. Une valeur non numérique
+    lève ValueError (réponse 400) avant que la requête ne rejoigne un lot.
+    """
+    payload = json.loads(body)
+    if isinstance(payload, dict) and "rows" in payload:
+        payload = payload["rows"]
+    if isinstance(payload, dict):
+        payload = [payload]
+    if not isinstance(payload, list) or not payload or not all(isinstance(row, dict) for row in payload):
+        raise ValueError("le corps doit être une ligne JSON, une liste de lignes ou {\"rows\": [...]}")
+    rows = align(pd.DataFrame(payload), features)
+    for col in features:
+        values = pd.to_numeric(rows[col], errors="coerce")
+        bad = values.isna() & rows[col].notna()
+        if bad.any():
+            raise ValueError(f"{col} : valeur non numérique {rows[col][bad].iloc[0]!r} (ligne {bad.idxmax()})")
+        rows[col] = values.astype(float)
+    return rows
+
+
+class PredictionServer:
+
+    def __init__(self, pipeline, meta, max_batch=256, max_wait_ms=5.0):
+        self.meta = meta
+        self.stats = Stats()
+        self.batcher = MicroBatcher(pipeline, meta["features"], self.stats, max_batch, max_wait_ms)
+
+    async def handle(self, method, path, body):
+        if path == "/health":
+            return 200, {"status": "ok", "model_version": self.meta["version"]}
+        if path == "/stats":
+            return 200, self.stats.snapshot()
+        if path != "/predict":
+            return 404, {"error": f"chemin inconnu : {path}"}
+        if method != "POST":
+            return 405, {"error": "utiliser POST /predict"}
+        start = time.perf_counter()
+        try:
+            rows = parse_rows(body, self.meta["features"])
+        except ValueError as exc:
+            return 400, {"error": str(exc)}
+        predictions = await self.batcher.predict(rows)
+        self.stats.record(len(rows), time.perf_counter() - start)
+        return 200, {"predictions": predictions, "model_version": self.meta["version"]}
+
+    async def client(self, reader, writer):
+        # HTTP/1.1 minimal, avec keep-alive
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, path, _ = request_line.decode("latin1").split(" ", 2)
+                except ValueError:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                try:
+                    length = int(headers.get("content-length", 0))
+                except ValueError:
+                    length = None
+                if length is None or length < 0:
+                    # Corps de longueur inconnue : impossible de le sauter, la connexion est fermée
+                    status, payload = 400, {"error": "en-tête Content-Length invalide"}
+                    body = None
+                elif length > MAX_BODY:
+                    status, payload = 413, {"error": "corps trop grand"}
+                    body = None
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    try:
+                        status, payload = await self.handle(method, path.split("?", 1)[0], body)
+                    except Exception as exc:
+                        status, payload = 400, {"error": f"{type(exc).__name__}: {exc}"}
+
+                data = json.dumps(payload).encode()
+                keep_alive = headers.get("connection", "").lower() != "close" and body is not None
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                    f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(model_path=None, host="127.0.0.1", port=8765, max_batch=256, max_wait_ms=5.0):
+    pipeline, meta = load_artifact(model_path)
+    app = PredictionServer(pipeline, meta, max_batch, max_wait_ms)
+    batch_task = asyncio.create_task(app.batcher.run())
+    server = await asyncio.start_server(app.client, host, port)
+    print(f"Modèle v{meta['version']} ({meta['model']}) servi sur http://{host}:{port}/predict")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        batch_task.cancel()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serveur local de prédiction Task_Success_Rate")
+    parser.add_argument("--model", default=None, help="artefact .joblib (défaut : dernière version)")
+    parser.add_argument("--host", default="127.0.0.1", help="adresse d'écoute (locale par défaut)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-batch", type=int, default=256, help="lignes max par appel à predict")
+    parser.add_argument("--max-wait-ms", type=float, default=5.0, help="attente max pour remplir un lot")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.model, args.host, args.port, args.max_batch, args.max_wait_ms))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
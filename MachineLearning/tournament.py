@@ -0,0 +1,100 @@
+# Sélection de modèle par validation croisée k-fold, en parallèle
+# Le préprocessing (imputation + scaling) est entraîné une seule fois par fold, dans le processus
+# principal ; les matrices transformées sont envoyées une fois à chaque worker (initializer).
+# Chaque tâche du pool = un modèle sur un fold, donc le tournoi dure à peu près le temps
+# du modèle le plus lent (avec assez de workers).
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.model_selection import KFold
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from threadpoolctl import threadpool_limits
+
+from candidates import PreparedSplit, make_preprocess, wrap_regressor
+
+
+def fold_splits(X, y, n_splits=5, random_state=42):
+    """Préprocessing entraîné une fois par fold : liste de PreparedSplit."""
+    folds = []
+    for train_idx, test_idx in KFold(n_splits, shuffle=True, random_state=random_state).split(X):
+        folds.append(PreparedSplit(make_preprocess(X.columns.tolist()),
+                                   X.iloc[train_idx], y.iloc[train_idx], X.iloc[test_idx], y.iloc[test_idx]))
+    return folds
+
+
+# ---------- Workers ----------
+
+_folds = None
+
+
+def _init_worker(folds, single_thread=False):
+    global _folds
+    _folds = folds
+    if single_thread:
+        # OpenMP / BLAS à un thread (HistGradientBoosting, KNN, SVR...) : sans cela chaque
+        # worker lance un thread par cœur. n_jobs=1 ne limite que joblib, et OMP_NUM_THREADS
+        # est lu au chargement du runtime OpenMP, déjà fait dans un worker forké.
+        threadpool_limits(1)
+
+
+def _score(name, model, fold):
+    split = _folds[fold]
+    X_tr, X_te = split.arrays(name)
+    y_te = split.y_test
+    reg = clone(wrap_regressor(name, model))
+    t0 = time.perf_counter()
+    reg.fit(X_tr, split.y_train)
+    t1 = time.perf_counter()
+    y_pred = reg.predict(X_te)
+    t2 = time.perf_counter()
+    return {
+        "Model": name, "fold": fold,
+        "MAE": mean_absolute_error(y_te, y_pred),
+        "RMSE": np.sqrt(mean_squared_error(y_te, y_pred)),
+        "R2": r2_score(y_te, y_pred),
+        "fit_s": t1 - t0, "predict_s": t2 - t1,
+    }
+
+
+def run_tournament(X, y, models, n_splits=5, workers=None, random_state=42):
+    """
+    Évalue tous les modèles sur les mêmes folds.
+    Retourne (résumé par modèle trié par R2 moyen décroissant, scores par fold).
+    workers : taille du pool (défaut : nombre de CPU), 1 = dans le processus courant.
+    """
+    folds = fold_splits(X, y, n_splits, random_state)
+    tasks = [(name, model, fold) for name, model in models.items() for fold in range(n_splits)]
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        _init_worker(folds)
+        scores = [_score(*task) for task in tasks]
+    else:
+        # Un seul thread par modèle (n_jobs=1 et pools natifs, voir _init_worker) : le parallélisme vient du pool
+        tasks = [(name, clone(model).set_params(n_jobs=1) if "n_jobs" in model.get_params() else model, fold)
+                 for name, model, fold in tasks]
+        with ProcessPoolExecutor(min(workers, len(tasks)), initializer=_init_worker, initargs=(folds, True)) as pool:
+            scores = list(pool.map(_score, *zip(*tasks)))
+
+    scores = pd.DataFrame(scores)
+    summary = scores.groupby("Model").agg(
+        MAE=("MAE", "mean"), MAE_std=("MAE", "std"),
+        RMSE=("RMSE", "mean"), RMSE_std=("RMSE", "std"),
+        R2=("R2", "mean"), R2_std=("R2", "std"),
+        fit_s=("fit_s", "sum"), predict_s=("predict_s", "sum"),
+    ).sort_values(by="R2", ascending=False).reset_index()
+    return summary, scores
+
+
+def format_summary(summary):
+    # Tableau lisible : moyenne ± écart-type sur les folds, temps cumulés
+    table = pd.DataFrame({"Model": summary["Model"]})
+    for metric in ["MAE", "RMSE", "R2"]:
+        table[metric] = [f"{m:.3f} ± {s:.3f}" for m, s in zip(summary[metric], summary[f"{metric}_std"])]
+    table["fit (s)"] = summary["fit_s"].round(3)
+    table["predict (s)"] = summary["predict_s"].round(3)
+    return table.to_string(index=False)
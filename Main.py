@@ -1,18 +1,125 @@
 import pandas as pd
-import matplotlib.pyplot as plt
 import numpy as np
 import os
 
+from schema import NUMERIC_COLS, CLIP_LOWER, CLIP_UPPER
+import analyses
+import binning
+from cache import AggregationCache
+import cleaning
+from correlation import CorrelationAccumulator
+from compact import format_report, optimize_dtypes, read_compact
+from filters import RowFilter
+import frame_cache
+import output
+import profiling
+from profiling import profiled
+import rendering
+import streaming
+
 class Data():
     
-    def __init__(self, path): 
+    @profiled("load")
+    def __init__(self, path, chunksize=None, cache=False, compact=False, fused=False, sketch_eps=None): 
         # C'est le path du CSV
         self.path = path
-        # L'importation du csv --> self.df = DATAFRAME
-        self.df = pd.read_csv(self.path)
+        # chunksize : nombre de lignes par morceau en mode streaming (None = tout en mémoire)
+        self.chunksize = chunksize
+        # sketch_eps : en streaming, quantiles approchés par sketches KLL (None = exacts)
+        self.sketch_eps = sketch_eps
+        # Résultats du passage streaming par (clean, sketch_eps), calculés à la demande
+        self.stream_results = {}
+        # Cache des groupby / médianes partagé par G1 à G8 et filtering
+        self.cache = AggregationCache()
+        # cache=True : la version nettoyée est gardée sur disque à côté du CSV (voir frame_cache.py)
+        self.use_disk_cache = cache
+        # True si self.df vient du cache disque (donc déjà nettoyée)
+        self.from_disk_cache = False
+        # compact=True : dtypes réduits (int8/int16/float32, catégorielles), voir compact.py
+        self.compact = compact
+        # fused : nettoyage par défaut de clean_data, et donc entrée du cache disque à relire
+        self.fused = fused
+        if chunksize is None:
+            cached = frame_cache.load(self.path, self.clean_params(fused)) if cache else None
+            if cached is not None:
+                # Pas de parsing CSV : colonnes mappées en mémoire depuis le cache
+                self.df = cached
+                self.from_disk_cache = True
+            else:
+                self.read_source()
+        else:
+            # Mode streaming : le CSV n'est jamais chargé en entier
+            self.df = None
+
+    def read_source(self):
+        if self.compact:
+            # Lecture par chunks, chaque chunk est compacté avant d'être gardé
+            self.df, before, after = read_compact(self.path)
+            print(format_report(before, after))
+        else:
+            # L'importation du csv --> self.df = DATAFRAME
+            self.df = pd.read_csv(self.path)
+        self.from_disk_cache = False
+
+    def clean_params(self, fused=False):
+        # Paramètres de nettoyage qui font partie de la clé du cache disque
+        # (compact et fused changent les dtypes de la version nettoyée)
+        return {"numeric_cols": NUMERIC_COLS, "clip": [CLIP_LOWER, CLIP_UPPER],
+                "compact": self.compact, "fused": fused}
+
+    @property
+    def df(self):
+        return self._df
+
+    @df.setter
+    def df(self, value):
+        # Nouvelle DataFrame : toutes les agrégations en cache sont obsolètes
+        self._df = value
+        # Colonnes dérivées (Sleep_Group, High_Stress, ...) à recréer, voir analyses.derive
+        self.derived = {}
+        if hasattr(self, "cache"):
+            self.cache.invalidate()
+
+    def grouped(self, keys, values, agg="mean", **kwargs):
+        """
+        df.groupby(keys, **kwargs)[values].agg(agg) mémoïsé (voir cache.AggregationCache).
+        Le résultat est partagé avec le cache : ne pas le modifier en place.
+        """
+        return self.cache.groupby(self.df, keys, values, agg, **kwargs)
+
+    def stat(self, col, how):
+        # Médiane / moyenne d'une colonne, mémoïsée tant que la colonne ne change pas
+        return self.cache.stat(self.df[col], how)
 
+    @profiled()
+    def stream_analysis(self, clean=True, sketch_eps=None):
+        """
+        Mode streaming : lit le CSV par chunks de self.chunksize lignes et calcule
+        les statistiques de summarize_data, de clean_data, les moyennes G1 à G8
+        et la matrice de corrélation avec des agrégats partiels fusionnables.
+
+        sketch_eps : quantiles (bornes 1 % / 99 %, médianes) approximés par des
+        sketches KLL d'erreur de rang sketch_eps au lieu d'un comptage exact
+        (None = valeur donnée à Data(..., sketch_eps=...)).
+
+        Retourne (accumulateur, statistiques de nettoyage) ; voir streaming.stream_csv.
+        Un seul passage sur le CSV par combinaison (clean, sketch_eps).
+        """
+        if sketch_eps is None:
+            sketch_eps = self.sketch_eps
+        key = (clean, sketch_eps)
+        if key not in self.stream_results:
+            self.stream_results[key] = streaming.stream_csv(self.path, self.chunksize, clean=clean, sketch_eps=sketch_eps)
+        return self.stream_results[key]
+
+    @profiled()
     def inspect_data(self):
-        df=self.df
+        if self.df is None:
+            # Mode streaming : on n'inspecte que le premier chunk
+            df = next(pd.read_csv(self.path, chunksize=self.chunksize))
+            print(f"(streaming : aperçu du premier chunk de {len(df)} lignes)")
+        else:
+            df=self.df
         # Afficher les 10 premières lignes
         print("First 10 rows:")
         print(df.head(10))
@@ -33,23 +140,54 @@ class Data():
         print("\nMissing values per column:")
         print(df.isna().sum())
 
+    @profiled()
     def summarize_data(self):
         df=self.df
         # Statistiques descriptives de toutes les colonnes numériques
         print("Basic statistics for numerical columns:")
+        if df is None:
+            # Mode streaming : même tableau sur les valeurs brutes, calculé par agrégats partiels
+            print(streaming.describe_csv(self.path, self.chunksize, self.sketch_eps))
+            return
         print(df.describe())   # count, mean, std, min, 25%, 50%, 75%, max
 
-    def clean_data(self):
+    @profiled()
+    def clean_data(self, fused=None):
+        """
+        Nettoie les colonnes numériques (conversion, négatifs, NaN, outliers)
+        puis supprime les doublons.
+
+        fused=True : étapes 2 à 5 en un seul passage sur une matrice float64
+        (voir cleaning.fused_clean) ; les colonnes nettoyées sont alors toutes en float64.
+        fused=None : valeur donnée à Data(..., fused=...).
+        """
+        if fused is None:
+            fused = self.fused
+        if self.from_disk_cache and fused != self.fused:
+            # Le cache relu vient de l'autre nettoyage : on repart du CSV
+            self.read_source()
         df=self.df
 
+        if df is None:
+            # Mode streaming : impossible de retourner la dataframe nettoyée entière,
+            # on retourne les statistiques de nettoyage (NaN, moyenne, q01, q99 par colonne)
+            _, stats = self.stream_analysis()
+            return stats
+
+        if self.from_disk_cache:
+            # Déjà nettoyée lors d'un lancement précédent : il ne reste que les doublons
+            return df.drop_duplicates().reset_index(drop=True)
+
         # 1. Définir les colonnes numériques 
-        numeric_cols = [
-            'Hours_Coding', 'Lines_of_Code', 'Bugs_Found', 
-            'Bugs_Fixed', 'AI_Usage_Hours', 'Sleep_Hours', 
-            'Cognitive_Load', 'Task_Success_Rate', 'Coffee_Intake', 
-            'Stress_Level', 'Task_Duration_Hours', 'Commits',
-            'Errors'
-        ]
+        numeric_cols = NUMERIC_COLS
+
+        if fused:
+            # 2 à 5. Conversion, négatifs, NaN et outliers en un seul passage
+            cleaning.fused_clean(df, numeric_cols)
+            self.compact_cleaned()
+            self.cache.invalidate()
+            self.store_disk_cache(fused)
+            return df.drop_duplicates().reset_index(drop=True)
 
         cols = df.columns
 
@@ -89,6 +227,11 @@ class Data():
                 # on remplace les valeurs extrêmes par les percentiles
                 df[col] = df[col].clip(lower=q1, upper=q99)
 
+        # Les colonnes ont été modifiées (en partie en place) : on vide le cache
+        self.compact_cleaned()
+        self.cache.invalidate()
+        self.store_disk_cache(fused)
+
         # 6. Supprimer les doublons
         df = df.drop_duplicates()
 
@@ -96,661 +239,71 @@ class Data():
         df = df.reset_index(drop=True)
         return df
     
-    def grouping_visualization(self):
+    def compact_cleaned(self):
+        # Le nettoyage repasse les colonnes en float64 : on les recompacte
+        if self.compact:
+            before, after = optimize_dtypes(self.df)
+            print(format_report(before, after))
+
+    def store_disk_cache(self, fused=False):
+        # Enregistre la version nettoyée (avant suppression des doublons, comme self.df)
+        if self.use_disk_cache:
+            frame_cache.store(self.path, self.df, self.clean_params(fused))
+
+    @profiled()
+    def grouping_visualization(self, show=True, workers=None, names=None):
         """
         Effectue les groupements (G1 à G8) et les visualisations associées
         pour analyser l’impact du stress, du sommeil, des heures de code,
         de l’usage de l’IA et de la consommation de café sur la performance.
+        names : sous-ensemble à lancer, par ex. ["G1", "G6"] (None = tous).
+        Retourne les tableaux de moyennes, par nom de groupement.
+
+        show=True  : chaque figure est enregistrée puis affichée (plt.show()).
+        show=False : mode sans affichage, les figures sont décrites pendant les
+                     groupements puis rastérisées en parallèle (backend Agg)
+                     par `workers` processus (None = tous les cœurs).
         """
 
         df = self.df  
 
+        if df is None:
+            # Mode streaming : on affiche les moyennes G1 à G8 (pas de figures)
+            acc, _ = self.stream_analysis()
+            for name in streaming.GROUP_SPECS:
+                print(f"\n{name} – mean stats :")
+                print(acc.group_means(name))
+            return
+
         # Dossier de sortie pour enregistrer toutes les figures
         fig_dir = "figures"
         # Crée le dossier s'il n'existe pas
         os.makedirs(fig_dir, exist_ok=True)
 
-        # G1: Groupement par High_Stress → Stress & Succès
-        
-        print("\nGroup by High_Stress → Stress & Success\n")
-
-        # Colonne High_Stress (True si stress > 70)
-        df["High_Stress"] = df["Stress_Level"] > 70
-
-        # Moyennes par High_Stress
-        g1_group = df.groupby("High_Stress")[[
-            "Task_Success_Rate",
-            "Sleep_Hours",
-            "Hours_Coding",
-            "AI_Usage_Hours"
-        ]].mean().round(2)
-
-        
-        print("Mean stats by High_Stress (False = low/medium, True = high) :")
-        print(g1_group)
-
-        # Histogramme global du stress 
-
-        plt.figure(figsize=(10, 6)) #figure de 10x6 pouces
-        plt.hist( #construire un histogramme
-            df["Stress_Level"],#données à représenter
-            bins=20,#nb d'intervalles(barres)
-            edgecolor="black",#couleur des bordures des barres
-            alpha=0.75 #transparence des barres
-        )
-
-        #ligne verticale lorsque le stress est plus que 70
-        plt.axvline(
-            70,
-            color="red",
-            linestyle="--",
-            linewidth=2,
-            label="High Stress Threshold = 70"
-        )
-
-        plt.title("Distribution of Stress Level with High Stress Threshold")
-        plt.xlabel("Stress Level")
-        plt.ylabel("Number of Developers")
-        #grid horizontale
-        plt.grid(axis="y", linestyle="--", alpha=0.6)
-        # légende pour la ligne rouge 
-        plt.legend()
-        #sauvegarder la figure dans le dossier fig_dir(figures) 
-        #dpi  résolution de l'image
-        #bbox_inches permet de minimiser l'espace blanc inutile autour de la figure sauvegardée
-        #tight ajuste automatiquement les marges pour que tout le contenu soit visible
-        plt.savefig(os.path.join(fig_dir, "G1_stress_distribution.png"), dpi=300, bbox_inches="tight")
-        # afficher la figure
-        plt.show()
-
-        # Moyenne Task_Success_Rate par High_Stress
-        Stress_Succes = df.groupby("High_Stress")["Task_Success_Rate"].mean()
-
-        plt.figure(figsize=(7, 5))#figure de 7x5 pouces
-        # tracer un diagramme en barres(bar chart)
-        ax = Stress_Succes.plot( 
-            kind="bar",
-            edgecolor="black",
-            alpha=0.8
-        )
-        plt.title("Mean Task Success Rate by Stress Level")
-        plt.xlabel("High Stress (False = Low/Medium, True = High)")
-        plt.ylabel("Mean Task Success Rate")
-        plt.xticks(rotation=0)
-        plt.grid(axis="y", linestyle="--", alpha=0.6)
-
-        # valeurs au-dessus des barres
-        # Pour chaque barre dans le graphique (chaque rectangle de l'histogramme)
-        for p in ax.patches: #ax.patches contient toutes les barres du graphique
-            # Récupérer la hauteur de la barre 
-            max = p.get_height()
-            # Ajouter le nombre au-dessus de la barre
-            ax.annotate(
-                f"{max:.1f}",  # texte affiché : la hauteur avec 1 chiffre après la virgule
-                (                 # position du texte :
-                    p.get_x() + p.get_width() / 2,  # x = centre de la barre
-                    max                          # y = la hauteur de la barre
-                ),
-                ha="center",      # alignement horizontal du texte : centré
-                va="bottom",      # alignement vertical : le texte commence au dessus de la barre
-                fontsize=9        # taille du texte
-            )
-        #sauvegarder la figure dans le dossier fig_dir(figures)
-        #dpi  résolution de l'image
-        #bbox_inches permet de minimiser l'espace blanc inutile autour de la figure sauvegardée
-        #tight ajuste automatiquement les marges pour que tout le contenu soit visible
-        plt.savefig(os.path.join(fig_dir, "G1_success_by_stress.png"), dpi=300, bbox_inches="tight")
-        plt.show()
-
-        # G2:Groupement par Sleep_Group → Sommeil, Stress & Succès 
-        
-        print("\nGroup by Sleep_Group → Sleep, Stress & Success \n")
-
-        # Ajouter la Colonne Sleep_Group : <5h, 5–7h, >7h au dataframe
-        def sleep_group(hours):
-            # Regroupe les heures de sommeil en 3 catégories.
-            if hours < 5:
-                return "<5h"
-            elif hours <= 7:
-                return "5–7h"
-            else:
-                return ">7h"
-        # Appliquer la fonction sleep_group à la colonne Sleep_Hours
-        df['Sleep_Group'] = df['Sleep_Hours'].apply(sleep_group)
-    
+        # Figures à rendre (specs, voir rendering.py)
+        specs = []
 
-        g2_group = df.groupby("Sleep_Group", observed=False)[[
-            "Stress_Level",
-            "Task_Success_Rate",
-            "Errors"
-        ]].mean().round(2)
-
-        print("Mean stats by Sleep_Group :")
-        print(g2_group)
-
-        # Histogramme Task_Success_Rate 
-        plt.figure(figsize=(10, 6))
-        plt.hist( #construire un histogramme
-            df["Task_Success_Rate"],
-            bins=20,
-            edgecolor="black",
-            alpha=0.8
-        )
-
-        plt.title("Distribution of Task Success Rate")
-        plt.xlabel("Task Success Rate")
-        plt.ylabel("Number of Developers")
-        plt.grid(axis="y", linestyle="--", alpha=0.6)
-        #dpi  résolution de l'image
-        #bbox_inches permet de minimiser l'espace blanc inutile autour de la figure sauvegardée
-        #tight ajuste automatiquement les marges pour que tout le contenu soit visible
-        plt.savefig(os.path.join(fig_dir, "G2_success_distribution.png"), dpi=300, bbox_inches="tight")
-        plt.show()
-
-        # Moyenne Stress_Level par Sleep_Group
-        Stress_Sleep = df.groupby("Sleep_Group", observed=False)["Stress_Level"].mean()
-
-        plt.figure(figsize=(8, 5))
-        ax1 = Stress_Sleep.plot(
-            kind="bar",
-            edgecolor="black",
-            alpha=0.85
-        )
-        plt.title("Mean Stress Level by Sleep Group")
-        plt.xlabel("Sleep Group")
-        plt.ylabel("Mean Stress Level")
-        plt.xticks(rotation=0)
-        plt.grid(axis="y", linestyle="--", alpha=0.6)
-
-        # Pour chaque barre dans le graphique 
-        for p in ax1.patches: #ax.patches contient toutes les barres du graphique
-            # Récupérer la hauteur de la barre 
-            max = p.get_height()
-            # Ajouter le nombre au-dessus de la barre
-            ax1.annotate(
-                f"{max:.1f}",  # texte affiché : la hauteur avec 1 chiffre après la virgule
-                (                 # position du texte :
-                    p.get_x() + p.get_width() / 2,  # x = centre de la barre
-                    max                          # y = juste à la hauteur de la barre
-                ),
-                ha="center",      # alignement horizontal du texte : centré
-                va="bottom",      # alignement vertical : le texte commence au dessus de la barre
-                fontsize=9        # taille du texte
-            )
-        #sauvegarder la figure dans le dossier fig_dir(figures)
-        #dpi  résolution de l'image
-        #bbox_inches permet de minimiser l'espace blanc inutile autour de la figure sauvegardée
-        #tight ajuste automatiquement les marges pour que tout le contenu soit visible
-        plt.savefig(os.path.join(fig_dir, "G2_stress_by_sleep.png"), dpi=300, bbox_inches="tight")
-        plt.show()
-
-        #V5 :Moyenne Task_Success_Rate par Sleep_Group
-        Succes_Sleep = df.groupby("Sleep_Group", observed=False)["Task_Success_Rate"].mean()
-
-        plt.figure(figsize=(8, 5))
-        ax2 = Succes_Sleep.plot(
-            kind="bar",
-            edgecolor="black",
-            alpha=0.85
-        )
-        plt.title("Mean Task Success Rate by Sleep Group")
-        plt.xlabel("Sleep Group")
-        plt.ylabel("Mean Task Success Rate")
-        plt.xticks(rotation=0)
-        plt.grid(axis="y", linestyle="--", alpha=0.6)
-
-        # valeurs au-dessus des barres
-        # Pour chaque barre dans le graphique (chaque rectangle de l'histogramme)
-        for p in ax2.patches: #ax.patches contient toutes les barres du graphique
-            # Récupérer la hauteur de la barre 
-            max = p.get_height()
-            # Ajouter le nombre au-dessus de la barre
-            ax2.annotate(
-                f"{max:.1f}",  # texte affiché : la hauteur avec 1 chiffre après la virgule
-                    (   # position du texte :
-                    p.get_x() + p.get_width() / 2,  # x = centre de la barre
-                    max                             # y = la hauteur de la barre
-                        ),
-                        ha="center",      # alignement horizontal du texte : centré
-                        va="bottom",      # alignement vertical : le texte commence au dessus de la barre
-                        fontsize=9        # taille du texte
-                    )
-        #sauvegarder la figure dans le dossier fig_dir(figures)
-        #dpi  résolution de l'image
-        #bbox_inches permet de minimiser l'espace blanc inutile autour de la figure sauvegardée
-        #tight ajuste automatiquement les marges pour que tout le contenu soit visible
-        plt.savefig(os.path.join(fig_dir, "G2_success_by_sleep.png"), dpi=300, bbox_inches="tight")
-        plt.show()
-
-        
-        # G3 :Groupement  Coding_Hours → Heures de code, Stress, Succès
-        
-        print("\nGroupement  Coding_Hours → Heures de code, Stress, Succès\n")
-
-        def coding_group(hours):
-            # Regroupe les heures de code en 3 catégories.
-            if hours < 4:
-                return "0–4h"
-            elif hours <= 8:
-                return "4–8h"
+        def figure(spec):
+            # En mode interactif on dessine tout de suite, sinon on garde la spec pour le pool
+            if show:
+                rendering.render_spec(spec, fig_dir, show=True)
             else:
-                return ">8h"
-
-        df["Coding_Hours_Group"] = df["Hours_Coding"].apply(coding_group)
-
-        g3_group = df.groupby("Coding_Hours_Group")[[
-            "Task_Success_Rate",
-            "Stress_Level",
-            "Errors"
-        ]].mean().round(2)
-
-        print("Mean stats by Coding_Hours_Group :")
-        print(g3_group)
-
-        # --- Stress moyen vs heures de code ---
-        plt.figure(figsize=(8, 5))
-        ax1 = g3_group["Stress_Level"].plot(
-            kind="bar",
-            edgecolor="black",
-            alpha=0.85
-        )
-        plt.title("Mean Stress Level by Coding Hours Group")
-        plt.xlabel("Coding Hours Group")
-        plt.ylabel("Mean Stress Level")
-        plt.xticks(rotation=0)
-        plt.grid(axis="y", linestyle="--", alpha=0.6)
-
-        for p in ax1.patches:
-            height = p.get_height()
-            ax1.annotate(
-                f"{height:.1f}",
-                (p.get_x() + p.get_width() / 2, height),
-                ha="center",
-                va="bottom",
-                fontsize=9
-            )
-
-        #dpi  résolution de l'image
-        #bbox_inches permet de minimiser l'espace blanc inutile autour de la figure sauvegardée
-        #tight ajuste automatiquement les marges pour que tout le contenu soit visible
-        plt.savefig(os.path.join(fig_dir, "G3_stress_by_coding.png"), dpi=300, bbox_inches="tight")
-        plt.show()
-
-        # Task_Success_Rate vs Coding Hours  
-        plt.figure(figsize=(8, 5))
-        ax2 = g3_group["Task_Success_Rate"].plot(
-            kind="bar",
-            edgecolor="black",
-            alpha=0.85
-        )
-        plt.title("Mean Task Success Rate by Coding Hours Group")
-        plt.xlabel("Coding Hours Group")
-        plt.ylabel("Mean Task Success Rate")
-        plt.xticks(rotation=0)
-        plt.grid(axis="y", linestyle="--", alpha=0.6)
-
-        # valeurs au-dessus des barres
-        # Pour chaque barre dans le graphique (chaque rectangle de l'histogramme)
-        for p in ax2.patches: #ax.patches contient toutes les barres du graphique
-            # Récupérer la hauteur de la barre 
-            max = p.get_height()
-            # Ajouter le nombre au-dessus de la barre
-            ax2.annotate(
-                f"{max:.1f}",  # texte affiché : la hauteur avec 1 chiffre après la virgule
-                    (   # position du texte :
-                    p.get_x() + p.get_width() / 2,  # x = centre de la barre
-                    max                             # y = la hauteur de la barre
-                        ),
-                        ha="center",      # alignement horizontal du texte : centré
-                        va="bottom",      # alignement vertical : le texte commence au dessus de la barre
-                        fontsize=9        # taille du texte
-                    )
-
-        #dpi  résolution de l'image
-        #bbox_inches permet de minimiser l'espace blanc inutile autour de la figure sauvegardée
-        #tight ajuste automatiquement les marges pour que tout le contenu soit visible
-        plt.savefig(os.path.join(fig_dir, "G3_success_by_coding.png"), dpi=300, bbox_inches="tight")
-        plt.show()
-
-        
-        # G4:Groupement par  High_AI_Usage → IA, Erreurs & Succès 
-        
-        print("\n Group by High_AI_Usage → AI, Errors & Success\n")
-
-        median_ai = df["AI_Usage_Hours"].median()
-        df["High_AI_Usage"] = df["AI_Usage_Hours"].apply(
-            lambda x: "High_AI_Usage" if x >= median_ai else "Low_AI_Usage"
-        )
-
-        g4_group = df.groupby("High_AI_Usage")[[
-            "Errors",
-            "Task_Success_Rate",
-            "Stress_Level"
-        ]].mean().round(2)
-
-        print("Mean stats by High_AI_Usage :")
-        print(g4_group)
-
-        # --- Erreurs moyennes vs IA ---
-        plt.figure(figsize=(8, 5))
-        ax1 = g4_group["Errors"].plot(
-            kind="bar",
-            edgecolor="black",
-            alpha=0.85
-        )
-        plt.title("Mean Errors by AI Usage")
-        plt.xlabel("AI Usage Group")
-        plt.ylabel("Mean Errors")
-        plt.xticks(rotation=0)
-        plt.grid(axis="y", linestyle="--", alpha=0.6)
-
-        for p in ax1.patches:
-            height = p.get_height()
-            ax1.annotate(
-                f"{height:.2f}",
-                (p.get_x() + p.get_width() / 2, height),
-                ha="center",
-                va="bottom",
-                fontsize=9
-            )
-
-        
-        plt.savefig(os.path.join(fig_dir, "G4_errors_by_ai.png"), dpi=300, bbox_inches="tight")
-        plt.show()
-
-        # --- Taux de succès moyen vs IA ---
-        plt.figure(figsize=(8, 5))
-        ax2 = g4_group["Task_Success_Rate"].plot(
-            kind="bar",
-            edgecolor="black",
-            alpha=0.85
-        )
-        plt.title("Mean Task Success Rate by AI Usage")
-        plt.xlabel("AI Usage Group")
-        plt.ylabel("Mean Task Success Rate")
-        plt.xticks(rotation=0)
-        plt.grid(axis="y", linestyle="--", alpha=0.6)
-
-        for p in ax2.patches:
-            height = p.get_height()
-            ax2.annotate(
-                f"{height:.2f}",
-                (p.get_x() + p.get_width() / 2, height),
-                ha="center",
-                va="bottom",
-                fontsize=9
-            )
-
-        #dpi  résolution de l'image
-        #bbox_inches permet de minimiser l'espace blanc inutile autour de la figure sauvegardée
-        #tight ajuste automatiquement les marges pour que tout le contenu soit visible
-        plt.savefig(os.path.join(fig_dir, "G4_success_by_ai.png"), dpi=300, bbox_inches="tight")
-        plt.show()
-
-        
-        # G5 : Groupement High_Coffee → Café, Stress & Succès 
-        
-        print("\nGroup by High_Coffee → Coffee, Stress & Success\n")
-
-        med = df["Coffee_Intake"].median()
-        df["High_Coffee"] = df["Coffee_Intake"].apply(
-            lambda x: "High_Coffee" if x >= med else "Low_Coffee"
-        )
-
-        g5_group = df.groupby("High_Coffee")[["Stress_Level", "Task_Success_Rate"]].mean().round(2)
-
-        print(f"Median Coffee_Intake = {med:.2f}")
-        print("\nMean stats by High_Coffee :")
-        print(g5_group)
-
-        # Stress moyen par groupe de café
-        plt.figure(figsize=(8, 5))
-        ax1 = g5_group["Stress_Level"].plot(
-            kind="bar",
-            edgecolor="black",
-            alpha=0.85
-        )
-        plt.title("Mean Stress Level by Coffee Intake Group")
-        plt.xlabel("Coffee Group (Low vs High)")
-        plt.ylabel("Mean Stress Level")
-        plt.xticks(rotation=0)
-        plt.grid(axis="y", linestyle="--", alpha=0.6)
-
-        # valeurs au-dessus des barres
-        # Pour chaque barre dans le graphique (chaque rectangle de l'histogramme)
-        for p in ax1.patches: #ax.patches contient toutes les barres du graphique
-            # Récupérer la hauteur de la barre 
-            max = p.get_height()
-            # Ajouter le nombre au-dessus de la barre
-            ax1.annotate(
-                f"{max:.1f}",  # texte affiché : la hauteur avec 1 chiffre après la virgule
-                    (   # position du texte :
-                    p.get_x() + p.get_width() / 2,  # x = centre de la barre
-                    max                             # y = la hauteur de la barre
-                        ),
-                        ha="center",      # alignement horizontal du texte : centré
-                        va="bottom",      # alignement vertical : le texte commence au dessus de la barre
-                        fontsize=9        # taille du texte
-                    )
-
-        #dpi  résolution de l'image
-        #bbox_inches permet de minimiser l'espace blanc inutile autour de la figure sauvegardée
-        #tight ajuste automatiquement les marges pour que tout le contenu soit visible
-        plt.savefig(os.path.join(fig_dir, "G5_stress_by_coffee.png"), dpi=300, bbox_inches="tight")
-        plt.show()
-
-        # Succès moyen par groupe de café
-        plt.figure(figsize=(8, 5))
-        ax2 = g5_group["Task_Success_Rate"].plot(
-            kind="bar",
-            edgecolor="black",
-            alpha=0.85
-        )
-        plt.title("Mean Task Success Rate by Coffee Intake Group")
-        plt.xlabel("Coffee Group (Low vs High)")
-        plt.ylabel("Mean Task Success Rate")
-        plt.xticks(rotation=0)
-        plt.grid(axis="y", linestyle="--", alpha=0.6)
-
-        # valeurs au-dessus des barres
-        # Pour chaque barre dans le graphique (chaque rectangle de l'histogramme)
-        for p in ax2.patches: #ax.patches contient toutes les barres du graphique
-            # Récupérer la hauteur de la barre 
-            max = p.get_height()
-            # Ajouter le nombre au-dessus de la barre
-            ax2.annotate(
-                f"{max:.1f}",  # texte affiché : la hauteur avec 1 chiffre après la virgule
-                    (   # position du texte :
-                    p.get_x() + p.get_width() / 2,  # x = centre de la barre
-                    max                             # y = la hauteur de la barre
-                        ),
-                        ha="center",      # alignement horizontal du texte : centré
-                        va="bottom",      # alignement vertical : le texte commence au dessus de la barre
-                        fontsize=9        # taille du texte
-                    )
-
-        
-        #dpi  résolution de l'image
-        #bbox_inches permet de minimiser l'espace blanc inutile autour de la figure sauvegardée
-        #tight ajuste automatiquement les marges pour que tout le contenu soit visible
-
-        plt.savefig(os.path.join(fig_dir, "G5_success_by_coffee.png"), dpi=300, bbox_inches="tight")
-        plt.show()
-
-        # G6 : Groupement Sleep_Group × High_Stress → Profils combinés 
-        print("\nSleep_Group × High_Stress → Sleep + Stress Profiles\n")
-
-        stress_threshold = df["Stress_Level"].mean()
-        df["High_Stress"] = df["Stress_Level"] > stress_threshold
-        #  Créer un tableau récapitulatif des moyennes
-        sleep_stress_summary = (df.groupby(["Sleep_Group", "High_Stress"])[["Task_Success_Rate", "Errors"]].mean().round(2))
-
-
-        print("Moyenne Task_Success_Rate & Errors by Sleep_Group × High_Stress :")
-        print(sleep_stress_summary)
-        # Tableau croisé dynamique pour Task_Success_Rate
-        pivot_success = df.pivot_table(
-            values="Task_Success_Rate",
-            index="High_Stress",
-            columns="Sleep_Group",
-            aggfunc="mean"
-        ).round(2)
-
-        print("\nPivot – Mean Task_Success_Rate by Sleep_Group & High_Stress :")
-        print(pivot_success)
-
-        fig, ax = plt.subplots(figsize=(8, 5))
-        pivot_success.plot(
-            kind="bar",
-            edgecolor="black",
-            alpha=0.85,
-            ax=ax
-        )
-        ax.set_title("Mean Task Success Rate by Sleep Group and Stress Level")
-        ax.set_xlabel("High Stress (False = Low/Normal, True = High)")
-        ax.set_ylabel("Mean Task Success Rate")
-        ax.set_xticklabels(ax.get_xticklabels(), rotation=0)
-        ax.legend(title="Sleep Group")
-        ax.grid(axis="y", linestyle="--", alpha=0.6)
-
-        # valeurs au-dessus des barres
-        # Pour chaque barre dans le graphique (chaque rectangle de l'histogramme)
-        for p in ax.patches: #ax.patches contient toutes les barres du graphique
-            # Récupérer la hauteur de la barre 
-            max = p.get_height()
-            # Ajouter le nombre au-dessus de la barre
-            ax.annotate(
-                f"{max:.1f}",  # texte affiché : la hauteur avec 1 chiffre après la virgule
-                    (   # position du texte :
-                    p.get_x() + p.get_width() / 2,  # x = centre de la barre
-                    max                             # y = la hauteur de la barre
-                        ),
-                        ha="center",      # alignement horizontal du texte : centré
-                        va="bottom",      # alignement vertical : le texte commence au dessus de la barre
-                        fontsize=9        # taille du texte
-                    )
-
-        #dpi  résolution de l'image
-        #bbox_inches permet de minimiser l'espace blanc inutile autour de la figure sauvegardée
-        #tight ajuste automatiquement les marges pour que tout le contenu soit visible
-        plt.savefig(os.path.join(fig_dir, "G6_success_sleep_stress.png"), dpi=300, bbox_inches="tight")
-        plt.show()
-
-       
-        # G7 : Groupement  High_AI_Usage × High_Stress → IA + Stress 
-        
-        print("\nHigh_AI_Usage × High_Stress → AI + Stress \n")
-
-        ai_threshold = df["AI_Usage_Hours"].mean()
-        df["High_AI_Usage_Bool"] = df["AI_Usage_Hours"] > ai_threshold  # booléen
-
-        ai_stress_summary = (df.groupby(["High_AI_Usage_Bool", "High_Stress"])[[ "Errors","Task_Success_Rate"]].mean().round(2))
-
-        print("Mean Errors & Success by High_AI_Usage × High_Stress :")
-        print(ai_stress_summary)
-
-        pivot_errors = df.pivot_table(
-            values="Errors",
-            index="High_Stress",
-            columns="High_AI_Usage_Bool",
-            aggfunc="mean"
-        ).round(2)
-
-        print("\nPivot – Mean Errors by High_AI_Usage & High_Stress :")
-        print(pivot_errors)
-
-        fig, ax2 = plt.subplots(figsize=(8, 5))
-        pivot_errors.plot(
-            kind="bar",
-            edgecolor="black",
-            alpha=0.85,
-            ax=ax2
-        )
-        ax2.set_title("Mean Errors by AI Usage and Stress Level")
-        ax2.set_xlabel("High Stress (False = Low/Normal, True = High)")
-        ax2.set_ylabel("Mean Errors")
-        ax2.set_xticklabels(ax2.get_xticklabels(), rotation=0)
-        ax2.legend(title="High AI Usage (False/True)")
-        ax2.grid(axis="y", linestyle="--", alpha=0.6)
-
-        # valeurs au-dessus des barres
-        # Pour chaque barre dans le graphique (chaque rectangle de l'histogramme)
-        for p in ax2.patches: #ax.patches contient toutes les barres du graphique
-            # Récupérer la hauteur de la barre 
-            max = p.get_height()
-            # Ajouter le nombre au-dessus de la barre
-            ax2.annotate(
-                f"{max:.1f}",  # texte affiché : la hauteur avec 1 chiffre après la virgule
-                    (   # position du texte :
-                    p.get_x() + p.get_width() / 2,  # x = centre de la barre
-                    max                             # y = la hauteur de la barre
-                        ),
-                        ha="center",      # alignement horizontal du texte : centré
-                        va="bottom",      # alignement vertical : le texte commence au dessus de la barre
-                        fontsize=9        # taille du texte
-                    )
-
-        
-        plt.savefig(os.path.join(fig_dir, "G7_errors_ai_stress.png"), dpi=300, bbox_inches="tight")
-        plt.show()
-
-        
-        # G8 : Groupement Coding_Hours_Group × High_Success → Profil final 
-       
-        print("\n==== G8 – Coding_Hours_Group × High_Success → Coding + Success Profiles ====\n")
-
-        success_median = df["Task_Success_Rate"].median()
-        df["High_Success"] = df["Task_Success_Rate"] >= success_median
-
-        g8_summary = df.groupby(
-            ["Coding_Hours_Group", "High_Success"]
-        )[["Cognitive_Load", "Bugs_Found"]].mean().round(2)
-
-        print("Mean Cognitive_Load & Bugs_Found by Coding_Hours_Group × High_Success :")
-        print(g8_summary)
-
-        g8_pivot = g8_summary.reset_index().pivot(
-            index="Coding_Hours_Group",
-            columns="High_Success",
-            values="Cognitive_Load"
-        )
-
-        fig, ax = plt.subplots(figsize=(8, 5))
-        g8_pivot.plot(
-            kind="bar",
-            edgecolor="black",
-            alpha=0.85,
-            ax=ax
-        )
-        ax.set_title("Average Cognitive Load by Coding Hours and Success")
-        ax.set_xlabel("Coding Hours Group")
-        ax.set_ylabel("Average Cognitive Load")
-        ax.set_xticklabels(ax.get_xticklabels(), rotation=0)
-        ax.legend(title="High Success")
-        ax.grid(axis="y", linestyle="--", alpha=0.6)
-
-       # valeurs au-dessus des barres
-        # Pour chaque barre dans le graphique (chaque rectangle de l'histogramme)
-        for p in ax.patches: #ax.patches contient toutes les barres du graphique
-            # Récupérer la hauteur de la barre 
-            max = p.get_height()
-            # Ajouter le nombre au-dessus de la barre
-            ax.annotate(
-                f"{max:.1f}",  # texte affiché : la hauteur avec 1 chiffre après la virgule
-                    (   # position du texte :
-                    p.get_x() + p.get_width() / 2,  # x = centre de la barre
-                    max                             # y = la hauteur de la barre
-                        ),
-                        ha="center",      # alignement horizontal du texte : centré
-                        va="bottom",      # alignement vertical : le texte commence au dessus de la barre
-                        fontsize=9        # taille du texte
-                    )
-
-        
-        plt.savefig(os.path.join(fig_dir, "G8_cognitive_load_coding_success.png"), dpi=300, bbox_inches="tight")
-        plt.show()
-
-    def filtering(self):
+                specs.append(spec)
+
+        # G1 à G8 : une fonction par groupement (voir analyses.py)
+        tables = {}
+        for name in analyses.select(analyses.GROUPINGS, names):
+            with profiling.stage(name, rows=len(self.df)):
+                tables[name] = analyses.GROUPINGS[name](self, figure)
+
+        # Mode sans affichage : rastérisation de toutes les figures en parallèle
+        if not show:
+            with profiling.stage("render_all"):
+                rendering.render_all(specs, fig_dir, workers=workers)
+        return tables
+
+    @profiled()
+    def filtering(self, lazy=False, names=None):
 
         """
         Applique tous les filtres F1 à F7 sur le DataFrame self.df.
@@ -764,155 +317,76 @@ class Data():
         F7 : High / Low Coffee           (Coffee_Intake, seuil = médiane)
 
         Retourne un dictionnaire contenant tous les DataFrames filtrés.
+        lazy=True : les valeurs sont des filters.RowFilter (bitset des lignes,
+        sans copie) au lieu de 14 DataFrames ; RowFilter.frame() les matérialise.
+        names : sous-ensemble à lancer, par ex. ["F5", "F7"] (None = tous).
         """
 
         df = self.df  
+        if df is None:
+            # Les filtres retournent des lignes : pas d'équivalent par agrégats partiels
+            raise ValueError("filtering a besoin de la DataFrame entière (pas de mode streaming, chunksize=None)")
         filters = {}
 
-        
-        # F1 – High Success / Low Success
-        
-        print("\n[F1] High Success / Low Success (Task_Success_Rate)")
-
-        # High Success : Task_Success_Rate > 80
-        high_success = df[df["Task_Success_Rate"] > 80]
-
-        # Low Success : Task_Success_Rate < 60
-        low_success = df[df["Task_Success_Rate"] < 60]
-
-        print(f"  High Success  (Task_Success_Rate > 80) : {len(high_success)} Devs")
-        print(f"  Low Success   (Task_Success_Rate < 60) : {len(low_success)} Devs")
-
-        filters["high_success"] = high_success
-        filters["low_success"] = low_success
-
-       
-        # F2 – High Stress / Low Stress
-        
-        print("\n[F2] High Stress / Low Stress (Stress_Level)")
-
-        # High Stress : Stress_Level > 70
-        high_stress = df[df["Stress_Level"] > 70]
-
-        # Low Stress : Stress_Level < 40
-        low_stress = df[df["Stress_Level"] < 40]
-
-        print(f"  High Stress (Stress_Level > 70) : {len(high_stress)} Devs")
-        print(f"  Low Stress  (Stress_Level < 40) : {len(low_stress)} Devs")
-
-        filters["high_stress"] = high_stress
-        filters["low_stress"] = low_stress
-
-        
-        # F3 – Low Sleep / High Sleep
-        
-        print("\n[F3] Low Sleep / High Sleep (Sleep_Hours)")
+        def select(mask, name):
+            # Vue compacte (lazy) ou DataFrame filtrée (copie) comme avant
+            return RowFilter(df, mask, name) if lazy else df[mask]
 
-        # Low Sleep : Sleep_Hours < 6
-        low_sleep = df[df["Sleep_Hours"] < 6]
+        # F1 à F7 : une fonction par filtre (voir analyses.py)
+        for name in analyses.select(analyses.FILTERS, names):
+            with profiling.stage(name, rows=len(df)):
+                filters.update(analyses.FILTERS[name](self, select))
 
-        # High Sleep : Sleep_Hours > 8
-        high_sleep = df[df["Sleep_Hours"] > 8]
-
-        print(f"  Low Sleep  (Sleep_Hours < 6h) : {len(low_sleep)} Devs")
-        print(f"  High Sleep (Sleep_Hours > 8h) : {len(high_sleep)} Devs")
-
-        filters["low_sleep"] = low_sleep
-        filters["high_sleep"] = high_sleep
-
-       
-        # F4 – Heavy Coders / Light Coders
-       
-        print("\n[F4] Heavy Coders / Light Coders (Hours_Coding)")
-
-        # Heavy Coders : Hours_Coding > 8
-        heavy_coders = df[df["Hours_Coding"] > 8]
-
-        # Light Coders : Hours_Coding < 4
-        light_coders = df[df["Hours_Coding"] < 4]
-
-        print(f"  Heavy Coders (Hours_Coding > 8h) : {len(heavy_coders)} Devs")
-        print(f"  Light Coders (Hours_Coding < 4h) : {len(light_coders)} Devs")
-
-        filters["heavy_coders"] = heavy_coders
-        filters["light_coders"] = light_coders
-
-       
-        # F5 – High AI Usage / Low AI Usage
-        
-        print("\n[F5] High AI Usage / Low AI Usage (AI_Usage_Hours)")
-
-        # Seuil = médiane du temps d'utilisation de l'IA
-        ai_median = df["AI_Usage_Hours"].median()
-        print(f"  Median AI_Usage_Hours = {ai_median:.2f}")
-
-        high_ai_usage = df[df["AI_Usage_Hours"] >= ai_median]
-        low_ai_usage = df[df["AI_Usage_Hours"] < ai_median]
-
-        print(f"  High_AI_Usage (>= médiane) : {len(high_ai_usage)} Devs")
-        print(f"  Low_AI_Usage  (< médiane)  : {len(low_ai_usage)} Devs")
-
-        filters["high_ai_usage"] = high_ai_usage
-        filters["low_ai_usage"] = low_ai_usage
-
-        
-        # F6 – High Errors / Low Errors
-        
-        print("\n[F6] High Errors / Low Errors (Errors)")
-
-        # Seuil choisi : médiane du nombre d'erreurs
-        errors_median = df["Errors"].median()
-        print(f"  Median Errors = {errors_median:.2f}")
-
-        high_errors = df[df["Errors"] >= errors_median]
-        low_errors = df[df["Errors"] < errors_median]
-
-        print(f"  High Errors (>= médiane) : {len(high_errors)} Devs")
-        print(f"  Low Errors  (< médiane)  : {len(low_errors)} Devs")
-
-        filters["high_errors"] = high_errors
-        filters["low_errors"] = low_errors
-
-        
-        # F7 – High Coffee / Low Coffee
-        
-        print("\n[F7] High Coffee / Low Coffee (Coffee_Intake)")
-
-        # Seuil = médiane de la consommation de café
-        coffee_median = df["Coffee_Intake"].median()
-        print(f"  Median Coffee_Intake = {coffee_median:.2f}")
-
-        high_coffee = df[df["Coffee_Intake"] >= coffee_median]
-        low_coffee = df[df["Coffee_Intake"] < coffee_median]
-
-        print(f"  High Coffee (>= médiane) : {len(high_coffee)} Devs")
-        print(f"  Low Coffee  (< médiane)  : {len(low_coffee)} Devs")
-
-        filters["high_coffee"] = high_coffee
-        filters["low_coffee"] = low_coffee
-
-        
-        # Retour de tous les filtres
-        
         return filters
 
-    def matrix_correlation(self,afficher:bool):
+    @profiled()
+    def matrix_correlation(self,afficher:bool, show=True):
         df=self.df
         # Dossier de sortie pour enregistrer toutes les figures
         fig_dir = "figures"
         # Crée le dossier s'il n'existe pas
         os.makedirs(fig_dir, exist_ok=True)
 
-        #Garde uniquement les colonnes numériques (int, float).
-        numeric_cols = df.select_dtypes(include='number')
+        if df is None:
+            # Mode streaming : Pearson à partir des produits croisés accumulés
+            acc, _ = self.stream_analysis()
+            corr_matrix = acc.corr()
+        else:
+            #Garde uniquement les colonnes numériques (int, float).
+            numeric_cols = df.select_dtypes(include='number')
+
+
+            #Calcule la matrice de corrélation entre les colonnes numériques.
+            #Pearson correlation linéaire classique 
+            #Spearman corrélation de rang (si les relations ne sont pas linéaires).
+            corr_matrix=numeric_cols.corr(method='pearson') 
 
 
-        #Calcule la matrice de corrélation entre les colonnes numériques.
-        #Pearson correlation linéaire classique 
-        #Spearman corrélation de rang (si les relations ne sont pas linéaires).
-        corr_matrix=numeric_cols.corr(method='pearson') 
+        return self.save_correlation(corr_matrix, afficher, show, fig_dir)
 
+    @profiled()
+    def update_correlation(self, state_path="correlation_state.npz", afficher=False, show=True):
+        """
+        Corrélation incrémentale : ajoute les lignes de self.df (nouveau lot nettoyé)
+        à l'état sauvegardé dans state_path, sans relire les lots précédents,
+        puis écrit la même matrice arrondie / CSV que matrix_correlation.
+        """
+        numeric_cols = self.df.select_dtypes(include='number')
+        if os.path.exists(state_path):
+            acc = CorrelationAccumulator.load(state_path)
+            if acc.columns != list(numeric_cols.columns):
+                raise ValueError(f"Les colonnes du lot ne correspondent pas à l'état {state_path}")
+        else:
+            acc = CorrelationAccumulator(numeric_cols.columns)
+        acc.update(numeric_cols)
+        acc.save(state_path)
+        print(f"Correlation state: {int(np.diag(acc.n).max())} rows ({len(numeric_cols)} new)")
+
+        fig_dir = "figures"
+        os.makedirs(fig_dir, exist_ok=True)
+        return self.save_correlation(acc.corr(), afficher, show, fig_dir)
 
+    def save_correlation(self, corr_matrix, afficher, show, fig_dir):
         #Arrondit les valeurs de la matrice de corrélation à 2 décimales.
         corr_rounded=corr_matrix.round(2)
         print(corr_rounded.to_string())
@@ -923,76 +397,148 @@ class Data():
 
 
         if(afficher):
-            # 1. Utiliser directement ta matrice de corrélation (déjà arrondie)
-            corr_mat = corr_rounded
-
-            # 2. Récupérer les noms des variables pour les axes
-            x_labels = list(corr_mat.columns)   # noms sur l’axe X
-            y_labels = list(corr_mat.index)     # noms sur l’axe Y
-
-            # 3. Définir un style simple pour le titre (comme ton style)
-            font_dict = {
-                "fontsize": 14,
-                "fontweight": "bold",
-                "color": "purple",
-                "style": "italic",
-            }
-
-            # 4. Créer la figure et l’axe (zone de tracé)
-            #figsize : largeur, hauteur en pouces
-            #sunbplots : crée une figure et des sous-graphes (ici 1 seul)
-            fig, ax = plt.subplots(figsize=(10, 8))
-
-            # 5. Afficher la “carte” : chaque case = une corrélation
-            # vmin/vmax fixés à [-1, 1] pour une lecture correcte des corrélations
-            #cmap : palette de couleurs
-            #aspect="auto" : pour que les cases soient carrées même si la figure est rectangulaire
-            heatmap = ax.imshow(corr_mat.values, cmap="coolwarm", vmin=-1, vmax=1, aspect="auto")
-
-            # 6. Ajouter la légende des couleurs (colorbar)
-            #colorbar : barre de couleurs à côté de la carte
-            cbar = fig.colorbar(heatmap, ax=ax)
-            cbar.set_label("Corrélation")
-
-            # 7. Ajouter titre + noms des axes
-            ax.set_title("Matrice de corrélation", fontdict=font_dict)
-            ax.set_xlabel("Variables", fontdict=font_dict)
-            ax.set_ylabel("Variables", fontdict=font_dict)
-
-            # 8. Mettre les noms des variables sur les axes (ticks)
-            ax.set_xticks(range(len(x_labels)))
-            ax.set_yticks(range(len(y_labels)))
-            ax.set_xticklabels(x_labels, rotation=45, ha="right")
-            ax.set_yticklabels(y_labels)
-
-            # 9. Ajouter une grille légère pour bien séparer les cases
-            ax.set_xticks(np.arange(-0.5, len(x_labels), 1), minor=True)
-            ax.set_yticks(np.arange(-0.5, len(y_labels), 1), minor=True)
-            ax.grid(which="minor", linestyle="--", linewidth=0.5, alpha=0.7)
-            ax.tick_params(which="minor", bottom=False, left=False)
-
-            # 10. Ajuster la mise en page pour éviter que les labels se coupent
-            #sauvegarder la figure dans le dossier fig_dir(figures) 
-            #dpi  résolution de l'image
-            #bbox_inches permet de minimiser l'espace blanc inutile autour de la figure sauvegardée
-            #tight ajuste automatiquement les marges pour que tout le contenu soit visible
-            plt.savefig(os.path.join(fig_dir, "Matrice_Correlation.png"), dpi=300, bbox_inches="tight")
-            plt.show()
+            # Carte de chaleur de la matrice arrondie (voir rendering.heatmap_spec),
+            # enregistrée dans fig_dir puis affichée si show=True
+            spec = rendering.heatmap_spec("Matrice_Correlation.png", corr_rounded)
+            if show:
+                rendering.render_spec(spec, fig_dir, show=True)
+            else:
+                rendering.render_all([spec], fig_dir)
 
         return corr_rounded
     
-    def SaveCsv(self):
-        # Réécrit le CSV d'origine avec la version nettoyée.
-        self.df.to_csv(self.path, index=False)
-
-path=input("Entrer le path du fichier CSV : ")
-data=Data(path)
-print(data)
-data.inspect_data()
-data.summarize_data()
-df=data.clean_data()
-print(df)
-data.summarize_data()
-data.grouping_visualization()
-filters=data.filtering()
-corr_matrix=data.matrix_correlation(True)
\ No newline at end of file
+    @profiled()
+    def save(self, path=None, fmt="csv", compression="gzip", partition_by=None):
+        """
+        Écrit self.df (version nettoyée) via output.write_frame : fichier temporaire
+        puis renommage atomique, CSV compressé / parquet / npy, un fichier par groupe
+        si partition_by (par ex. "Sleep_Group", créé s'il manque). Retourne le chemin.
+        Par défaut : <nom>_clean.csv.gz à côté du CSV d'origine, qui n'est jamais écrasé.
+        """
+        if partition_by is not None and partition_by not in self.df.columns:
+            if partition_by not in binning.BINNINGS:
+                raise ValueError(f"Clé de partition inconnue : {partition_by}")
+            analyses.derive(self, binning.BINNINGS[partition_by])
+        if path is None:
+            path = output.default_path(self.path, fmt, compression, partition_by)
+        return output.write_frame(self.df, path, fmt, compression, partition_by)
+
+    def SaveCsv(self, path=None):
+        # Écrit la version nettoyée dans <nom>_clean.csv (le CSV d'origine n'est plus écrasé)
+        return self.save(path or output.default_path(self.path), compression=None)
+
+def load(args):
+    # Data du CSV de la ligne de commande ; nettoyée sauf --raw.
+    # Comme dans "all" et en streaming, les analyses gardent les doublons : seule
+    # la copie retournée par clean_data (affichée / écrite par "clean") en est privée.
+    data = Data(args.csv, chunksize=args.chunksize, cache=args.cache, compact=args.compact, sketch_eps=args.sketch_eps)
+    if not args.raw and data.df is not None:
+        data.clean_data()
+    return data
+
+
+# Sous-commandes disponibles avec --chunksize (filter et all passent par filtering)
+STREAMING_COMMANDS = ("inspect", "summarize", "clean", "group", "corr")
+
+
+def main(argv=None):
+    """
+    python Main.py <commande> fichier.csv [options]
+
+    inspect / summarize : aperçu et statistiques du CSV brut
+    clean               : nettoyage puis écriture de <nom>_clean.csv.gz (voir Data.save et les options)
+    group [G1 ... G8]   : groupements + figures (enregistrées dans figures/, --show pour les afficher)
+    filter [F1 ... F7]  : filtres et effectifs
+    corr                : matrice de corrélation (correlation_matrix.csv, --heatmap pour la figure)
+    all                 : tout l'enchaînement, comme le script d'origine
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Analyse du dataset AI_Developer_Performance")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("csv", help="chemin du fichier CSV")
+    common.add_argument("--chunksize", type=int, default=None, help="mode streaming : lignes par morceau")
+    common.add_argument("--sketch-eps", type=float, default=None, metavar="EPS",
+                        help="avec --chunksize : quantiles approchés (sketch KLL, erreur de rang EPS), mémoire bornée")
+    common.add_argument("--cache", action="store_true", help="garder la version nettoyée sur disque")
+    common.add_argument("--compact", action="store_true", help="dtypes réduits (int8/float32, catégorielles)")
+    common.add_argument("--raw", action="store_true", help="ne pas nettoyer avant group / filter / corr")
+    common.add_argument("--profile", default=None, metavar="TRACE", help="trace des étapes en .json ou .csv")
+    common.add_argument("--trace-memory", action="store_true", help="avec --profile : pic d'allocation (tracemalloc)")
+    common.add_argument("--cprofile", default=None, metavar="DIR", help="avec --profile : dump cProfile par étape")
+    common.add_argument("--cprofile-stages", nargs="+", default=None, metavar="STAGE",
+                        help="étapes à profiler (défaut : chaque méthode de Data)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("inspect", parents=[common], help="premières / dernières lignes, types, NaN")
+    commands.add_parser("summarize", parents=[common], help="statistiques descriptives")
+    clean = commands.add_parser("clean", parents=[common], help="nettoyer et écrire le CSV nettoyé")
+    clean.add_argument("--fused", action="store_true", help="nettoyage en un seul passage")
+    clean.add_argument("--output", default=None, help="sortie (défaut : <nom>_clean.csv.gz, voir output.default_path)")
+    clean.add_argument("--format", default="csv", choices=output.FORMATS, help="csv, parquet (pyarrow) ou npy")
+    clean.add_argument("--compression", default="gzip", help="gzip, bz2, xz, zip, zstd ou none")
+    clean.add_argument("--partition-by", default=None, help="un fichier par groupe, par ex. Sleep_Group")
+    group = commands.add_parser("group", parents=[common], help="groupements G1 à G8 + figures")
+    group.add_argument("names", nargs="*", metavar="G", help="sous-ensemble, par ex. G1 G6 (défaut : tous)")
+    group.add_argument("--show", action="store_true", help="afficher les figures")
+    group.add_argument("--workers", type=int, default=None, help="processus pour rendre les figures")
+    filt = commands.add_parser("filter", parents=[common], help="filtres F1 à F7")
+    filt.add_argument("names", nargs="*", metavar="F", help="sous-ensemble, par ex. F5 F7 (défaut : tous)")
+    corr = commands.add_parser("corr", parents=[common], help="matrice de corrélation")
+    corr.add_argument("--heatmap", action="store_true", help="enregistrer la carte de chaleur")
+    corr.add_argument("--show", action="store_true", help="afficher la carte de chaleur")
+    commands.add_parser("all", parents=[common], help="enchaînement complet (figures affichées)")
+    args = parser.parse_args(argv)
+    if args.chunksize is not None and args.command not in STREAMING_COMMANDS:
+        parser.error(f"{args.command} ne fonctionne pas en mode streaming (--chunksize) : "
+                     f"filtering a besoin de toutes les lignes")
+    if args.sketch_eps is not None and args.chunksize is None:
+        parser.error("--sketch-eps ne s'utilise qu'en mode streaming (--chunksize)")
+
+    if args.profile:
+        profiling.enable(trace_memory=args.trace_memory, cprofile_dir=args.cprofile,
+                         cprofile_stages=args.cprofile_stages or profiling.METHOD_STAGES)
+    with profiling.stage(args.command):
+        run_command(args)
+    if args.profile:
+        print(profiling.summary())
+        print("Trace:", profiling.save(args.profile))
+
+
+def run_command(args):
+    if args.command in ("inspect", "summarize"):
+        data = Data(args.csv, chunksize=args.chunksize, cache=args.cache, compact=args.compact, sketch_eps=args.sketch_eps)
+        if args.command == "inspect":
+            data.inspect_data()
+        else:
+            data.summarize_data()
+    elif args.command == "clean":
+        data = Data(args.csv, chunksize=args.chunksize, cache=args.cache, compact=args.compact, fused=args.fused, sketch_eps=args.sketch_eps)
+        cleaned = data.clean_data()
+        if data.df is None:
+            print(cleaned)
+        else:
+            data.df = cleaned
+            compression = None if args.compression == "none" else args.compression
+            print("Saved:", data.save(args.output, args.format, compression, args.partition_by))
+    elif args.command == "group":
+        load(args).grouping_visualization(show=args.show, workers=args.workers, names=args.names or None)
+    elif args.command == "filter":
+        load(args).filtering(lazy=True, names=args.names or None)
+    elif args.command == "corr":
+        load(args).matrix_correlation(args.heatmap or args.show, show=args.show)
+    else:
+        data = Data(args.csv, chunksize=args.chunksize, cache=args.cache, compact=args.compact, sketch_eps=args.sketch_eps)
+        print(data)
+        data.inspect_data()
+        data.summarize_data()
+        df = data.clean_data()
+        print(df)
+        data.summarize_data()
+        data.grouping_visualization()
+        data.filtering(lazy=True)
+        data.matrix_correlation(True)
+
+
+if __name__ == "__main__":
+    main()
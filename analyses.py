@@ -0,0 +1,496 @@
+"""
+Analyses G1 à G8 (groupements + figures) et F1 à F7 (filtres), une fonction chacune.
+
+Chaque fonction reçoit un objet Main.Data déjà chargé (et normalement nettoyé) :
+elle lit data.df et passe par data.grouped / data.stat, donc les agrégations
+sont partagées entre analyses via le cache de Data. Les colonnes dérivées
+(Sleep_Group, High_Stress, High_AI_Usage, ...) sont créées par derive() avec les
+découpages de binning.py, une seule fois par DataFrame.
+
+Data.grouping_visualization / Data.filtering exécutent toutes les analyses ;
+engine.py permet d'en lancer seulement une partie.
+"""
+import binning
+import rendering
+
+
+def derive(data, rule):
+    """
+    Ajoute à data.df la colonne du découpage rule (binning.Binning / ThresholdSplit),
+    sauf si elle y est déjà avec ce même découpage et que ni la colonne source ni la
+    colonne dérivée n'ont changé depuis (versions de data.cache). Retourne le seuil
+    utilisé (None pour un Binning).
+    """
+    df = data.df
+    cache = data.cache
+    done = data.derived.get(rule.name)
+    if (done is not None and done[0] is rule and rule.name in df.columns
+            and done[2] == (cache.column_version(rule.column), cache.column_version(rule.name))):
+        return done[1]
+    threshold = None
+    if isinstance(rule, binning.Binning):
+        rule.assign(df)
+    else:
+        if rule.stat is not None:
+            threshold = data.stat(rule.column, rule.stat)
+        threshold = rule.assign(df, threshold)
+    # Colonne (ré)écrite : les agrégations groupées sur l'ancienne sont obsolètes
+    cache.touch(rule.name)
+    data.derived[rule.name] = (rule, threshold, (cache.column_version(rule.column), cache.column_version(rule.name)))
+    return threshold
+
+
+def select(registry, names=None):
+    # Noms à lancer, dans l'ordre du registre (G1..G8 / F1..F7) ; None = tous
+    if names is None:
+        return list(registry)
+    unknown = [name for name in names if name not in registry]
+    if unknown:
+        raise ValueError(f"Analyses inconnues : {unknown} (disponibles : {list(registry)})")
+    return [name for name in registry if name in names]
+
+
+# ---------- Groupements G1 à G8 ----------
+# figure(spec) : affiche / enregistre la figure décrite par spec (voir rendering.py)
+
+def g1(data, figure):
+    # G1: Groupement par High_Stress → Stress & Succès
+    df = data.df
+
+    print("\nGroup by High_Stress → Stress & Success\n")
+
+    # Colonne High_Stress (True si stress > 70)
+    derive(data, binning.HIGH_STRESS_70)
+
+    # Moyennes par High_Stress
+    g1_group = data.grouped("High_Stress", [
+        "Task_Success_Rate",
+        "Sleep_Hours",
+        "Hours_Coding",
+        "AI_Usage_Hours"
+    ]).round(2)
+
+    print("Mean stats by High_Stress (False = low/medium, True = high) :")
+    print(g1_group)
+
+    # Histogramme global du stress avec la ligne du seuil High_Stress = 70
+    figure(rendering.hist_spec(
+        "G1_stress_distribution.png",
+        df["Stress_Level"],
+        "Distribution of Stress Level with High Stress Threshold",
+        "Stress Level",
+        "Number of Developers",
+        alpha=0.75,
+        threshold={"x": 70, "color": "red", "linestyle": "--", "linewidth": 2,
+                   "label": "High Stress Threshold = 70"}
+    ))
+
+    # Moyenne Task_Success_Rate par High_Stress
+    # (déjà calculée pour g1_group : servie par le cache)
+    Stress_Succes = data.grouped("High_Stress", "Task_Success_Rate")
+
+    figure(rendering.bar_spec(
+        "G1_success_by_stress.png",
+        Stress_Succes,
+        "Mean Task Success Rate by Stress Level",
+        "High Stress (False = Low/Medium, True = High)",
+        "Mean Task Success Rate",
+        alpha=0.8,
+        figsize=(7, 5)
+    ))
+    return g1_group
+
+
+def g2(data, figure):
+    # G2:Groupement par Sleep_Group → Sommeil, Stress & Succès
+    df = data.df
+
+    print("\nGroup by Sleep_Group → Sleep, Stress & Success \n")
+
+    # Colonne Sleep_Group : <5h, 5–7h, >7h (voir binning.SLEEP_GROUP)
+    derive(data, binning.SLEEP_GROUP)
+
+    g2_group = data.grouped("Sleep_Group", [
+        "Stress_Level",
+        "Task_Success_Rate",
+        "Errors"
+    ], observed=False).round(2)
+
+    print("Mean stats by Sleep_Group :")
+    print(g2_group)
+
+    # Histogramme Task_Success_Rate
+    figure(rendering.hist_spec(
+        "G2_success_distribution.png",
+        df["Task_Success_Rate"],
+        "Distribution of Task Success Rate",
+        "Task Success Rate",
+        "Number of Developers",
+        alpha=0.8
+    ))
+
+    # Moyenne Stress_Level par Sleep_Group
+    Stress_Sleep = data.grouped("Sleep_Group", "Stress_Level", observed=False)
+
+    figure(rendering.bar_spec(
+        "G2_stress_by_sleep.png",
+        Stress_Sleep,
+        "Mean Stress Level by Sleep Group",
+        "Sleep Group",
+        "Mean Stress Level"
+    ))
+
+    #V5 :Moyenne Task_Success_Rate par Sleep_Group
+    Succes_Sleep = data.grouped("Sleep_Group", "Task_Success_Rate", observed=False)
+
+    figure(rendering.bar_spec(
+        "G2_success_by_sleep.png",
+        Succes_Sleep,
+        "Mean Task Success Rate by Sleep Group",
+        "Sleep Group",
+        "Mean Task Success Rate"
+    ))
+    return g2_group
+
+
+def g3(data, figure):
+    # G3 :Groupement  Coding_Hours → Heures de code, Stress, Succès
+
+    print("\nGroupement  Coding_Hours → Heures de code, Stress, Succès\n")
+
+    # Regroupe les heures de code en 3 catégories : 0–4h, 4–8h, >8h
+    derive(data, binning.CODING_HOURS_GROUP)
+
+    g3_group = data.grouped("Coding_Hours_Group", [
+        "Task_Success_Rate",
+        "Stress_Level",
+        "Errors"
+    ]).round(2)
+
+    print("Mean stats by Coding_Hours_Group :")
+    print(g3_group)
+
+    # --- Stress moyen vs heures de code ---
+    figure(rendering.bar_spec(
+        "G3_stress_by_coding.png",
+        g3_group["Stress_Level"],
+        "Mean Stress Level by Coding Hours Group",
+        "Coding Hours Group",
+        "Mean Stress Level"
+    ))
+
+    # Task_Success_Rate vs Coding Hours
+    figure(rendering.bar_spec(
+        "G3_success_by_coding.png",
+        g3_group["Task_Success_Rate"],
+        "Mean Task Success Rate by Coding Hours Group",
+        "Coding Hours Group",
+        "Mean Task Success Rate"
+    ))
+    return g3_group
+
+
+def g4(data, figure):
+    # G4:Groupement par  High_AI_Usage → IA, Erreurs & Succès
+
+    print("\n Group by High_AI_Usage → AI, Errors & Success\n")
+
+    # High_AI_Usage si AI_Usage_Hours >= médiane, Low_AI_Usage sinon
+    derive(data, binning.HIGH_AI_USAGE)
+
+    g4_group = data.grouped("High_AI_Usage", [
+        "Errors",
+        "Task_Success_Rate",
+        "Stress_Level"
+    ]).round(2)
+
+    print("Mean stats by High_AI_Usage :")
+    print(g4_group)
+
+    # --- Erreurs moyennes vs IA ---
+    figure(rendering.bar_spec(
+        "G4_errors_by_ai.png",
+        g4_group["Errors"],
+        "Mean Errors by AI Usage",
+        "AI Usage Group",
+        "Mean Errors",
+        fmt="{:.2f}"
+    ))
+
+    # --- Taux de succès moyen vs IA ---
+    figure(rendering.bar_spec(
+        "G4_success_by_ai.png",
+        g4_group["Task_Success_Rate"],
+        "Mean Task Success Rate by AI Usage",
+        "AI Usage Group",
+        "Mean Task Success Rate",
+        fmt="{:.2f}"
+    ))
+    return g4_group
+
+
+def g5(data, figure):
+    # G5 : Groupement High_Coffee → Café, Stress & Succès
+
+    print("\nGroup by High_Coffee → Coffee, Stress & Success\n")
+
+    # High_Coffee si Coffee_Intake >= médiane, Low_Coffee sinon
+    med = derive(data, binning.HIGH_COFFEE)
+
+    g5_group = data.grouped("High_Coffee", ["Stress_Level", "Task_Success_Rate"]).round(2)
+
+    print(f"Median Coffee_Intake = {med:.2f}")
+    print("\nMean stats by High_Coffee :")
+    print(g5_group)
+
+    # Stress moyen par groupe de café
+    figure(rendering.bar_spec(
+        "G5_stress_by_coffee.png",
+        g5_group["Stress_Level"],
+        "Mean Stress Level by Coffee Intake Group",
+        "Coffee Group (Low vs High)",
+        "Mean Stress Level"
+    ))
+
+    # Succès moyen par groupe de café
+    figure(rendering.bar_spec(
+        "G5_success_by_coffee.png",
+        g5_group["Task_Success_Rate"],
+        "Mean Task Success Rate by Coffee Intake Group",
+        "Coffee Group (Low vs High)",
+        "Mean Task Success Rate"
+    ))
+    return g5_group
+
+
+def g6(data, figure):
+    # G6 : Groupement Sleep_Group × High_Stress → Profils combinés
+    print("\nSleep_Group × High_Stress → Sleep + Stress Profiles\n")
+
+    # Ici High_Stress = stress au-dessus de la moyenne (et non > 70 comme G1)
+    derive(data, binning.SLEEP_GROUP)
+    derive(data, binning.HIGH_STRESS_MEAN)
+    #  Créer un tableau récapitulatif des moyennes
+    sleep_stress_means = data.grouped(["Sleep_Group", "High_Stress"], ["Task_Success_Rate", "Errors"])
+    sleep_stress_summary = sleep_stress_means.round(2)
+
+    print("Moyenne Task_Success_Rate & Errors by Sleep_Group × High_Stress :")
+    print(sleep_stress_summary)
+    # Tableau croisé pour Task_Success_Rate (mêmes moyennes que le récapitulatif)
+    pivot_success = sleep_stress_means["Task_Success_Rate"].unstack("Sleep_Group").round(2)
+
+    print("\nPivot – Mean Task_Success_Rate by Sleep_Group & High_Stress :")
+    print(pivot_success)
+
+    figure(rendering.bar_spec(
+        "G6_success_sleep_stress.png",
+        pivot_success,
+        "Mean Task Success Rate by Sleep Group and Stress Level",
+        "High Stress (False = Low/Normal, True = High)",
+        "Mean Task Success Rate",
+        legend_title="Sleep Group"
+    ))
+    return sleep_stress_summary
+
+
+def g7(data, figure):
+    # G7 : Groupement  High_AI_Usage × High_Stress → IA + Stress
+
+    print("\nHigh_AI_Usage × High_Stress → AI + Stress \n")
+
+    # High_Stress au-dessus de la moyenne, comme G6 ; High_AI_Usage_Bool = IA au-dessus de la moyenne
+    derive(data, binning.HIGH_STRESS_MEAN)
+    derive(data, binning.HIGH_AI_USAGE_BOOL)
+
+    ai_stress_means = data.grouped(["High_AI_Usage_Bool", "High_Stress"], ["Errors", "Task_Success_Rate"])
+    ai_stress_summary = ai_stress_means.round(2)
+
+    print("Mean Errors & Success by High_AI_Usage × High_Stress :")
+    print(ai_stress_summary)
+
+    pivot_errors = ai_stress_means["Errors"].unstack("High_AI_Usage_Bool").round(2)
+
+    print("\nPivot – Mean Errors by High_AI_Usage & High_Stress :")
+    print(pivot_errors)
+
+    figure(rendering.bar_spec(
+        "G7_errors_ai_stress.png",
+        pivot_errors,
+        "Mean Errors by AI Usage and Stress Level",
+        "High Stress (False = Low/Normal, True = High)",
+        "Mean Errors",
+        legend_title="High AI Usage (False/True)"
+    ))
+    return ai_stress_summary
+
+
+def g8(data, figure):
+    # G8 : Groupement Coding_Hours_Group × High_Success → Profil final
+
+    print("\n==== G8 – Coding_Hours_Group × High_Success → Coding + Success Profiles ====\n")
+
+    derive(data, binning.CODING_HOURS_GROUP)
+    derive(data, binning.HIGH_SUCCESS)
+
+    g8_summary = data.grouped(
+        ["Coding_Hours_Group", "High_Success"],
+        ["Cognitive_Load", "Bugs_Found"]
+    ).round(2)
+
+    print("Mean Cognitive_Load & Bugs_Found by Coding_Hours_Group × High_Success :")
+    print(g8_summary)
+
+    g8_pivot = g8_summary.reset_index().pivot(
+        index="Coding_Hours_Group",
+        columns="High_Success",
+        values="Cognitive_Load"
+    )
+
+    figure(rendering.bar_spec(
+        "G8_cognitive_load_coding_success.png",
+        g8_pivot,
+        "Average Cognitive Load by Coding Hours and Success",
+        "Coding Hours Group",
+        "Average Cognitive Load",
+        legend_title="High Success"
+    ))
+    return g8_summary
+
+
+GROUPINGS = {"G1": g1, "G2": g2, "G3": g3, "G4": g4, "G5": g5, "G6": g6, "G7": g7, "G8": g8}
+
+
+# ---------- Filtres F1 à F7 ----------
+# select(mask, name) : DataFrame filtrée ou filters.RowFilter (voir Data.filtering)
+# Chaque filtre retourne {nom: sélection} pour ses deux groupes.
+
+def f1(data, select):
+    # F1 – High Success / Low Success
+    df = data.df
+
+    print("\n[F1] High Success / Low Success (Task_Success_Rate)")
+
+    # High Success : Task_Success_Rate > 80
+    high_success = select(df["Task_Success_Rate"] > 80, "high_success")
+
+    # Low Success : Task_Success_Rate < 60
+    low_success = select(df["Task_Success_Rate"] < 60, "low_success")
+
+    print(f"  High Success  (Task_Success_Rate > 80) : {len(high_success)} Devs")
+    print(f"  Low Success   (Task_Success_Rate < 60) : {len(low_success)} Devs")
+
+    return {"high_success": high_success, "low_success": low_success}
+
+
+def f2(data, select):
+    # F2 – High Stress / Low Stress
+    df = data.df
+
+    print("\n[F2] High Stress / Low Stress (Stress_Level)")
+
+    # High Stress : Stress_Level > 70
+    high_stress = select(df["Stress_Level"] > 70, "high_stress")
+
+    # Low Stress : Stress_Level < 40
+    low_stress = select(df["Stress_Level"] < 40, "low_stress")
+
+    print(f"  High Stress (Stress_Level > 70) : {len(high_stress)} Devs")
+    print(f"  Low Stress  (Stress_Level < 40) : {len(low_stress)} Devs")
+
+    return {"high_stress": high_stress, "low_stress": low_stress}
+
+
+def f3(data, select):
+    # F3 – Low Sleep / High Sleep
+    df = data.df
+
+    print("\n[F3] Low Sleep / High Sleep (Sleep_Hours)")
+
+    # Low Sleep : Sleep_Hours < 6
+    low_sleep = select(df["Sleep_Hours"] < 6, "low_sleep")
+
+    # High Sleep : Sleep_Hours > 8
+    high_sleep = select(df["Sleep_Hours"] > 8, "high_sleep")
+
+    print(f"  Low Sleep  (Sleep_Hours < 6h) : {len(low_sleep)} Devs")
+    print(f"  High Sleep (Sleep_Hours > 8h) : {len(high_sleep)} Devs")
+
+    return {"low_sleep": low_sleep, "high_sleep": high_sleep}
+
+
+def f4(data, select):
+    # F4 – Heavy Coders / Light Coders
+    df = data.df
+
+    print("\n[F4] Heavy Coders / Light Coders (Hours_Coding)")
+
+    # Heavy Coders : Hours_Coding > 8
+    heavy_coders = select(df["Hours_Coding"] > 8, "heavy_coders")
+
+    # Light Coders : Hours_Coding < 4
+    light_coders = select(df["Hours_Coding"] < 4, "light_coders")
+
+    print(f"  Heavy Coders (Hours_Coding > 8h) : {len(heavy_coders)} Devs")
+    print(f"  Light Coders (Hours_Coding < 4h) : {len(light_coders)} Devs")
+
+    return {"heavy_coders": heavy_coders, "light_coders": light_coders}
+
+
+def f5(data, select):
+    # F5 – High AI Usage / Low AI Usage
+    df = data.df
+
+    print("\n[F5] High AI Usage / Low AI Usage (AI_Usage_Hours)")
+
+    # Seuil = médiane du temps d'utilisation de l'IA
+    ai_median = data.stat("AI_Usage_Hours", "median")
+    print(f"  Median AI_Usage_Hours = {ai_median:.2f}")
+
+    high_ai_usage = select(df["AI_Usage_Hours"] >= ai_median, "high_ai_usage")
+    low_ai_usage = select(df["AI_Usage_Hours"] < ai_median, "low_ai_usage")
+
+    print(f"  High_AI_Usage (>= médiane) : {len(high_ai_usage)} Devs")
+    print(f"  Low_AI_Usage  (< médiane)  : {len(low_ai_usage)} Devs")
+
+    return {"high_ai_usage": high_ai_usage, "low_ai_usage": low_ai_usage}
+
+
+def f6(data, select):
+    # F6 – High Errors / Low Errors
+    df = data.df
+
+    print("\n[F6] High Errors / Low Errors (Errors)")
+
+    # Seuil choisi : médiane du nombre d'erreurs
+    errors_median = data.stat("Errors", "median")
+    print(f"  Median Errors = {errors_median:.2f}")
+
+    high_errors = select(df["Errors"] >= errors_median, "high_errors")
+    low_errors = select(df["Errors"] < errors_median, "low_errors")
+
+    print(f"  High Errors (>= médiane) : {len(high_errors)} Devs")
+    print(f"  Low Errors  (< médiane)  : {len(low_errors)} Devs")
+
+    return {"high_errors": high_errors, "low_errors": low_errors}
+
+
+def f7(data, select):
+    # F7 – High Coffee / Low Coffee
+    df = data.df
+
+    print("\n[F7] High Coffee / Low Coffee (Coffee_Intake)")
+
+    # Seuil = médiane de la consommation de café
+    coffee_median = data.stat("Coffee_Intake", "median")
+    print(f"  Median Coffee_Intake = {coffee_median:.2f}")
+
+    high_coffee = select(df["Coffee_Intake"] >= coffee_median, "high_coffee")
+    low_coffee = select(df["Coffee_Intake"] < coffee_median, "low_coffee")
+
+    print(f"  High Coffee (>= médiane) : {len(high_coffee)} Devs")
+    print(f"  Low Coffee  (< médiane)  : {len(low_coffee)} Devs")
+
+    return {"high_coffee": high_coffee, "low_coffee": low_coffee}
+
+
+FILTERS = {"F1": f1, "F2": f2, "F3": f3, "F4": f4, "F5": f5, "F6": f6, "F7": f7}
@@ -0,0 +1,252 @@
+"""
+Benchmark reproductible du pipeline d'analyse (Main.Data) et du pipeline ML
+(MachineLearning/candidates.py) sur des CSV synthétiques de 1K à 100M lignes.
+
+Pour chaque taille, un CSV est généré une fois par synthetic.py (même seed =
+même fichier, gardé dans --data-dir), puis mesuré dans un processus séparé
+(pic de RSS propre à la taille) :
+
+    load, clean, group (G1-G8), render (figures), filter (F1-F7), corr,
+    train / predict (un modèle par ligne du rapport, sur au plus --ml-rows lignes)
+
+Au-delà de --stream-above lignes, le CSV ne tient plus en mémoire : l'analyse passe par
+le mode streaming de Data (un seul passage load + clean + group + corr, "stream").
+
+Le résultat (JSON) peut être comparé à une référence : une étape plus lente que
+la référence de plus de --tolerance est signalée et le code de sortie vaut 1.
+
+Usage :
+    python benchmark.py --sizes 1e3 1e4 1e5 1e6 --out bench/current.json
+    python benchmark.py --sizes 1e3 1e4 1e5 --baseline bench/main.json
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ML_DIR = os.path.join(HERE, "MachineLearning")
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+# SVR est quadratique en nombre de lignes : exclu par défaut
+DEFAULT_MODELS = ["DecisionTree", "RandomForest", "HistGradientBoosting", "KNN"]
+TARGET = "Task_Success_Rate"
+
+
+def dataset(size, seed, data_dir):
+    # CSV synthétique de size lignes, généré une seule fois par (size, seed)
+    import synthetic
+
+    os.makedirs(data_dir, exist_ok=True)
+    # VERSION dans le nom : un CSV d'une version précédente du générateur n'est pas réutilisé
+    path = os.path.join(data_dir, f"synthetic_{size}_s{seed}_v{synthetic.VERSION}.csv")
+    if not os.path.exists(path):
+        start = time.perf_counter()
+        synthetic.write_csv(path, size, seed)
+        print(f"  generated {path} in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    return path
+
+
+def bench_analysis(path, size, stream_above, workers):
+    import analyses
+    import profiling
+    import rendering
+    from Main import Data
+
+    stage = profiling.stage
+    if size > stream_above:
+        with stage("stream", rows=size):
+            data = Data(path, chunksize=1_000_000)
+            data.stream_analysis()
+        return
+
+    with stage("load", rows=size):
+        data = Data(path)
+    rows = len(data.df)
+    with stage("clean", rows=rows):
+        # Même règle que Main.py : nettoyage en place, doublons gardés pour les analyses
+        data.clean_data()
+    specs = []
+    with stage("group", rows=rows):
+        for run in analyses.GROUPINGS.values():
+            run(data, specs.append)
+    with stage("render"):
+        rendering.render_all(specs, "figures", workers=workers)
+    with stage("filter", rows=rows):
+        data.filtering(lazy=True)
+    with stage("corr", rows=rows):
+        data.matrix_correlation(False)
+
+
+def bench_ml(path, ml_rows, models, seed):
+    import numpy as np
+    import pandas as pd
+    from sklearn.metrics import r2_score
+    from sklearn.model_selection import train_test_split
+
+    import profiling
+    from schema import NUMERIC_COLS
+
+    sys.path.insert(0, ML_DIR)
+    from candidates import PreparedSplit, make_models, make_preprocess, wrap_regressor
+
+    # Données nettoyées comme pour l'entraînement réel (colonnes numériques, cible connue)
+    df = pd.read_csv(path, nrows=ml_rows)
+    df = df.apply(pd.to_numeric, errors="coerce").dropna(subset=[TARGET])
+    features = [col for col in NUMERIC_COLS if col != TARGET]
+    X_train, X_test, y_train, y_test = train_test_split(
+        df[features], df[TARGET], test_size=0.2, random_state=seed)
+    split = PreparedSplit(make_preprocess(features), X_train, y_train, X_test, y_test)
+
+    scores = {}
+    candidates = make_models()
+    for name in models:
+        reg = wrap_regressor(name, candidates[name])
+        train, test = split.arrays(name)
+        with profiling.stage(f"train:{name}", rows=len(train)):
+            reg.fit(train, split.y_train)
+        with profiling.stage(f"predict:{name}", rows=len(test)):
+            pred = reg.predict(test)
+        scores[name] = float(r2_score(split.y_test, np.asarray(pred)))
+    return scores
+
+
+def run_one(size, args):
+    """Mesure une taille dans le processus courant ; retourne {stages, r2}."""
+    import profiling
+
+    path = os.path.abspath(dataset(size, args.seed, args.data_dir))
+    profiling.enable()
+    scores = {}
+    # Dossier de travail jetable : figures/ et correlation_matrix.csv n'écrasent pas ceux du projet
+    with tempfile.TemporaryDirectory() as scratch, open(os.devnull, "w") as devnull:
+        cwd = os.getcwd()
+        os.chdir(scratch)
+        try:
+            with contextlib.redirect_stdout(devnull):
+                bench_analysis(path, size, args.stream_above, args.workers)
+                if args.models:
+                    scores = bench_ml(path, min(size, args.ml_rows), args.models, args.seed)
+        finally:
+            os.chdir(cwd)
+    # Seules les étapes du benchmark (premier niveau) ; les sous-étapes restent dans profiling
+    stages = [r for r in profiling.PROFILER.records if r["depth"] == 0]
+    return {"size": size, "stages": stages, "r2": scores}
+
+
+def environment():
+    import numpy as np
+    import pandas as pd
+    import sklearn
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE,
+                                capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "python": platform.python_version(), "numpy": np.__version__, "pandas": pd.__version__,
+        "sklearn": sklearn.__version__, "machine": platform.machine(), "cpus": os.cpu_count(),
+        "commit": commit, "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+def compare(current, baseline, tolerance, min_seconds=0.05):
+    """
+    Lignes (taille, étape, temps, référence, ratio, drapeau) et nombre de régressions.
+    Les étapes plus courtes que min_seconds des deux côtés ne sont pas signalées (bruit de mesure).
+    """
+    reference = {(r["size"], s["stage"]): s["wall_s"] for r in baseline["results"] for s in r["stages"]}
+    lines, regressions = [], 0
+    for result in current["results"]:
+        for s in result["stages"]:
+            base = reference.get((result["size"], s["stage"]))
+            ratio = s["wall_s"] / base if base else None
+            flag = ""
+            if ratio is not None and max(s["wall_s"], base) < min_seconds:
+                pass
+            elif ratio is not None and ratio > 1 + tolerance:
+                flag = "REGRESSION"
+                regressions += 1
+            elif ratio is not None and ratio < 1 - tolerance:
+                flag = "faster"
+            lines.append((result["size"], s["stage"], s["wall_s"], base, ratio, flag))
+    return lines, regressions
+
+
+def format_report(current, comparison=None):
+    out = [f"{'size':>11} {'stage':<30} {'wall_s':>9} {'rows/s':>12} {'rss_mb':>8}"
+           + (f" {'base_s':>9} {'ratio':>6}" if comparison else "")]
+    ref = {(size, stage): (base, ratio, flag) for size, stage, _, base, ratio, flag in comparison or []}
+    for result in current["results"]:
+        for s in result["stages"]:
+            rate = f"{s['rows_per_s']:,.0f}" if s["rows_per_s"] else ""
+            rss = f"{s['rss_peak_mb']:.0f}" if s["rss_peak_mb"] is not None else ""
+            line = f"{result['size']:>11,} {s['stage']:<30} {s['wall_s']:>9.3f} {rate:>12} {rss:>8}"
+            if comparison:
+                base, ratio, flag = ref.get((result["size"], s["stage"]), (None, None, ""))
+                line += f" {base:>9.3f} {ratio:>6.2f} {flag}" if base else f" {'':>9} {'':>6}"
+            out.append(line)
+        if result["r2"]:
+            out.append(f"{'':>11} R2 " + ", ".join(f"{k}={v:.3f}" for k, v in result["r2"].items()))
+    return "\n".join(out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark des pipelines d'analyse et de ML")
+    size = lambda s: int(float(s))
+    parser.add_argument("--sizes", nargs="+", type=size, default=DEFAULT_SIZES, help="lignes (1e6 accepté)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--data-dir", default=os.path.join(HERE, "bench", "data"), help="CSV générés")
+    parser.add_argument("--out", default=None, help="résultats JSON (défaut : bench/results_<date>.json)")
+    parser.add_argument("--baseline", default=None, help="résultats JSON de référence à comparer")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="écart relatif toléré (0.25 = +25 %%)")
+    parser.add_argument("--min-seconds", type=float, default=0.05, help="étapes plus courtes ignorées")
+    parser.add_argument("--models", nargs="*", default=DEFAULT_MODELS, help="modèles ML (aucun = pas de ML)")
+    parser.add_argument("--ml-rows", type=size, default=100_000,
+                        help="lignes max pour train / predict (RandomForest : ~5 min à 100K sur un cœur)")
+    parser.add_argument("--stream-above", type=size, default=20_000_000, help="mode streaming au-delà")
+    parser.add_argument("--workers", type=int, default=None, help="processus pour le rendu des figures")
+    parser.add_argument("--one", type=size, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.one is not None:
+        # Processus fils : une seule taille, résultat JSON sur stdout
+        print(json.dumps(run_one(args.one, args)))
+        return 0
+
+    forwarded = list(argv if argv is not None else sys.argv[1:])
+    current = {"environment": environment(), "seed": args.seed, "results": []}
+    for n in args.sizes:
+        print(f"size {n:,}", file=sys.stderr)
+        dataset(n, args.seed, args.data_dir)
+        proc = subprocess.run([sys.executable, os.path.abspath(__file__), *forwarded, "--one", str(n)],
+                              capture_output=True, text=True)
+        if proc.returncode != 0:
+            sys.stderr.write(proc.stderr)
+            raise SystemExit(f"benchmark failed at size {n}")
+        current["results"].append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+    out = args.out or os.path.join(HERE, "bench", f"results_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(current, f, indent=1)
+
+    comparison, regressions = None, 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            comparison, regressions = compare(current, json.load(f), args.tolerance, args.min_seconds)
+    print(format_report(current, comparison))
+    print("Results:", out)
+    if regressions:
+        print(f"{regressions} stage(s) slower than the baseline by more than {args.tolerance:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, HERE)
+    raise SystemExit(main())
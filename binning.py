@@ -0,0 +1,107 @@
+"""
+Moteur de découpage (binning) vectorisé pour les groupements G1 à G8.
+
+Chaque découpage est déclaré une seule fois (seuils + labels) et appliqué
+à toute la colonne en NumPy, sans appel Python par ligne comme Series.apply.
+Les labels sont ceux de Main.py ("<5h", "5–7h", ">7h", "0–4h", ...).
+"""
+import numpy as np
+import pandas as pd
+
+
+class Binning:
+    """
+    Équivalent vectorisé d'une chaîne if / elif / else sur des seuils croissants.
+
+    closed[i] vaut "<" ou "<=" : la condition i est (x < edges[i]) ou (x <= edges[i]).
+    Le label i est attribué à la première condition vraie, le dernier label sinon
+    (y compris pour NaN, comme la fonction Python d'origine).
+    """
+
+    def __init__(self, column, name, edges, closed, labels):
+        if len(labels) != len(edges) + 1 or len(closed) != len(edges):
+            raise ValueError(f"{name} : il faut len(edges) + 1 labels et un opérateur par seuil")
+        self.column = column
+        self.name = name
+        self.edges = list(edges)
+        self.closed = list(closed)
+        self.labels = list(labels)
+
+    def codes(self, values):
+        # code = nombre de conditions fausses avant la première vraie (seuils croissants)
+        x = np.asarray(values, dtype=float)
+        codes = np.zeros(len(x), dtype=np.int8)
+        for edge, op in zip(self.edges, self.closed):
+            hit = x <= edge if op == "<=" else x < edge
+            codes += ~hit
+        return codes
+
+    def apply(self, values):
+        # Catégorielle ordonnée comme la déclaration (et non par ordre alphabétique)
+        return pd.Categorical.from_codes(self.codes(values), categories=self.labels)
+
+    def assign(self, df):
+        df[self.name] = self.apply(df[self.column].to_numpy())
+        return df
+
+
+class ThresholdSplit:
+    """
+    Découpage en deux groupes autour d'un seuil fixe ou calculé sur la colonne
+    (stat = "median" ou "mean"). labels = (label si vrai, label si faux) ;
+    (True, False) donne une colonne booléenne comme High_Stress.
+    """
+
+    def __init__(self, column, name, op, labels=(True, False), threshold=None, stat=None):
+        self.column = column
+        self.name = name
+        self.op = op
+        self.labels = labels
+        self.threshold = threshold
+        self.stat = stat
+
+    def compute_threshold(self, series):
+        # Seuil calculé en float64 même sur une colonne compacte (float32)
+        series = series.astype(np.float64)
+        if self.stat == "median":
+            return series.median()
+        if self.stat == "mean":
+            return series.mean()
+        return self.threshold
+
+    def apply(self, values, threshold):
+        x = np.asarray(values, dtype=float)
+        hit = x >= threshold if self.op == ">=" else x > threshold
+        yes, no = self.labels
+        if yes is True and no is False:
+            return hit
+        return pd.Categorical.from_codes(np.where(hit, 0, 1).astype(np.int8), categories=[yes, no])
+
+    def assign(self, df, threshold=None):
+        # Si le seuil n'est pas fourni il est calculé sur la colonne (médiane / moyenne)
+        if threshold is None:
+            threshold = self.compute_threshold(df[self.column])
+        df[self.name] = self.apply(df[self.column].to_numpy(), threshold)
+        return threshold
+
+
+# ---------- Découpages utilisés par G1 à G8 ----------
+
+SLEEP_GROUP = Binning("Sleep_Hours", "Sleep_Group", [5, 7], ["<", "<="], ["<5h", "5–7h", ">7h"])
+CODING_HOURS_GROUP = Binning("Hours_Coding", "Coding_Hours_Group", [4, 8], ["<", "<="], ["0–4h", "4–8h", ">8h"])
+
+HIGH_STRESS_70 = ThresholdSplit("Stress_Level", "High_Stress", ">", threshold=70)
+HIGH_STRESS_MEAN = ThresholdSplit("Stress_Level", "High_Stress", ">", stat="mean")
+HIGH_AI_USAGE = ThresholdSplit("AI_Usage_Hours", "High_AI_Usage", ">=", ("High_AI_Usage", "Low_AI_Usage"), stat="median")
+HIGH_AI_USAGE_BOOL = ThresholdSplit("AI_Usage_Hours", "High_AI_Usage_Bool", ">", stat="mean")
+HIGH_COFFEE = ThresholdSplit("Coffee_Intake", "High_Coffee", ">=", ("High_Coffee", "Low_Coffee"), stat="median")
+HIGH_SUCCESS = ThresholdSplit("Task_Success_Rate", "High_Success", ">=", stat="median")
+
+# Découpages par nom de colonne (clés de partition possibles pour output.write_frame)
+BINNINGS = {rule.name: rule for rule in (SLEEP_GROUP, CODING_HOURS_GROUP)}
+
+# Colonnes comparées à un seuil (découpages ci-dessus et filtres F1 à F7 de analyses.py) :
+# gardées en float64 par compact.optimize_dtypes
+THRESHOLD_COLUMNS = frozenset([rule.column for rule in (
+    SLEEP_GROUP, CODING_HOURS_GROUP, HIGH_STRESS_70, HIGH_STRESS_MEAN,
+    HIGH_AI_USAGE, HIGH_AI_USAGE_BOOL, HIGH_COFFEE, HIGH_SUCCESS)] + ["Errors"])
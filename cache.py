@@ -0,0 +1,103 @@
+"""
+Cache des agrégations (groupby et statistiques de colonnes) partagé par
+G1 à G8 et filtering.
+
+Une entrée est valide tant que les colonnes utilisées n'ont pas changé.
+Le contenu des colonnes n'est pas relu (le hacher coûterait plus cher que
+le groupby lui-même) : chaque colonne a un numéro de version, et l'entrée
+retient les versions de ses colonnes au moment du calcul. Les versions
+sont incrémentées explicitement :
+  - invalidate()      : toutes les colonnes (Data.df réaffectée, clean_data)
+  - touch(*columns)   : seulement ces colonnes (analyses.derive)
+Une modification de data.df faite ailleurs (df[col] = ..., df.loc[...] = ...)
+doit donc être suivie de data.cache.touch(col) ou data.cache.invalidate().
+"""
+import numpy as np
+
+
+class AggregationCache:
+    """
+    groupby(keys)[values].agg(agg) et Series.agg(stat) mémoïsés.
+    Une entrée groupby est partagée par toutes les colonnes de valeurs :
+    demander ["Task_Success_Rate"] après ["Task_Success_Rate", "Errors"]
+    ne relance pas de groupby.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self.columns = {}
+        self.groups = {}
+        self.stats = {}
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate(self):
+        # Toutes les colonnes ont pu changer : on vide tout le cache
+        self.version += 1
+        self.columns.clear()
+        self.groups.clear()
+        self.stats.clear()
+
+    def touch(self, *columns):
+        # Ces colonnes ont changé : les entrées qui les utilisent deviennent obsolètes
+        for col in columns:
+            self.columns[col] = self.columns.get(col, 0) + 1
+
+    def column_version(self, col):
+        return self.version, self.columns.get(col, 0)
+
+    def _versions(self, columns):
+        return {col: self.column_version(col) for col in columns}
+
+    @staticmethod
+    def _same(entry_versions, versions, columns):
+        return all(entry_versions.get(col) == versions[col] for col in columns)
+
+    def groupby(self, df, keys, values, agg="mean", **kwargs):
+        single = isinstance(values, str)
+        keys = [keys] if isinstance(keys, str) else list(keys)
+        values = [values] if single else list(values)
+        cache_key = (tuple(keys), agg, tuple(sorted(kwargs.items())))
+
+        entry = self.groups.get(cache_key)
+        known = [] if entry is None else [col for col in entry["result"].columns if col not in values]
+        versions = self._versions(keys + values + known)
+        if entry is not None and not self._same(entry["versions"], versions, keys):
+            # Une colonne de groupement a changé : toute l'entrée est obsolète
+            entry = None
+        if entry is not None:
+            # On oublie les colonnes de valeurs modifiées depuis le calcul
+            stale = [col for col in entry["result"].columns if not self._same(entry["versions"], versions, [col])]
+            if stale:
+                entry["result"] = entry["result"].drop(columns=stale)
+
+        missing = [col for col in values if entry is None or col not in entry["result"].columns]
+        if missing:
+            self.misses += 1
+            computed = df.groupby(keys, **kwargs)[missing].agg(agg)
+            # Colonnes compactées en float32 : résultats remontés en float64 (affichage, arrondis)
+            computed = computed.astype({col: np.float64 for col in computed.columns if computed[col].dtype == np.float32})
+            if entry is None:
+                entry = {"versions": {}, "result": computed}
+                self.groups[cache_key] = entry
+            else:
+                entry["result"] = entry["result"].join(computed)
+            entry["versions"].update(versions)
+        else:
+            self.hits += 1
+
+        result = entry["result"]
+        return result[values[0]] if single else result[values]
+
+    def stat(self, series, how):
+        # Statistique d'une colonne (median, mean, ...) mémoïsée
+        cache_key = (series.name, how)
+        version = self.column_version(series.name)
+        entry = self.stats.get(cache_key)
+        if entry is not None and entry[0] == version:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        value = (series.astype(np.float64) if series.dtype == np.float32 else series).agg(how)
+        self.stats[cache_key] = (version, value)
+        return value
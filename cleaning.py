@@ -0,0 +1,61 @@
+"""
+Noyau de nettoyage "fusionné" pour Data.clean_data(fused=True).
+
+Les colonnes numériques sont traitées comme une seule matrice float64 :
+conversion, négatifs -> NaN, remplacement par la moyenne, calcul des
+2 x 13 quantiles en un appel np.nanquantile(axis=0), puis clip en place.
+"""
+import numpy as np
+import pandas as pd
+
+from schema import CLIP_LOWER, CLIP_UPPER
+
+
+def numeric_matrix(df, columns):
+    # Conversion en float64 ; pd.to_numeric seulement pour les colonnes non numériques
+    blocks = []
+    for col in columns:
+        values = df[col]
+        if not pd.api.types.is_numeric_dtype(values):
+            values = pd.to_numeric(values, errors="coerce")
+        blocks.append(values.to_numpy(dtype=np.float64, na_value=np.nan))
+    return np.column_stack(blocks) if blocks else np.empty((len(df), 0))
+
+
+def fused_clean(df, columns, stats=None):
+    """
+    Nettoie en place les colonnes `columns` de df et retourne les statistiques
+    utilisées (DataFrame indexée par colonne : mean, q01, q99).
+
+    Si `stats` est fourni (par exemple calculé sur tout le fichier en streaming),
+    la moyenne et les bornes ne sont pas recalculées.
+    """
+    columns = [col for col in columns if col in df.columns]
+    X = numeric_matrix(df, columns)
+
+    # Négatifs -> NaN (comparaison avec NaN = False, pas d'avertissement)
+    with np.errstate(invalid="ignore"):
+        X[X < 0] = np.nan
+
+    if stats is None:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            count = (~np.isnan(X)).sum(axis=0)
+            means = np.where(count > 0, np.nansum(X, axis=0) / np.maximum(count, 1), np.nan)
+    else:
+        means = stats.loc[columns, "mean"].to_numpy(dtype=np.float64)
+
+    # Remplacement des NaN par la moyenne de leur colonne
+    rows, cols = np.nonzero(np.isnan(X))
+    X[rows, cols] = means[cols]
+
+    if stats is None:
+        # Les 26 quantiles en un seul appel vectorisé
+        bounds = np.nanquantile(X, [CLIP_LOWER, CLIP_UPPER], axis=0)
+        stats = pd.DataFrame({"mean": means, "q01": bounds[0], "q99": bounds[1]}, index=columns)
+    else:
+        bounds = stats.loc[columns, ["q01", "q99"]].to_numpy(dtype=np.float64).T
+
+    np.clip(X, bounds[0], bounds[1], out=X)
+
+    df[columns] = X
+    return stats
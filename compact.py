@@ -0,0 +1,100 @@
+"""
+Optimisation des dtypes (mode compact de Data).
+
+Les colonnes du schéma (schema.COLUMN_KINDS) sont converties vers le plus
+petit dtype qui contient toutes leurs valeurs : int8 / int16 / int32 pour les
+colonnes entières sans NaN, float32 sinon. Les colonnes texte peu variées
+(labels de groupes) deviennent des catégorielles.
+
+Exception : les colonnes découpées par binning.py (seuils fixes, médiane ou
+moyenne) restent en float64 si elles ne sont pas entières. Arrondie en float32,
+une valeur proche d'un seuil (borne q99 du nettoyage, moyenne de remplacement)
+peut changer de côté, et donc de groupe.
+"""
+import numpy as np
+import pandas as pd
+
+from binning import THRESHOLD_COLUMNS
+from schema import COLUMN_KINDS
+
+INT_TYPES = [np.int8, np.int16, np.int32]
+
+# Une colonne texte devient catégorielle si elle a moins de 50 % de valeurs distinctes
+CATEGORY_RATIO = 0.5
+
+
+def smallest_int(lo, hi):
+    for dtype in INT_TYPES:
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return dtype
+    return np.int64
+
+
+def compact_series(series, kind=None, exact=False):
+    # exact=True : pas de float32 (valeurs comparées à des seuils), seulement des entiers réduits
+    if isinstance(series.dtype, pd.CategoricalDtype) or pd.api.types.is_bool_dtype(series):
+        return series
+    if not pd.api.types.is_numeric_dtype(series):
+        if len(series) and series.nunique(dropna=False) < CATEGORY_RATIO * len(series):
+            return series.astype("category")
+        return series
+
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    finite = values[~np.isnan(values)]
+    integral = len(finite) == len(values) and np.array_equal(finite, np.round(finite))
+    if kind != "float" and integral and len(values):
+        return series.astype(smallest_int(finite.min(), finite.max()))
+    if kind is None and series.dtype.kind in "iu":
+        return series
+    if exact:
+        return series if series.dtype == np.float64 else series.astype(np.float64)
+    # float32 : entiers exacts jusqu'à 2**24, ~7 chiffres significatifs sinon
+    return series.astype(np.float32)
+
+
+def optimize_dtypes(df, kinds=COLUMN_KINDS):
+    """
+    Convertit en place les colonnes de df vers des dtypes compacts.
+    Retourne (octets avant, octets après).
+    """
+    before = int(df.memory_usage(deep=True).sum())
+    for col in df.columns:
+        kind = kinds.get(col)
+        # Les colonnes hors schéma ne sont touchées que si elles sont texte ou déjà entières
+        if kind is None and df[col].dtype.kind == "f":
+            continue
+        compacted = compact_series(df[col], kind, exact=col in THRESHOLD_COLUMNS)
+        if compacted is not df[col]:
+            df[col] = compacted
+    after = int(df.memory_usage(deep=True).sum())
+    return before, after
+
+
+def read_compact(path, chunksize=1_000_000, kinds=COLUMN_KINDS):
+    """
+    Lit le CSV par chunks et compacte chaque chunk avant de le garder :
+    le pic mémoire est la taille compacte + un chunk, pas le CSV en float64.
+    Les valeurs non numériques des colonnes du schéma deviennent NaN
+    (étape 2 de clean_data, faite dès le chargement).
+    Retourne (df, octets avant, octets après).
+    """
+    parts = []
+    before = 0
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        for col in kinds:
+            if col in chunk.columns and not pd.api.types.is_numeric_dtype(chunk[col]):
+                chunk[col] = pd.to_numeric(chunk[col], errors="coerce")
+        chunk_before, _ = optimize_dtypes(chunk, kinds)
+        before += chunk_before
+        parts.append(chunk)
+    df = pd.concat(parts, ignore_index=True) if parts else pd.read_csv(path)
+    # Les chunks n'ont pas forcément le même dtype : on recompacte une fois assemblés
+    _, after = optimize_dtypes(df, kinds)
+    return df, before, after
+
+
+def format_report(before, after):
+    saved = before - after
+    ratio = 100 * saved / before if before else 0
+    return f"Memory: {before / 1e6:.2f} MB -> {after / 1e6:.2f} MB (saved {saved / 1e6:.2f} MB, {ratio:.1f}%)"
@@ -0,0 +1,90 @@
+"""
+Matrice de corrélation de Pearson incrémentale.
+
+L'accumulateur garde, pour chaque paire de colonnes (i, j), les co-moments de
+Welford calculés sur les lignes où i et j sont tous les deux présents
+(même convention que DataFrame.corr) :
+    n[i, j]     nombre de lignes complètes pour la paire
+    mean[i, j]  moyenne de x_i sur ces lignes   (mean[j, i] : celle de x_j)
+    m2[i, j]    somme des carrés des écarts de x_i sur ces lignes
+    c[i, j]     somme des produits croisés des écarts
+Un nouveau lot de lignes, ou l'état d'un autre worker, est fusionné avec les
+formules de Chan : l'historique n'est jamais relu. L'état se sauvegarde en .npz.
+"""
+import numpy as np
+import pandas as pd
+
+
+class CorrelationAccumulator:
+
+    def __init__(self, columns):
+        k = len(columns)
+        self.columns = list(columns)
+        self.n = np.zeros((k, k))
+        self.mean = np.zeros((k, k))
+        self.m2 = np.zeros((k, k))
+        self.c = np.zeros((k, k))
+
+    @classmethod
+    def from_batch(cls, columns, values):
+        """Co-moments d'un lot (matrice lignes x colonnes, NaN = valeur absente)."""
+        acc = cls(columns)
+        values = np.asarray(values, dtype=np.float64)
+        if values.size == 0:
+            return acc
+        present = ~np.isnan(values)
+        mask = present.astype(np.float64)
+        # Décalage par la moyenne de colonne du lot : limite les pertes de précision
+        counts = mask.sum(axis=0)
+        shift = np.where(present, values, 0).sum(axis=0) / np.maximum(counts, 1)
+        x = np.where(present, values - shift, 0)
+
+        n = mask.T @ mask
+        sx = x.T @ mask            # sx[i, j] = somme de x_i là où x_j est présent
+        sxx = (x * x).T @ mask
+        sxy = x.T @ x
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(n > 0, sx / n, 0)
+            acc.m2 = np.where(n > 0, sxx - n * mean ** 2, 0)
+            acc.c = np.where(n > 0, sxy - n * mean * mean.T, 0)
+        acc.n = n
+        acc.mean = np.where(n > 0, mean + shift[:, None], 0)
+        return acc
+
+    def merge(self, other):
+        if other.columns != self.columns:
+            raise ValueError("Les deux accumulateurs n'ont pas les mêmes colonnes")
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        with np.errstate(invalid="ignore", divide="ignore"):
+            w = np.where(n > 0, self.n * other.n / n, 0)
+            self.mean = np.where(n > 0, self.mean + delta * other.n / n, 0)
+        self.m2 = self.m2 + other.m2 + delta ** 2 * w
+        self.c = self.c + other.c + delta * delta.T * w
+        self.n = n
+        return self
+
+    def update(self, values):
+        # Ajoute un lot de lignes (DataFrame ou matrice dans l'ordre de self.columns)
+        if isinstance(values, pd.DataFrame):
+            values = values[self.columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        return self.merge(CorrelationAccumulator.from_batch(self.columns, values))
+
+    def corr(self):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr = self.c / np.sqrt(self.m2 * self.m2.T)
+        corr = np.where(self.n > 1, np.clip(corr, -1, 1), np.nan)
+        np.fill_diagonal(corr, np.where((np.diag(self.n) > 1) & (np.diag(self.m2) > 0), 1.0, np.nan))
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+    # ---------- Sauvegarde de l'état ----------
+
+    def save(self, path):
+        np.savez(path, columns=np.array(self.columns), n=self.n, mean=self.mean, m2=self.m2, c=self.c)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as state:
+            acc = cls([str(col) for col in state["columns"]])
+            acc.n, acc.mean, acc.m2, acc.c = state["n"], state["mean"], state["m2"], state["c"]
+        return acc
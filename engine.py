@@ -0,0 +1,89 @@
+"""
+Moteur d'analyse partagé : un seul Main.Data, chargé et nettoyé une fois,
+sur lequel on lance n'importe quel sous-ensemble des analyses G1 à G8,
+F1 à F7 et de la matrice de corrélation ("corr").
+
+Les colonnes dérivées (Sleep_Group, High_Stress, ...) et les agrégations sont
+gardées sur la DataFrame partagée : une analyse lancée après une autre
+réutilise ce qui a déjà été calculé. Les scripts de fichiers/ passent par ici.
+
+Usage : python engine.py G1 G3 F5 corr [--csv fichier.csv] [--show] [--raw]
+"""
+import argparse
+from pathlib import Path
+
+import analyses
+from Main import Data
+
+DEFAULT_CSV = Path(__file__).resolve().parent / "AI_Developer_Performance_Extended_1000.csv"
+ALL = list(analyses.GROUPINGS) + list(analyses.FILTERS) + ["corr"]
+
+
+class AnalysisEngine:
+
+    def __init__(self, path=DEFAULT_CSV, clean=True, cache=False, compact=False):
+        # cache / compact : voir Main.Data (cache disque de la version nettoyée, dtypes réduits)
+        self.data = Data(str(path), cache=cache, compact=compact)
+        if clean:
+            # Même règle que Main.py (group, all, streaming) : nettoyage en place, doublons gardés
+            self.data.clean_data()
+
+    @property
+    def df(self):
+        return self.data.df
+
+    def run(self, names=None, show=False, workers=None, lazy=False):
+        """
+        Lance les analyses names (par ex. ["G1", "G6", "F5", "corr"], None = toutes)
+        dans l'ordre G, F puis corr. Retourne {nom: résultat} : tableau de moyennes
+        pour G*, dictionnaire des sélections pour F*, matrice arrondie pour corr.
+        show=False : figures enregistrées dans figures/ sans être affichées.
+        """
+        names = ALL if names is None else list(names)
+        unknown = [name for name in names if name not in ALL]
+        if unknown:
+            raise ValueError(f"Analyses inconnues : {unknown} (disponibles : {ALL})")
+
+        results = {}
+        groupings = [name for name in names if name in analyses.GROUPINGS]
+        if groupings:
+            results.update(self.data.grouping_visualization(show=show, workers=workers, names=groupings))
+        for name in analyses.select(analyses.FILTERS, [name for name in names if name in analyses.FILTERS]):
+            results[name] = self.data.filtering(lazy=lazy, names=[name])
+        if "corr" in names:
+            results["corr"] = self.data.matrix_correlation(True, show=show)
+        return results
+
+
+# Un moteur par (CSV, nettoyage) pour tout le processus
+_engines = {}
+
+
+def get_engine(path=DEFAULT_CSV, clean=True):
+    key = (str(Path(path).resolve()), clean)
+    if key not in _engines:
+        _engines[key] = AnalysisEngine(path, clean=clean)
+    return _engines[key]
+
+
+def run(names=None, path=DEFAULT_CSV, clean=True, show=True, workers=None):
+    # Raccourci pour les scripts : moteur partagé puis engine.run(names)
+    return get_engine(path, clean).run(names, show=show, workers=workers)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Lance un sous-ensemble des analyses G1-G8, F1-F7, corr")
+    parser.add_argument("names", nargs="*", metavar="NAME", help=f"parmi {' '.join(ALL)} (défaut : toutes)")
+    parser.add_argument("--csv", default=DEFAULT_CSV, help="fichier CSV (défaut : le dataset du projet)")
+    parser.add_argument("--show", action="store_true", help="afficher les figures (sinon seulement enregistrées)")
+    parser.add_argument("--raw", action="store_true", help="ne pas nettoyer les données avant les analyses")
+    parser.add_argument("--workers", type=int, default=None, help="processus pour rendre les figures")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.names if name not in ALL]
+    if unknown:
+        parser.error(f"analyses inconnues : {' '.join(unknown)}")
+    run(args.names or None, args.csv, clean=not args.raw, show=args.show, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
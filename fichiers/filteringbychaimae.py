@@ -1,18 +1,18 @@
-import pandas as pd
+# High_Coffee : sauvegarde du dataset avec la colonne High_Coffee (seuil = médiane)
+import racine
+import analyses
+import binning
+from engine import get_engine
 
-# 1) Lire le CSV
-df = pd.read_csv("AI_Developer_Performance_Extended_1000.csv")
+# High_Coffee si Coffee_Intake > médiane, Low_Coffee sinon (<= médiane).
+# Comparaison stricte, contrairement à G5 / F7 (binning.HIGH_COFFEE, >= médiane)
+HIGH_COFFEE_STRICT = binning.ThresholdSplit("Coffee_Intake", "High_Coffee", ">",
+                                            ("High_Coffee", "Low_Coffee"), stat="median")
 
-# 2) Médiane de Coffee_Intake
-med = df["Coffee_Intake"].median()
+engine = get_engine()
+med = analyses.derive(engine.data, HIGH_COFFEE_STRICT)
 
-# 3) Créer High_Coffee (Low si <= médiane, High si > médiane)
-df["High_Coffee"] = df["Coffee_Intake"].apply(
-    lambda x: "High_Coffee" if x > med else "Low_Coffee"
-)
-
-# 4) Sauvegarder
-df.to_csv("data_with_high_coffee.csv", index=False)
+engine.df.to_csv("data_with_high_coffee.csv", index=False)
 
 print("Median Coffee_Intake =", med)
-print("Saved: data_with_high_coffee.csv")
\ No newline at end of file
+print("Saved: data_with_high_coffee.csv")
@@ -0,0 +1,11 @@
+"""
+Rend importables depuis fichiers/ les modules de la racine du projet
+(engine.py, analyses.py, binning.py, ...) : chaque script commence par
+"import racine" avant d'importer le moteur partagé.
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
@@ -0,0 +1,90 @@
+"""
+Filtres F1 à F7 sans copie : vues légères sur les lignes de Data.df.
+
+Un RowFilter garde le masque des lignes sous forme de bitset (1 bit par ligne,
+np.packbits) et une référence vers la DataFrame, sans en copier les données.
+Le nombre de lignes est calculé une fois à la création (len() en O(1)),
+les filtres se combinent bit à bit (&, |, ^, -, ~) et la DataFrame filtrée
+n'est construite que sur demande avec frame().
+"""
+import numpy as np
+
+# Nombre de bits à 1 pour chaque octet (popcount par table)
+POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+class RowFilter:
+
+    def __init__(self, df, mask, name=None):
+        mask = np.asarray(mask, dtype=bool)
+        if len(mask) != len(df):
+            raise ValueError("Le masque doit avoir une valeur par ligne de la DataFrame")
+        self.df = df
+        self.name = name
+        self.n = len(mask)
+        self.bits = np.packbits(mask)
+        self.count = int(np.count_nonzero(mask))
+
+    @classmethod
+    def from_bits(cls, df, bits, name=None):
+        view = cls.__new__(cls)
+        view.df = df
+        view.name = name
+        view.n = len(df)
+        view.bits = bits
+        view.count = int(POPCOUNT[bits].sum(dtype=np.int64))
+        return view
+
+    # ---------- Accès aux lignes ----------
+
+    def __len__(self):
+        return self.count
+
+    def mask(self):
+        return np.unpackbits(self.bits, count=self.n).astype(bool)
+
+    def index(self):
+        # Positions (0-based) des lignes retenues
+        return np.flatnonzero(self.mask())
+
+    def frame(self, columns=None):
+        """Matérialise la DataFrame filtrée (éventuellement sur quelques colonnes)."""
+        rows = self.index()
+        if columns is None:
+            return self.df.iloc[rows]
+        return self.df[columns].iloc[rows]
+
+    # ---------- Algèbre des filtres ----------
+
+    def _check(self, other):
+        if other.df is not self.df:
+            raise ValueError("Les deux filtres doivent porter sur la même DataFrame")
+
+    def _combine(self, other, op, symbol):
+        self._check(other)
+        return RowFilter.from_bits(self.df, op(self.bits, other.bits), f"({self.name} {symbol} {other.name})")
+
+    def __and__(self, other):
+        return self._combine(other, np.bitwise_and, "&")
+
+    def __or__(self, other):
+        return self._combine(other, np.bitwise_or, "|")
+
+    def __xor__(self, other):
+        return self._combine(other, np.bitwise_xor, "^")
+
+    def __sub__(self, other):
+        # Lignes de self qui ne sont pas dans other
+        self._check(other)
+        return RowFilter.from_bits(self.df, self.bits & ~other.bits, f"({self.name} - {other.name})")
+
+    def __invert__(self):
+        bits = ~self.bits
+        # Les bits de remplissage du dernier octet doivent rester à 0
+        extra = len(bits) * 8 - self.n
+        if extra:
+            bits[-1] &= np.uint8(0xFF << extra & 0xFF)
+        return RowFilter.from_bits(self.df, bits, f"~{self.name}")
+
+    def __repr__(self):
+        return f"RowFilter({self.name}: {self.count}/{self.n} rows)"
@@ -0,0 +1,115 @@
+"""
+Cache disque colonnaire de la DataFrame nettoyée.
+
+La version nettoyée est enregistrée à côté du CSV source, dans
+.<nom du csv>.cache/<clé>/, une colonne par fichier .npy. Au lancement suivant
+les colonnes sont relues par np.load(mmap_mode="r") : pas de parsing CSV et pas
+de copie, le système ne charge que les pages effectivement lues.
+
+La clé dépend de la taille et de la date de modification du CSV (ou de son
+contenu si hash_content=True) et des paramètres de nettoyage : si l'un d'eux
+change, l'ancienne entrée n'est plus utilisée. Le CSV source n'est jamais modifié.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+# À incrémenter si le format des fichiers change
+FORMAT_VERSION = 1
+# Âge au-delà duquel un dossier .tmp-* (lancement interrompu) est supprimé
+STALE_TMP_S = 3600
+
+
+def cache_dir(path):
+    folder, name = os.path.split(os.path.abspath(path))
+    return os.path.join(folder, f".{name}.cache")
+
+
+def file_digest(path, block=1 << 20):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for data in iter(lambda: f.read(block), b""):
+            digest.update(data)
+    return digest.hexdigest()
+
+
+def cache_key(path, params, hash_content=False):
+    st = os.stat(path)
+    source = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    if hash_content:
+        source = {"sha1": file_digest(path)}
+    payload = json.dumps({"source": source, "params": params, "format": FORMAT_VERSION}, sort_keys=True)
+    return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+
+def read_columns(folder):
+    """Relit un dossier écrit par write_columns (colonnes mappées en mémoire, sans copie)."""
+    with open(os.path.join(folder, "meta.json"), encoding="utf-8") as f:
+        meta = json.load(f)
+
+    columns = {}
+    for i, col in enumerate(meta["columns"]):
+        values = np.load(os.path.join(folder, f"{i}.npy"), mmap_mode="r")
+        categories = meta["categories"].get(col)
+        if categories is not None:
+            values = pd.Categorical.from_codes(values, categories=categories)
+        columns[col] = values
+    # copy=False : les colonnes restent des vues sur les fichiers mappés
+    return pd.DataFrame(columns, copy=False)
+
+
+def write_columns(df, folder, params=None):
+    """Écrit df dans folder (existant) : un .npy par colonne + meta.json."""
+    meta = {"columns": [str(col) for col in df.columns], "categories": {}, "params": params}
+    for i, col in enumerate(df.columns):
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            meta["categories"][str(col)] = series.cat.categories.tolist()
+            values = series.cat.codes.to_numpy()
+        elif pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+            values = series.to_numpy()
+        else:
+            # Texte : tableau unicode de largeur fixe (pas de pickle, donc mappable)
+            values = series.astype(str).to_numpy(dtype=str)
+        np.save(os.path.join(folder, f"{i}.npy"), np.ascontiguousarray(values))
+    with open(os.path.join(folder, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+
+
+def load(path, params, hash_content=False):
+    """Retourne la DataFrame en cache (colonnes mappées en mémoire) ou None."""
+    entry = os.path.join(cache_dir(path), cache_key(path, params, hash_content))
+    if not os.path.exists(os.path.join(entry, "meta.json")):
+        return None
+    return read_columns(entry)
+
+
+def store(path, df, params, hash_content=False):
+    """Enregistre df (atomiquement) et supprime les anciennes entrées du même CSV."""
+    root = cache_dir(path)
+    os.makedirs(root, exist_ok=True)
+    key = cache_key(path, params, hash_content)
+    tmp = tempfile.mkdtemp(dir=root, prefix=".tmp-")
+    write_columns(df, tmp, params)
+
+    # Une entrée n'apparaît que complète (renommage d'un dossier écrit en entier) et n'est
+    # jamais réécrite : même clé = même CSV et mêmes paramètres, donc même contenu.
+    # Un lecteur voit l'entrée entière ou pas d'entrée, jamais une moitié.
+    entry = os.path.join(root, key)
+    try:
+        os.rename(tmp, entry)
+    except OSError:
+        # Entrée déjà présente (écrite par un lancement concurrent) : on garde la sienne
+        shutil.rmtree(tmp, ignore_errors=True)
+    for name in os.listdir(root):
+        other = os.path.join(root, name)
+        # Dossier temporaire d'un autre lancement : supprimé seulement s'il est abandonné
+        if name != key and (not name.startswith(".tmp-") or time.time() - os.path.getmtime(other) > STALE_TMP_S):
+            shutil.rmtree(other, ignore_errors=True)
+    return entry
@@ -0,0 +1,153 @@
+"""
+Écriture des données nettoyées (remplace l'ancien SaveCsv).
+
+Tout passe par un fichier / dossier temporaire à côté de la destination,
+puis os.replace : un lecteur voit l'ancienne sortie ou la nouvelle, jamais
+un fichier tronqué, et le CSV source n'est jamais réécrit. Seule exception :
+une sortie en dossier (npy, partitions) qui remplace une sortie existante.
+L'ancienne est renommée de côté puis la nouvelle mise à sa place : entre ces
+deux renommages, un lecteur peut ne trouver aucune sortie (jamais une moitié),
+et un arrêt à cet instant laisse l'ancienne sortie intacte dans le dossier
+.tmp-* voisin.
+
+Formats :
+  "csv"     : texte, compressé ou non (compression="gzip", "bz2", "xz", "zip", "zstd")
+  "parquet" : colonnaire, nécessite pyarrow (ou fastparquet)
+  "npy"     : colonnaire sans dépendance, un .npy par colonne (voir frame_cache.write_columns),
+              relu par np.load(mmap_mode="r")
+
+partition_by="Sleep_Group" : un fichier par valeur de la colonne, dans
+<dest>/Sleep_Group=<valeur>/part.<ext>, pour ne relire que les groupes utiles.
+"""
+import os
+import shutil
+import tempfile
+from urllib.parse import quote, unquote
+
+import pandas as pd
+
+import frame_cache
+
+FORMATS = ("csv", "parquet", "npy")
+# Suffixe ajouté après .csv selon la compression
+CSV_SUFFIXES = {None: "", "gzip": ".gz", "bz2": ".bz2", "xz": ".xz", "zip": ".zip", "zstd": ".zst"}
+# gzip niveau 1 : ~3x plus rapide à écrire que le niveau 9 par défaut, fichier ~25 % plus gros
+GZIP_LEVEL = 1
+
+
+def default_path(source, fmt="csv", compression=None, partition_by=None):
+    # <nom>_clean.csv[.gz] / <nom>_clean.parquet / <nom>_clean_npy ; dossier <nom>_clean_by_<clé> si partitionné
+    root = os.path.splitext(source)[0] + "_clean"
+    if partition_by is not None:
+        return f"{root}_by_{partition_by}"
+    if fmt == "csv":
+        return root + ".csv" + CSV_SUFFIXES[compression]
+    if fmt == "parquet":
+        return root + ".parquet"
+    return root + "_npy"
+
+
+def _fsync(path):
+    # Données sur disque avant le renommage (sinon un crash peut laisser un fichier vide)
+    with open(path, "rb") as f:
+        os.fsync(f.fileno())
+
+
+def _write(df, path, fmt, compression):
+    # Écrit df dans path (qui n'existe pas encore : fichier ou dossier "npy")
+    if fmt == "csv":
+        if compression == "gzip":
+            compression = {"method": "gzip", "compresslevel": GZIP_LEVEL}
+        df.to_csv(path, index=False, compression=compression)
+        _fsync(path)
+    elif fmt == "parquet":
+        df.to_parquet(path, index=False, compression=compression or "snappy")
+        _fsync(path)
+    else:
+        os.mkdir(path)
+        frame_cache.write_columns(df, path)
+
+
+def part_name(fmt, compression):
+    if fmt == "csv":
+        return "part.csv" + CSV_SUFFIXES[compression]
+    if fmt == "parquet":
+        return "part.parquet"
+    return "part_npy"
+
+
+def write_frame(df, path, fmt="csv", compression=None, partition_by=None):
+    """
+    Écrit df dans path atomiquement et retourne path.
+    fmt : "csv", "parquet" ou "npy" ; compression : voir CSV_SUFFIXES (csv) ou
+    le codec parquet ; partition_by : colonne de df servant au découpage.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Format inconnu : {fmt!r} (disponibles : {FORMATS})")
+    if fmt == "csv" and compression not in CSV_SUFFIXES:
+        raise ValueError(f"Compression CSV inconnue : {compression!r} (disponibles : {list(CSV_SUFFIXES)})")
+    path = os.path.abspath(path)
+    folder = os.path.dirname(path)
+    os.makedirs(folder, exist_ok=True)
+    # Nom temporaire dans le même dossier : os.replace reste un renommage atomique
+    tmp = tempfile.mkdtemp(dir=folder, prefix=".tmp-")
+    # tmp/out : la nouvelle sortie ; tmp/old : l'ancienne, mise de côté (jamais dans out)
+    out = os.path.join(tmp, "out")
+    try:
+        if partition_by is None:
+            _write(df, out, fmt, compression)
+        else:
+            os.mkdir(out)
+            # observed=True : pas de partition vide pour une catégorie absente
+            for value, part in df.groupby(partition_by, observed=True, sort=True):
+                # Valeur encodée pour le système de fichiers ("<5h" -> "%3C5h")
+                sub = os.path.join(out, f"{partition_by}={quote(str(value), safe='')}")
+                os.mkdir(sub)
+                _write(part, os.path.join(sub, part_name(fmt, compression)), fmt, compression)
+        if os.path.isdir(out):
+            # mkdtemp crée le dossier en 0700
+            os.chmod(out, 0o755)
+        if os.path.isdir(path) or (os.path.isdir(out) and os.path.exists(path)):
+            # os.replace ne remplace pas un dossier non vide : l'ancienne sortie est d'abord
+            # renommée de côté (tmp/old, à côté de out), supprimée avec tmp une fois la nouvelle en place
+            aside = os.path.join(tmp, "old")
+            os.replace(path, aside)
+            try:
+                os.replace(out, path)
+            except OSError:
+                os.replace(aside, path)
+                raise
+        else:
+            os.replace(out, path)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return path
+
+
+def _read(path):
+    if os.path.isdir(path):
+        return frame_cache.read_columns(path)
+    if ".parquet" in os.path.basename(path):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def read_frame(path, partitions=None):
+    """
+    Relit une sortie de write_frame. Pour une sortie partitionnée,
+    partitions = liste de valeurs à relire (None = toutes).
+    """
+    path = os.path.abspath(path)
+    if not os.path.isdir(path) or os.path.exists(os.path.join(path, "meta.json")):
+        return _read(path)
+    parts = []
+    for name in sorted(os.listdir(path)):
+        _, sep, value = name.partition("=")
+        if not sep or (partitions is not None and unquote(value) not in map(str, partitions)):
+            continue
+        sub = os.path.join(path, name)
+        (file,) = os.listdir(sub)
+        parts.append(_read(os.path.join(sub, file)))
+    if not parts:
+        raise FileNotFoundError(f"Aucune partition {partitions} dans {path}")
+    return pd.concat(parts, ignore_index=True)
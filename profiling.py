@@ -0,0 +1,224 @@
+"""
+Instrumentation par étape du pipeline Data (inspect, clean, G1 à G8, F1 à F7, corr, ...).
+
+Chaque étape est mesurée par le context manager stage() ou le décorateur
+profiled() : temps réel, temps CPU, lignes traitées, pic de RSS du processus
+et, si trace_memory=True, pic d'allocation Python (tracemalloc) pendant l'étape.
+Les étapes s'imbriquent : "grouping_visualization/G3/savefig:G3_stress_by_coding.png".
+
+Désactivé par défaut (une étape coûte alors un test de booléen). Activation :
+
+    profiling.enable(trace_memory=True, cprofile_dir="prof", cprofile_stages={"clean_data", "G6"})
+    ... pipeline ...
+    profiling.save("trace.json")   # ou trace.csv
+
+ou, en ligne de commande : python Main.py all data.csv --profile trace.json [--cprofile prof [G6 ...]]
+"""
+import cProfile
+import csv
+import functools
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:
+    # Windows : pas de getrusage, le pic de RSS n'est pas mesuré
+    resource = None
+
+FIELDS = ["stage", "depth", "start_s", "wall_s", "cpu_s", "rows", "rows_per_s",
+          "rss_peak_mb", "rss_growth_mb", "alloc_peak_mb"]
+
+
+def _max_rss_mb():
+    if resource is None:
+        return None
+    # ru_maxrss est en kilo-octets sous Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class Profiler:
+
+    def __init__(self):
+        self.enabled = False
+        self.records = []
+        self.trace_memory = False
+        self.cprofile_dir = None
+        self.cprofile_stages = None
+        self._stack = []
+        self._profiling = False
+        self._t0 = time.perf_counter()
+
+    def enable(self, trace_memory=False, cprofile_dir=None, cprofile_stages=None):
+        """
+        trace_memory : mesure aussi le pic d'allocation (tracemalloc, ralentit le pipeline).
+        cprofile_dir : dossier des dumps cProfile (<étape>.prof, lisibles avec pstats / snakeviz).
+        cprofile_stages : noms (ou chemins) des étapes à profiler ; None = étapes de premier niveau.
+        """
+        self.enabled = True
+        self.records = []
+        self.trace_memory = trace_memory
+        self.cprofile_dir = cprofile_dir
+        self.cprofile_stages = set(cprofile_stages) if cprofile_stages is not None else None
+        self._t0 = time.perf_counter()
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        if cprofile_dir is not None:
+            os.makedirs(cprofile_dir, exist_ok=True)
+
+    def disable(self):
+        self.enabled = False
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def _wants_cprofile(self, name, path):
+        # Un seul cProfile actif à la fois : le premier englobant gagne
+        if self.cprofile_dir is None or self._profiling:
+            return False
+        if self.cprofile_stages is None:
+            return len(self._stack) == 1
+        return name in self.cprofile_stages or path in self.cprofile_stages
+
+    @contextmanager
+    def stage(self, name, rows=None):
+        if not self.enabled:
+            yield
+            return
+        path = "/".join([frame["name"] for frame in self._stack] + [name])
+        frame = {"name": name, "alloc_peak": 0}
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                # Le pic courant appartient à l'étape englobante avant la remise à zéro
+                self._stack[-1]["alloc_peak"] = max(self._stack[-1]["alloc_peak"], peak)
+            tracemalloc.reset_peak()
+            frame["alloc_start"] = current
+        self._stack.append(frame)
+
+        profiler = None
+        if self._wants_cprofile(name, path):
+            profiler = cProfile.Profile()
+            self._profiling = True
+            profiler.enable()
+        rss_start = _max_rss_mb()
+        cpu = time.process_time()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - start
+            cpu = time.process_time() - cpu
+            if profiler is not None:
+                profiler.disable()
+                self._profiling = False
+                profiler.dump_stats(os.path.join(self.cprofile_dir, path.replace("/", "__").replace(":", "_") + ".prof"))
+            rss_end = _max_rss_mb()
+            self._stack.pop()
+            alloc = None
+            if self.trace_memory:
+                peak = max(frame["alloc_peak"], tracemalloc.get_traced_memory()[1])
+                alloc = (peak - frame["alloc_start"]) / 2 ** 20
+                if self._stack:
+                    self._stack[-1]["alloc_peak"] = max(self._stack[-1]["alloc_peak"], peak)
+            self.records.append({
+                "stage": path,
+                "depth": len(self._stack),
+                "start_s": start - self._t0,
+                "wall_s": wall,
+                "cpu_s": cpu,
+                "rows": rows,
+                "rows_per_s": rows / wall if rows and wall > 0 else None,
+                "rss_peak_mb": rss_end,
+                "rss_growth_mb": rss_end - rss_start if rss_end is not None else None,
+                "alloc_peak_mb": alloc,
+            })
+
+    def worker_context(self):
+        # Étapes en cours et origine des temps, à transmettre à un processus worker (None si désactivé)
+        if not self.enabled:
+            return None
+        return {"stack": [frame["name"] for frame in self._stack], "t0": self._t0}
+
+    def adopt(self, context):
+        """
+        Dans un worker : les étapes suivantes sont rangées sous celles du parent
+        (context = worker_context() du parent) et self.records repart de zéro.
+        Ni tracemalloc ni cProfile dans les workers.
+        """
+        self.enabled = True
+        self.records = []
+        self.trace_memory = False
+        self.cprofile_dir = None
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._t0 = context["t0"]
+        self._stack = [{"name": name, "alloc_peak": 0} for name in context["stack"]]
+
+    def merge(self, records):
+        # Dans le parent : étapes mesurées et renvoyées par un worker
+        self.records.extend(records)
+
+    def save(self, path):
+        """Écrit la trace en JSON (une liste d'étapes) ou en CSV selon l'extension."""
+        # Ordre de début d'étape (les étapes sont enregistrées à leur fin)
+        records = sorted(self.records, key=lambda r: r["start_s"])
+        folder = os.path.dirname(os.path.abspath(path))
+        os.makedirs(folder, exist_ok=True)
+        if path.endswith(".csv"):
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=FIELDS)
+                writer.writeheader()
+                writer.writerows(records)
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(records, f, indent=1)
+        return path
+
+    def summary(self):
+        # Tableau texte des étapes, indenté selon l'imbrication
+        lines = [f"{'stage':<48} {'wall_s':>8} {'cpu_s':>8} {'rows':>9} {'rss_mb':>8} {'alloc_mb':>9}"]
+        for r in sorted(self.records, key=lambda r: r["start_s"]):
+            label = "  " * r["depth"] + r["stage"].rsplit("/", 1)[-1]
+            rows = "" if r["rows"] is None else r["rows"]
+            rss = "" if r["rss_peak_mb"] is None else f"{r['rss_peak_mb']:.0f}"
+            alloc = "" if r["alloc_peak_mb"] is None else f"{r['alloc_peak_mb']:.1f}"
+            lines.append(f"{label[:48]:<48} {r['wall_s']:>8.3f} {r['cpu_s']:>8.3f} {rows:>9} {rss:>8} {alloc:>9}")
+        return "\n".join(lines)
+
+
+# Profiler du processus, partagé par Main.Data, analyses et rendering
+PROFILER = Profiler()
+enable = PROFILER.enable
+disable = PROFILER.disable
+stage = PROFILER.stage
+save = PROFILER.save
+summary = PROFILER.summary
+
+
+# Étapes déclarées par @profiled (méthodes de Data), voir Main.main --cprofile
+METHOD_STAGES = set()
+
+
+def _frame_rows(obj):
+    # Lignes traitées par une méthode de Data : taille de self.df (None en mode streaming)
+    df = getattr(obj, "df", None)
+    return None if df is None else len(df)
+
+
+def profiled(name=None):
+    """Décorateur de méthode de Data : la méthode entière est une étape (nom de la méthode par défaut)."""
+    def decorate(method):
+        label = name or method.__name__
+        METHOD_STAGES.add(label)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not PROFILER.enabled:
+                return method(self, *args, **kwargs)
+            with PROFILER.stage(label, rows=_frame_rows(self)):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
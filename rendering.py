@@ -0,0 +1,169 @@
+"""
+Rendu des figures G1 à G8 et de la matrice de corrélation.
+
+Pendant le groupement, chaque figure est décrite par une "spec" : un dict léger
+et picklable qui ne contient que les données agrégées (moyennes, histogramme
+déjà calculé) et les titres. Une spec peut être rendue tout de suite avec
+plt.show(), ou plus tard, sans affichage, dans un pool de processus
+(backend Agg) pour rastériser toutes les figures en parallèle.
+"""
+import os
+
+import numpy as np
+
+import profiling
+
+
+def hist_spec(filename, values, title, xlabel, ylabel, bins=20, alpha=0.75, figsize=(10, 6), threshold=None):
+    # L'histogramme est calculé ici : la spec ne transporte que bins + effectifs
+    values = np.asarray(values, dtype=float)
+    counts, edges = np.histogram(values[~np.isnan(values)], bins=bins)
+    return {
+        "kind": "hist", "filename": filename, "figsize": figsize,
+        "counts": counts, "edges": edges, "alpha": alpha, "threshold": threshold,
+        "title": title, "xlabel": xlabel, "ylabel": ylabel,
+    }
+
+
+def bar_spec(filename, data, title, xlabel, ylabel, fmt="{:.1f}", alpha=0.85, figsize=(8, 5), legend_title=None):
+    # data : Series (une barre par groupe) ou DataFrame (barres groupées + légende)
+    return {
+        "kind": "bar", "filename": filename, "figsize": figsize,
+        "data": data, "alpha": alpha, "fmt": fmt, "legend_title": legend_title,
+        "title": title, "xlabel": xlabel, "ylabel": ylabel,
+    }
+
+
+def heatmap_spec(filename, matrix):
+    return {"kind": "heatmap", "filename": filename, "figsize": (10, 8), "data": matrix}
+
+
+def draw(spec, pyplot=True):
+    """
+    Construit la figure matplotlib d'une spec et la retourne.
+    pyplot=False : Figure indépendante de pyplot (rastérisée par Agg à l'enregistrement),
+    sans passer par le backend courant ni l'enregistrer parmi les figures ouvertes.
+    """
+    if pyplot:
+        import matplotlib.pyplot as plt
+        fig, ax = plt.subplots(figsize=spec["figsize"])
+    else:
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=spec["figsize"])
+        ax = fig.subplots()
+    kind = spec["kind"]
+
+    if kind == "hist":
+        edges = spec["edges"]
+        ax.hist(edges[:-1], bins=edges, weights=spec["counts"], edgecolor="black", alpha=spec["alpha"])
+        if spec["threshold"] is not None:
+            # ligne verticale du seuil (ex : High Stress = 70) + légende
+            ax.axvline(**spec["threshold"])
+            ax.legend()
+
+    elif kind == "bar":
+        spec["data"].plot(kind="bar", edgecolor="black", alpha=spec["alpha"], ax=ax)
+        ax.tick_params(axis="x", labelrotation=0)
+        if spec["legend_title"] is not None:
+            ax.legend(title=spec["legend_title"])
+        # valeurs au-dessus des barres
+        for p in ax.patches:
+            height = p.get_height()
+            ax.annotate(
+                spec["fmt"].format(height),
+                (p.get_x() + p.get_width() / 2, height),
+                ha="center",
+                va="bottom",
+                fontsize=9
+            )
+
+    elif kind == "heatmap":
+        corr_mat = spec["data"]
+        x_labels = list(corr_mat.columns)
+        y_labels = list(corr_mat.index)
+        font_dict = {
+            "fontsize": 14,
+            "fontweight": "bold",
+            "color": "purple",
+            "style": "italic",
+        }
+        # vmin/vmax fixés à [-1, 1] pour une lecture correcte des corrélations
+        heatmap = ax.imshow(corr_mat.values, cmap="coolwarm", vmin=-1, vmax=1, aspect="auto")
+        cbar = fig.colorbar(heatmap, ax=ax)
+        cbar.set_label("Corrélation")
+        ax.set_title("Matrice de corrélation", fontdict=font_dict)
+        ax.set_xlabel("Variables", fontdict=font_dict)
+        ax.set_ylabel("Variables", fontdict=font_dict)
+        ax.set_xticks(range(len(x_labels)))
+        ax.set_yticks(range(len(y_labels)))
+        ax.set_xticklabels(x_labels, rotation=45, ha="right")
+        ax.set_yticklabels(y_labels)
+        # grille légère pour bien séparer les cases
+        ax.set_xticks(np.arange(-0.5, len(x_labels), 1), minor=True)
+        ax.set_yticks(np.arange(-0.5, len(y_labels), 1), minor=True)
+        ax.grid(which="minor", linestyle="--", linewidth=0.5, alpha=0.7)
+        ax.tick_params(which="minor", bottom=False, left=False)
+        return fig
+
+    else:
+        raise ValueError(f"Type de figure inconnu : {kind}")
+
+    ax.set_title(spec["title"])
+    ax.set_xlabel(spec["xlabel"])
+    ax.set_ylabel(spec["ylabel"])
+    ax.grid(axis="y", linestyle="--", alpha=0.6)
+    return fig
+
+
+def render_spec(spec, fig_dir, show=False):
+    """
+    Dessine la spec, l'enregistre dans fig_dir (dpi=300, marges minimales)
+    et l'affiche si show=True. Retourne le chemin du PNG.
+    """
+    # Sans affichage, pyplot n'est pas utilisé : le backend de l'appelant reste inchangé
+    fig = draw(spec, pyplot=show)
+    path = os.path.join(fig_dir, spec["filename"])
+    with profiling.stage(f"savefig:{spec['filename']}"):
+        fig.savefig(path, dpi=300, bbox_inches="tight")
+    if show:
+        import matplotlib.pyplot as plt
+        plt.show()
+        plt.close(fig)
+    return path
+
+
+def _use_agg():
+    # Backend sans fenêtre : les workers ne font que rastériser
+    import matplotlib
+    matplotlib.use("Agg", force=True)
+
+
+def _render_in_worker(spec, fig_dir, context):
+    # Rendu dans un worker ; retourne aussi les étapes mesurées (savefig:...) pour le parent
+    if context is None:
+        return render_spec(spec, fig_dir), []
+    profiling.PROFILER.adopt(context)
+    return render_spec(spec, fig_dir), profiling.PROFILER.records
+
+
+def render_all(specs, fig_dir, workers=None):
+    """
+    Rend toutes les specs sans affichage. workers=None utilise tous les cœurs,
+    workers=1 rend dans le processus courant (sans changer son backend matplotlib).
+    Retourne la liste des PNG écrits. Les étapes savefig des workers sont
+    ajoutées à la trace du processus courant (profiling.PROFILER).
+    """
+    os.makedirs(fig_dir, exist_ok=True)
+    if workers == 1 or len(specs) <= 1:
+        return [render_spec(spec, fig_dir) for spec in specs]
+
+    # Importé ici : les lancements sans figures n'en ont pas besoin
+    from concurrent.futures import ProcessPoolExecutor
+
+    n = len(specs)
+    context = profiling.PROFILER.worker_context()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_use_agg) as pool:
+        results = list(pool.map(_render_in_worker, specs, [fig_dir] * n, [context] * n))
+    for _, records in results:
+        profiling.PROFILER.merge(records)
+    return [path for path, _ in results]
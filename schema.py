@@ -0,0 +1,25 @@
+# Schéma commun du CSV des développeurs (partagé par Main.py et les modules annexes)
+
+# Les 13 colonnes numériques nettoyées par Data.clean_data
+NUMERIC_COLS = [
+    'Hours_Coding', 'Lines_of_Code', 'Bugs_Found',
+    'Bugs_Fixed', 'AI_Usage_Hours', 'Sleep_Hours',
+    'Cognitive_Load', 'Task_Success_Rate', 'Coffee_Intake',
+    'Stress_Level', 'Task_Duration_Hours', 'Commits',
+    'Errors'
+]
+
+# Percentiles utilisés pour borner les outliers dans clean_data
+CLIP_LOWER = 0.01
+CLIP_UPPER = 0.99
+
+# Type attendu de chaque colonne numérique, utilisé par compact.py pour choisir
+# le plus petit dtype : "int" -> int8/int16/int32 si les valeurs le permettent,
+# "float" -> float32
+COLUMN_KINDS = {
+    'Hours_Coding': 'int', 'Lines_of_Code': 'int', 'Bugs_Found': 'int',
+    'Bugs_Fixed': 'int', 'AI_Usage_Hours': 'int', 'Sleep_Hours': 'float',
+    'Cognitive_Load': 'int', 'Task_Success_Rate': 'int', 'Coffee_Intake': 'int',
+    'Stress_Level': 'int', 'Task_Duration_Hours': 'float', 'Commits': 'int',
+    'Errors': 'int'
+}
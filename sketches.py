@@ -0,0 +1,110 @@
+"""
+Sketch de quantiles approximatifs (KLL) pour le mode streaming.
+
+Mémoire bornée (~ 3k valeurs par colonne, k déduit de l'erreur eps),
+fusionnable entre chunks ou entre workers, quel que soit le nombre de lignes.
+L'erreur de rang est de l'ordre de eps * n : quantile(0.5) retourne une valeur
+dont le rang réel est entre (0.5 - eps) * n et (0.5 + eps) * n.
+"""
+import numpy as np
+
+
+class KLLSketch:
+    """
+    Pile de "compacteurs" : le niveau h contient des valeurs de poids 2**h.
+    Quand un niveau déborde, on le trie et on garde une valeur sur deux
+    (décalage aléatoire) qui monte au niveau supérieur avec un poids double.
+    """
+
+    def __init__(self, eps=0.01, seed=0):
+        if not 0 < eps < 1:
+            raise ValueError("eps doit être compris entre 0 et 1")
+        self.eps = eps
+        self.k = max(8, int(np.ceil(2.5 / eps)))
+        self.n = 0
+        self.levels = [np.empty(0)]
+        self.rng = np.random.default_rng(seed)
+
+    def _capacity(self, h):
+        # Les niveaux bas ont une capacité plus petite (facteur 2/3 par niveau)
+        depth = len(self.levels) - 1 - h
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if len(level) > self._capacity(h):
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                level = np.sort(level)
+                # Nombre impair : la dernière valeur reste au niveau h
+                keep = level[-1:] if len(level) % 2 else level[:0]
+                pairs = level[:len(level) - len(keep)]
+                offset = self.rng.integers(2)
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], pairs[offset::2]])
+                self.levels[h] = keep
+                # Le niveau supérieur a pu déborder, et l'ajout d'un niveau change les capacités
+                h = 0
+                continue
+            h += 1
+
+    def update(self, values):
+        x = np.asarray(values, dtype=float).ravel()
+        x = x[~np.isnan(x)]
+        if len(x) == 0:
+            return
+        self.n += len(x)
+        self.levels[0] = np.concatenate([self.levels[0], x])
+        self._compress()
+
+    def update_weighted(self, value, count):
+        # Ajoute `count` fois la même valeur en O(log count) (décomposition binaire du poids)
+        count = int(count)
+        if count <= 0 or np.isnan(value):
+            return
+        self.n += count
+        h = 0
+        while count:
+            if count & 1:
+                while h >= len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[h] = np.append(self.levels[h], value)
+            count >>= 1
+            h += 1
+        self._compress()
+
+    def merge(self, other):
+        if other.k != self.k:
+            raise ValueError("Impossible de fusionner deux sketches de précision différente")
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, level in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], level])
+        self.n += other.n
+        self._compress()
+
+    def copy(self):
+        clone = KLLSketch(self.eps)
+        clone.n = self.n
+        clone.levels = [level.copy() for level in self.levels]
+        clone.rng = np.random.default_rng(self.rng.integers(2 ** 32))
+        return clone
+
+    def items(self):
+        # (valeurs gardées, poids) : la somme des poids vaut n
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2 ** h) for h, level in enumerate(self.levels)])
+        return items, weights
+
+    def quantile(self, q):
+        if self.n == 0:
+            return np.nan
+        items, weights = self.items()
+        order = np.argsort(items, kind="stable")
+        cum = np.cumsum(weights[order])
+        idx = np.searchsorted(cum, q * self.n, side="left")
+        return items[order][min(idx, len(items) - 1)]
+
+    def median(self):
+        return self.quantile(0.5)
@@ -0,0 +1,361 @@
+"""
+Mode streaming de Data : le CSV est lu par morceaux (chunks) de taille bornée
+et chaque morceau alimente des agrégats partiels fusionnables
+(moments par colonne, comptage des valeurs, sommes par groupe, co-moments de
+corrélation).
+
+Les groupements G1 à G8 sont agrégés directement sur les groupes (Sleep_Group,
+High_AI_Usage, ...) : quelques lignes par groupement. Les seuils calculés sur
+tout le fichier (médiane / moyenne) viennent du premier passage, qui ne calcule
+que les statistiques de colonnes. Le reste de la mémoire dépend de la taille
+d'un chunk et, pour les quantiles exacts, du nombre de valeurs distinctes des
+colonnes ; avec sketch_eps (sketches KLL), il est borné quel que soit le fichier.
+"""
+import numpy as np
+import pandas as pd
+
+import binning
+from cleaning import fused_clean
+from correlation import CorrelationAccumulator
+from schema import NUMERIC_COLS, CLIP_LOWER, CLIP_UPPER
+from sketches import KLLSketch
+
+
+# Définition des groupements G1 à G8 : (découpages de binning.py, colonnes moyennées).
+# G1 et G6 / G7 ont tous deux une clé High_Stress (seuil 70 / moyenne) : les clés
+# sont donc calculées par découpage et passées à groupby, pas ajoutées au chunk.
+GROUP_SPECS = {
+    "G1": ([binning.HIGH_STRESS_70],
+           ["Task_Success_Rate", "Sleep_Hours", "Hours_Coding", "AI_Usage_Hours"]),
+    "G2": ([binning.SLEEP_GROUP],
+           ["Stress_Level", "Task_Success_Rate", "Errors"]),
+    "G3": ([binning.CODING_HOURS_GROUP],
+           ["Task_Success_Rate", "Stress_Level", "Errors"]),
+    "G4": ([binning.HIGH_AI_USAGE],
+           ["Errors", "Task_Success_Rate", "Stress_Level"]),
+    "G5": ([binning.HIGH_COFFEE],
+           ["Stress_Level", "Task_Success_Rate"]),
+    "G6": ([binning.SLEEP_GROUP, binning.HIGH_STRESS_MEAN],
+           ["Task_Success_Rate", "Errors"]),
+    "G7": ([binning.HIGH_AI_USAGE_BOOL, binning.HIGH_STRESS_MEAN],
+           ["Errors", "Task_Success_Rate"]),
+    "G8": ([binning.CODING_HOURS_GROUP, binning.HIGH_SUCCESS],
+           ["Cognitive_Load", "Bugs_Found"]),
+}
+
+# Découpages dont le seuil est calculé sur tout le fichier (médiane / moyenne)
+GLOBAL_SPLITS = list({id(rule): rule for rules, _ in GROUP_SPECS.values() for rule in rules
+                      if isinstance(rule, binning.ThresholdSplit) and rule.stat is not None}.values())
+
+
+def group_keys(chunk, rule, thresholds):
+    # Clé de groupement du chunk pour un découpage (mêmes labels que Main.py)
+    values = chunk[rule.column].to_numpy()
+    if isinstance(rule, binning.Binning):
+        key = rule.apply(values)
+    else:
+        key = rule.apply(values, thresholds.get(id(rule), rule.threshold))
+    return pd.Series(key, index=chunk.index, name=rule.name)
+
+
+def coerce_chunk(chunk):
+    # Étapes 2 et 3 de clean_data : non numérique -> NaN, négatif -> NaN
+    for col in NUMERIC_COLS:
+        if col in chunk.columns:
+            values = pd.to_numeric(chunk[col], errors="coerce")
+            chunk[col] = values.mask(values < 0)
+    return chunk
+
+
+def clean_chunk(chunk, stats):
+    # Étapes 2 à 5 de clean_data avec les statistiques calculées sur tout le fichier
+    fused_clean(chunk, stats.index, stats)
+    return chunk
+
+
+def quantile_from_counts(counts, q):
+    """
+    Quantile exact (interpolation linéaire, comme Series.quantile)
+    à partir d'un comptage de valeurs {valeur: effectif}.
+    """
+    counts = counts[counts > 0].sort_index()
+    if counts.empty:
+        return np.nan
+    values = counts.index.to_numpy(dtype=float)
+    cum = counts.to_numpy().cumsum()
+    h = (cum[-1] - 1) * q
+    lo, hi = np.floor(h), np.ceil(h)
+    # la valeur de rang r (0-based) est la première dont l'effectif cumulé dépasse r
+    a = values[np.searchsorted(cum, lo, side="right")]
+    b = values[np.searchsorted(cum, hi, side="right")]
+    t = h - lo
+    # même formule d'interpolation que numpy
+    return b - (b - a) * (1 - t) if t >= 0.5 else a + (b - a) * t
+
+
+class ColumnMoments:
+    """Count, moyenne, M2 (somme des carrés des écarts), min et max par colonne."""
+
+    def __init__(self, columns):
+        k = len(columns)
+        self.columns = list(columns)
+        self.count = np.zeros(k)
+        self.mean = np.zeros(k)
+        self.m2 = np.zeros(k)
+        self.min = np.full(k, np.inf)
+        self.max = np.full(k, -np.inf)
+
+    def update(self, values):
+        # values : matrice (lignes x colonnes) en float64, NaN ignorés
+        mask = ~np.isnan(values)
+        part = ColumnMoments(self.columns)
+        part.count = mask.sum(axis=0).astype(float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            part.mean = np.where(part.count > 0, np.where(mask, values, 0).sum(axis=0) / part.count, 0)
+        part.m2 = (np.where(mask, values - part.mean, 0) ** 2).sum(axis=0)
+        part.min = np.where(mask, values, np.inf).min(axis=0, initial=np.inf)
+        part.max = np.where(mask, values, -np.inf).max(axis=0, initial=-np.inf)
+        self.merge(part)
+
+    def merge(self, other):
+        # Fusion de Chan et al. : exacte, indépendante de l'ordre des chunks
+        n = self.count + other.count
+        delta = other.mean - self.mean
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.mean = np.where(n > 0, self.mean + delta * other.count / n, 0)
+            self.m2 = np.where(n > 0, self.m2 + other.m2 + delta ** 2 * self.count * other.count / n, 0)
+        self.count = n
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+
+    def std(self):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.count > 1, np.sqrt(self.m2 / (self.count - 1)), np.nan)
+
+
+class GroupSums:
+    """Sommes et effectifs (non NaN) par groupe, fusionnables entre chunks."""
+
+    def __init__(self, rules, values):
+        self.rules = rules
+        self.values = values
+        self.sums = None
+        self.counts = None
+
+    def update(self, chunk, keys):
+        # keys : {id(découpage): clé du chunk}, calculées une fois pour tous les groupements
+        grouped = chunk.groupby([keys[id(rule)] for rule in self.rules], observed=True)[self.values]
+        self.merge_frames(grouped.sum(), grouped.count())
+
+    def merge_frames(self, sums, counts):
+        if self.sums is None:
+            self.sums, self.counts = sums, counts
+        else:
+            self.sums = self.sums.add(sums, fill_value=0)
+            self.counts = self.counts.add(counts, fill_value=0)
+
+    def merge(self, other):
+        if other.sums is not None:
+            self.merge_frames(other.sums, other.counts)
+
+
+class StreamAccumulator:
+    """
+    Tous les agrégats partiels d'un passage sur le CSV.
+    Deux accumulateurs (par exemple calculés par deux workers) se fusionnent avec merge().
+
+    sketch_eps : None = quantiles exacts (comptage des valeurs distinctes),
+                 sinon un sketch KLL par colonne d'erreur de rang ~ sketch_eps
+                 (mémoire bornée même pour des colonnes continues).
+    thresholds : seuils des GLOBAL_SPLITS {id(découpage): seuil}, voir split_thresholds
+                 (obligatoires sauf si stats_only).
+    """
+
+    def __init__(self, columns=NUMERIC_COLS, stats_only=False, sketch_eps=None, thresholds=None):
+        self.columns = list(columns)
+        self.stats_only = stats_only
+        self.sketch_eps = sketch_eps
+        self.thresholds = thresholds or {}
+        self.rows = 0
+        self.moments = ColumnMoments(self.columns)
+        self.value_counts = {}
+        self.sketches = {}
+        if sketch_eps is None:
+            self.value_counts = {col: pd.Series(dtype=float) for col in self.columns}
+        else:
+            self.sketches = {col: KLLSketch(sketch_eps, seed=i) for i, col in enumerate(self.columns)}
+        self.groups = {}
+        self.cross = None
+        if not stats_only:
+            self.groups = {name: GroupSums(rules, values) for name, (rules, values) in GROUP_SPECS.items()}
+            self.cross = CorrelationAccumulator(self.columns)
+
+    def update(self, chunk):
+        self.rows += len(chunk)
+        values = chunk[self.columns].to_numpy(dtype=float)
+        self.moments.update(values)
+        for i, col in enumerate(self.columns):
+            if col in self.sketches:
+                self.sketches[col].update(values[:, i])
+            else:
+                counts = chunk[col].value_counts()
+                self.value_counts[col] = self.value_counts[col].add(counts, fill_value=0)
+        if not self.stats_only:
+            keys = {}
+            for acc in self.groups.values():
+                for rule in acc.rules:
+                    if id(rule) not in keys:
+                        keys[id(rule)] = group_keys(chunk, rule, self.thresholds)
+                acc.update(chunk, keys)
+            self.cross.update(values)
+
+    def merge(self, other):
+        self.rows += other.rows
+        self.moments.merge(other.moments)
+        for col, counts in other.value_counts.items():
+            self.value_counts[col] = self.value_counts[col].add(counts, fill_value=0)
+        for col, sketch in other.sketches.items():
+            self.sketches[col].merge(sketch)
+        for name, acc in self.groups.items():
+            acc.merge(other.groups[name])
+        if self.cross is not None:
+            self.cross.merge(other.cross)
+
+    # ---------- Résultats ----------
+
+    def mean(self, col):
+        return self.moments.mean[self.columns.index(col)]
+
+    def quantile(self, col, q):
+        if col in self.sketches:
+            return self.sketches[col].quantile(q)
+        return quantile_from_counts(self.value_counts[col], q)
+
+    def median(self, col):
+        return self.quantile(col, 0.5)
+
+    def describe(self):
+        # Même tableau que DataFrame.describe() sur les colonnes numériques
+        m = self.moments
+        table = {
+            "count": m.count,
+            "mean": np.where(m.count > 0, m.mean, np.nan),
+            "std": m.std(),
+            "min": np.where(m.count > 0, m.min, np.nan),
+        }
+        for q, label in [(0.25, "25%"), (0.5, "50%"), (0.75, "75%")]:
+            table[label] = [self.quantile(col, q) for col in self.columns]
+        table["max"] = np.where(m.count > 0, m.max, np.nan)
+        return pd.DataFrame(table, index=self.columns).T
+
+    def clean_stats(self):
+        """
+        Statistiques de clean_data : nombre de NaN (après conversion), moyenne de remplacement
+        et bornes q01 / q99 calculées sur la colonne déjà remplie par la moyenne.
+        """
+        rows = []
+        for i, col in enumerate(self.columns):
+            missing = self.rows - self.moments.count[i]
+            mean = self.mean(col) if self.moments.count[i] > 0 else np.nan
+            fill = missing > 0 and not np.isnan(mean)
+            if col in self.sketches:
+                sketch = self.sketches[col]
+                if fill:
+                    sketch = sketch.copy()
+                    sketch.update_weighted(mean, missing)
+                q01, q99 = sketch.quantile(CLIP_LOWER), sketch.quantile(CLIP_UPPER)
+            else:
+                counts = self.value_counts[col]
+                if fill:
+                    counts = counts.add(pd.Series({mean: missing}), fill_value=0)
+                q01, q99 = quantile_from_counts(counts, CLIP_LOWER), quantile_from_counts(counts, CLIP_UPPER)
+            rows.append({"missing": int(missing), "mean": mean, "q01": q01, "q99": q99})
+        return pd.DataFrame(rows, index=self.columns)
+
+    def split_stat(self, col, how, stats=None):
+        """
+        Médiane ("median") ou moyenne ("mean") de col telle qu'après clean_data :
+        NaN remplacés par la moyenne puis valeurs bornées à [q01, q99] de stats
+        (voir clean_stats) ; stats=None : valeurs converties, NaN ignorés.
+        Exacte à partir du comptage des valeurs ; avec un sketch, la médiane est
+        estimée et la moyenne exacte à l'effet du bornage près (queues à 1 %).
+        """
+        if col in self.sketches:
+            values, weights = self.sketches[col].items()
+        else:
+            counts = self.value_counts[col]
+            values, weights = counts.index.to_numpy(dtype=float), counts.to_numpy(dtype=float)
+        if weights.sum() == 0:
+            return np.nan
+        clipped = values
+        if stats is not None:
+            row = stats.loc[col]
+            if row["missing"] > 0 and not np.isnan(row["mean"]):
+                # Le remplissage par la moyenne ne change pas la moyenne
+                values = np.append(values, row["mean"])
+                weights = np.append(weights, row["missing"])
+            clipped = np.clip(values, row["q01"], row["q99"])
+        if how == "mean":
+            # Moyenne exacte des moments + décalage dû au bornage
+            return self.mean(col) + np.average(clipped - values, weights=weights)
+        return quantile_from_counts(pd.Series(weights, index=clipped), 0.5)
+
+    def split_thresholds(self, stats=None):
+        # Seuils des GLOBAL_SPLITS pour le passage qui agrège les groupements
+        return {id(rule): self.split_stat(rule.column, rule.stat, stats) for rule in GLOBAL_SPLITS}
+
+    def group_means(self, name):
+        # Moyennes d'un groupement G1..G8
+        acc = self.groups[name]
+        return (acc.sums / acc.counts).round(2)
+
+    def corr(self):
+        return self.cross.corr()
+
+
+def stream_csv(path, chunksize, clean=True, sketch_eps=None):
+    """
+    Parcourt le CSV par chunks et retourne (accumulateur, statistiques de nettoyage).
+
+    Deux passages : le premier ne calcule que les statistiques de colonnes
+    (clean_data, seuils médiane / moyenne des groupements), le second agrège
+    les groupements G1 à G8, les moments et la corrélation.
+
+    clean=False : agrégats calculés sur les valeurs converties
+                  (NaN ignorés, outliers non bornés).
+    clean=True  : le second passage applique le nettoyage chunk par chunk avant
+                  d'agréger (mêmes résultats que la version en mémoire).
+    sketch_eps  : erreur de rang des sketches KLL pour les bornes q01 / q99, les
+                  médianes et les seuils des groupements (None = quantiles exacts
+                  par comptage des valeurs).
+    """
+    first = StreamAccumulator(stats_only=True, sketch_eps=sketch_eps)
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        first.update(coerce_chunk(chunk))
+    stats = first.clean_stats()
+
+    thresholds = first.split_thresholds(stats if clean else None)
+    acc = StreamAccumulator(sketch_eps=sketch_eps, thresholds=thresholds)
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        acc.update(clean_chunk(chunk, stats) if clean else coerce_chunk(chunk))
+    return acc, stats
+
+
+def describe_csv(path, chunksize, sketch_eps=None):
+    """
+    DataFrame.describe() du CSV brut, en un passage par chunks : valeurs telles quelles
+    (négatifs compris), colonnes contenant du texte exclues comme le fait pandas
+    pour une colonne object.
+    """
+    columns = list(pd.read_csv(path, nrows=0).columns)
+    acc = StreamAccumulator(columns, stats_only=True, sketch_eps=sketch_eps)
+    text = set()
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        for col in columns:
+            values = pd.to_numeric(chunk[col], errors="coerce")
+            if (values.isna() & chunk[col].notna()).any():
+                text.add(col)
+            chunk[col] = values
+        acc.update(chunk)
+    return acc.describe()[[col for col in columns if col not in text]]
+
@@ -0,0 +1,340 @@
+"""
+Générateur de données synthétiques au format du CSV des développeurs (13 colonnes
+de schema.NUMERIC_COLS), pour les benchmarks et l'entraînement ML à grande échelle.
+
+Les lois marginales sont apprises sur le CSV d'origine : chaque colonne est tirée
+par inversion de sa fonction de répartition empirique, puis arrondie comme
+l'original (entiers, ou une décimale). Les défauts du CSV d'origine sont
+reproduits aux mêmes taux : NaN, valeurs négatives, texte ("abc", "oops", ...)
+et lignes dupliquées, pour que clean_data ait le même travail à faire.
+
+Les dépendances entre colonnes passent par une copule gaussienne : Z ~ N(0, R),
+U = Phi(Z), puis x_j = F_j^-1(U_j). La cible par défaut est la matrice écrite
+par Data.matrix_correlation (correlation_matrix.csv) ; R est recalibrée pour que
+la corrélation de Pearson des données tirées y retombe malgré les marginales
+asymétriques. GaussianCopula.fit estime plutôt R sur les rangs du CSV d'origine.
+
+La génération se fait par blocs vectorisés de block_rows lignes (mémoire bornée
+par un bloc), écrits au fil de l'eau :
+  - CSV : octets construits par tables de chaînes (sans DataFrame.to_csv) ;
+  - npy : un .npy float32 par colonne, au format de frame_cache.write_columns
+          (relu par output.read_frame, le texte devient NaN).
+Bloc i tiré avec default_rng([seed, i]) : un même (n, seed, block_rows) donne
+toujours le même fichier.
+
+Usage : python synthetic.py 1e7 synthetic_10M.csv [--seed 42] [--format npy] [--fit-correlation]
+"""
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr, ndtri
+
+from schema import COLUMN_KINDS, NUMERIC_COLS
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SOURCE_CSV = os.path.join(HERE, "AI_Developer_Performance_Extended_1000.csv")
+CORRELATION_CSV = os.path.join(HERE, "correlation_matrix.csv")
+BLOCK_ROWS = 1_000_000
+# Points de la fonction de répartition gardés par colonne
+QUANTILES = 1001
+# À changer quand un même (n, seed) ne donne plus le même fichier (voir benchmark.dataset)
+VERSION = 2
+
+
+class Marginals:
+    """Lois marginales + taux de défauts d'un CSV au format du projet."""
+
+    def __init__(self, quantiles, decimals, nan_rate, negative_rate, text_values, text_rate, duplicate_rate):
+        self.quantiles = quantiles          # {colonne: valeurs aux QUANTILES points de 0 à 1}
+        self.decimals = decimals            # {colonne: 0 ou 1}
+        self.nan_rate = nan_rate            # {colonne: part de NaN}
+        self.negative_rate = negative_rate  # {colonne: part de valeurs négatives}
+        self.text_values = text_values      # {colonne: valeurs texte observées}
+        self.text_rate = text_rate          # {colonne: part de valeurs texte}
+        self.duplicate_rate = duplicate_rate
+
+    @classmethod
+    def fit(cls, df):
+        n = len(df)
+        probs = np.linspace(0, 1, QUANTILES)
+        quantiles, decimals, nan_rate, negative_rate, text_values, text_rate = {}, {}, {}, {}, {}, {}
+        for col in NUMERIC_COLS:
+            raw = df[col]
+            values = pd.to_numeric(raw, errors="coerce")
+            text = raw[values.isna() & raw.notna()]
+            valid = values[values >= 0].dropna().to_numpy(dtype=float)
+            quantiles[col] = np.quantile(valid, probs)
+            decimals[col] = 0 if COLUMN_KINDS[col] == "int" else 1
+            nan_rate[col] = raw.isna().sum() / n
+            negative_rate[col] = (values < 0).sum() / n
+            text_values[col] = sorted(text.astype(str).unique())
+            text_rate[col] = len(text) / n
+        return cls(quantiles, decimals, nan_rate, negative_rate, text_values, text_rate,
+                   df.duplicated().sum() / n)
+
+    @classmethod
+    def from_csv(cls, path=SOURCE_CSV):
+        return cls.fit(pd.read_csv(path))
+
+    def sample(self, col, u):
+        # Inversion de la fonction de répartition empirique : interpolation linéaire
+        # sur la grille régulière des QUANTILES (~6x plus rapide que np.interp)
+        q = self.quantiles[col]
+        pos = u * (QUANTILES - 1)
+        i = np.minimum(pos.astype(np.intp), QUANTILES - 2)
+        x = q.take(i)
+        x += (pos - i) * np.diff(q).take(i)
+        return np.round(x, self.decimals[col], out=x)
+
+
+def nearest_correlation(matrix):
+    # Matrice arrondie à 2 décimales : pas toujours définie positive.
+    # Valeurs propres relevées à 1e-6, puis diagonale ramenée à 1.
+    values, vectors = np.linalg.eigh((matrix + matrix.T) / 2)
+    fixed = (vectors * np.maximum(values, 1e-6)) @ vectors.T
+    d = np.sqrt(np.diag(fixed))
+    return fixed / np.outer(d, d)
+
+
+class GaussianCopula:
+    """Corrélation latente R (dans l'ordre de NUMERIC_COLS) et son facteur de Cholesky."""
+
+    def __init__(self, correlation):
+        self.correlation = nearest_correlation(np.asarray(correlation, dtype=float))
+        self.factor = np.linalg.cholesky(self.correlation)
+
+    @classmethod
+    def from_csv(cls, path=CORRELATION_CSV, marginals=None):
+        """
+        Copule de la matrice de Data.matrix_correlation (une colonne absente est tirée
+        indépendamment). Avec marginals, R est ajustée pour que la corrélation de Pearson
+        des données tirées retombe sur la matrice (voir calibrate).
+        """
+        corr = pd.read_csv(path, index_col=0).reindex(index=NUMERIC_COLS, columns=NUMERIC_COLS)
+        corr = corr.fillna(0.0).to_numpy()
+        np.fill_diagonal(corr, 1.0)
+        return cls.calibrate(marginals, corr) if marginals is not None else cls(corr)
+
+    @classmethod
+    def calibrate(cls, marginals, target, rows=100_000, steps=3, seed=0):
+        # Marginales asymétriques (Lines_of_Code, ...) : Pearson(x) < R latente.
+        # Point fixe R <- R + (cible - observée), mesuré sur rows lignes propres.
+        target = np.asarray(target, dtype=float)
+        latent = target.copy()
+        for step in range(steps):
+            block = sample_block(marginals, cls(latent), rows, np.random.default_rng([seed, step]), dirty=False)
+            observed = np.corrcoef(np.stack([block.values[col] for col in NUMERIC_COLS]))
+            latent = np.clip(latent + target - observed, -0.999, 0.999)
+            np.fill_diagonal(latent, 1.0)
+        return cls(latent)
+
+    @classmethod
+    def fit(cls, df):
+        # Corrélation des scores normaux Phi^-1(rang / (n + 1)) des lignes propres
+        values = df[NUMERIC_COLS].apply(pd.to_numeric, errors="coerce")
+        values = values[(values >= 0).all(axis=1)]
+        scores = ndtri(values.rank().to_numpy() / (len(values) + 1))
+        return cls(np.corrcoef(scores, rowvar=False))
+
+    @classmethod
+    def independent(cls):
+        return cls(np.eye(len(NUMERIC_COLS)))
+
+    def uniforms(self, n, rng):
+        # (n, 13) uniformes dépendantes : U = Phi(Z L^T)
+        z = rng.standard_normal((n, len(NUMERIC_COLS))) @ self.factor.T
+        return ndtr(z)
+
+
+class Block:
+    """
+    n lignes tirées, colonne par colonne : values[col] en float64 (NaN = manquant)
+    et text[col], indice dans marginals.text_values[col] (-1 = pas de texte).
+    """
+
+    def __init__(self, values, text):
+        self.values = values
+        self.text = text
+
+    def __len__(self):
+        return len(self.values[NUMERIC_COLS[0]])
+
+    def frame(self, marginals):
+        # DataFrame comme pd.read_csv la relirait (entiers nullables, texte en object)
+        columns = {}
+        for col in NUMERIC_COLS:
+            series = pd.Series(self.values[col])
+            if marginals.decimals[col] == 0:
+                series = series.astype("Int64")
+            hit = np.flatnonzero(self.text[col] >= 0)
+            if len(hit):
+                series = series.astype(object)
+                series.iloc[hit] = np.asarray(marginals.text_values[col], dtype=object)[self.text[col][hit]]
+            columns[col] = series
+        return pd.DataFrame(columns)
+
+
+def sample_block(marginals, copula, n, rng, dirty=True):
+    """Un bloc de n lignes ; dirty=False : sans NaN / négatifs / texte / doublons."""
+    u = copula.uniforms(n, rng)
+    values, text = {}, {}
+    for j, col in enumerate(NUMERIC_COLS):
+        x = marginals.sample(col, u[:, j])
+        t = np.full(n, -1, dtype=np.int64)
+        if dirty and marginals.negative_rate[col] > 0:
+            neg = rng.random(n) < marginals.negative_rate[col]
+            x[neg] = -x[neg] - 1
+        if dirty and marginals.nan_rate[col] > 0:
+            x[rng.random(n) < marginals.nan_rate[col]] = np.nan
+        if dirty and marginals.text_rate[col] > 0:
+            hit = np.flatnonzero(rng.random(n) < marginals.text_rate[col])
+            t[hit] = rng.integers(0, len(marginals.text_values[col]), len(hit))
+            x[hit] = np.nan
+        values[col], text[col] = x, t
+    if dirty and marginals.duplicate_rate > 0:
+        # Lignes recopiées depuis d'autres lignes du bloc (doublons exacts)
+        dup = np.flatnonzero(rng.random(n) < marginals.duplicate_rate)
+        src = rng.integers(0, n, len(dup))
+        for col in NUMERIC_COLS:
+            values[col][dup] = values[col][src]
+            text[col][dup] = text[col][src]
+    return Block(values, text)
+
+
+def blocks(n, seed=42, marginals=None, copula=None, block_rows=BLOCK_ROWS, dirty=True):
+    """
+    Génère n lignes en Block de block_rows lignes au plus (mémoire bornée par un bloc).
+    copula=None : corrélations de correlation_matrix.csv.
+    """
+    marginals = marginals or Marginals.from_csv()
+    copula = copula or GaussianCopula.from_csv(marginals=marginals)
+    for i, start in enumerate(range(0, n, block_rows)):
+        rng = np.random.default_rng([seed, i])
+        yield sample_block(marginals, copula, min(block_rows, n - start), rng, dirty)
+
+
+def _cells(x, t, decimals, tokens):
+    """
+    Une colonne du bloc -> (table d'octets, longueurs, codes) : une ligne de la table
+    par valeur possible entre le min et le max du bloc, puis "" (NaN), puis les textes.
+    """
+    scale = 10 ** decimals
+    finite = ~np.isnan(x)
+    k = np.zeros(len(x), dtype=np.int64)
+    k[finite] = np.rint(x[finite] * scale)
+    low, high = (k[finite].min(), k[finite].max()) if finite.any() else (0, -1)
+    steps = np.arange(low, high + 1)
+    strings = [str(v) for v in steps] if decimals == 0 else [f"{v / scale:.{decimals}f}" for v in steps]
+    strings = [s.encode() for s in strings + [""] + list(tokens)]
+    codes = np.where(finite, k - low, len(steps))
+    codes = np.where(t >= 0, len(steps) + 1 + t, codes)
+
+    table = np.zeros((len(strings), max(map(len, strings))), dtype=np.uint8)
+    for i, s in enumerate(strings):
+        table[i, :len(s)] = np.frombuffer(s, dtype=np.uint8)
+    lengths = np.array([len(s) for s in strings], dtype=np.int64)
+    return table, lengths, codes
+
+
+def encode_csv(block, marginals):
+    """Lignes CSV du bloc en octets (sans en-tête), même texte que Block.frame(...).to_csv."""
+    n, k = len(block), len(NUMERIC_COLS)
+    columns = [_cells(block.values[col], block.text[col], marginals.decimals[col], marginals.text_values[col])
+               for col in NUMERIC_COLS]
+    # Une cellule occupe len + 1 octets (suivie de "," ou "\n")
+    width = np.stack([lengths[codes] for _, lengths, codes in columns], axis=1) + 1
+    starts = (np.cumsum(width, axis=None) - width.ravel()).reshape(n, k)
+    out = np.empty(int(width.sum()), dtype=np.uint8)
+    for j, (table, lengths, codes) in enumerate(columns):
+        pos, size = starts[:, j], width[:, j] - 1
+        for b in range(table.shape[1]):
+            m = size > b
+            out[pos[m] + b] = table[codes[m], b]
+        out[pos + size] = ord("\n") if j == k - 1 else ord(",")
+    return out.tobytes()
+
+
+def write_csv(path, n, seed=42, marginals=None, copula=None, block_rows=BLOCK_ROWS, dirty=True):
+    """Écrit n lignes dans path (fichier temporaire puis renommage atomique) et retourne path."""
+    marginals = marginals or Marginals.from_csv()
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write((",".join(NUMERIC_COLS) + "\n").encode())
+            for block in blocks(n, seed, marginals, copula, block_rows, dirty):
+                f.write(encode_csv(block, marginals))
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return path
+
+
+def write_columns(path, n, seed=42, marginals=None, copula=None, block_rows=BLOCK_ROWS, dirty=True):
+    """
+    Écrit n lignes dans le dossier path, un .npy float32 par colonne (texte -> NaN),
+    au format de frame_cache.write_columns, et retourne path.
+    """
+    path = os.path.abspath(path)
+    folder = os.path.dirname(path)
+    os.makedirs(folder, exist_ok=True)
+    # Même remplacement atomique que output.write_frame
+    tmp = tempfile.mkdtemp(dir=folder, prefix=".tmp-")
+    try:
+        files = [np.lib.format.open_memmap(os.path.join(tmp, f"{i}.npy"), mode="w+", dtype=np.float32, shape=(n,))
+                 for i in range(len(NUMERIC_COLS))]
+        start = 0
+        for block in blocks(n, seed, marginals, copula, block_rows, dirty):
+            for column, col in zip(files, NUMERIC_COLS):
+                column[start:start + len(block)] = block.values[col]
+            start += len(block)
+        for column in files:
+            column.flush()
+        del files
+        with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({"columns": NUMERIC_COLS, "categories": {}, "params": {"rows": n, "seed": seed}}, f)
+        os.chmod(tmp, 0o755)
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        os.replace(tmp, path)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Génère des données synthétiques au format du projet")
+    parser.add_argument("rows", type=lambda s: int(float(s)), help="nombre de lignes (1e6 accepté)")
+    parser.add_argument("output", help="CSV de sortie (dossier de .npy avec --format npy)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--format", default="csv", choices=["csv", "npy"])
+    parser.add_argument("--clean", action="store_true", help="sans NaN / négatifs / texte / doublons")
+    parser.add_argument("--correlation", default=CORRELATION_CSV, help="matrice cible (défaut : correlation_matrix.csv)")
+    parser.add_argument("--fit-correlation", action="store_true", help="estimer la corrélation sur le CSV d'origine")
+    parser.add_argument("--independent", action="store_true", help="colonnes indépendantes")
+    parser.add_argument("--block-rows", type=lambda s: int(float(s)), default=BLOCK_ROWS)
+    args = parser.parse_args(argv)
+
+    source = pd.read_csv(SOURCE_CSV)
+    marginals = Marginals.fit(source)
+    if args.independent:
+        copula = GaussianCopula.independent()
+    elif args.fit_correlation:
+        copula = GaussianCopula.fit(source)
+    else:
+        copula = GaussianCopula.from_csv(args.correlation, marginals)
+    write = write_columns if args.format == "npy" else write_csv
+    start = time.perf_counter()
+    path = write(args.output, args.rows, args.seed, marginals, copula, args.block_rows, not args.clean)
+    seconds = time.perf_counter() - start
+    print(f"Saved: {path} ({args.rows:,} rows in {seconds:.1f}s, {args.rows / seconds:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
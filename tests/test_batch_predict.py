@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+from sklearn.pipeline import Pipeline
+
+from artifact import load_artifact, save_artifact
+from batch_predict import score_csv
+from candidates import make_preprocess
+
+FEATURES = ["Hours_Coding", "Sleep_Hours"]
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    X = pd.DataFrame({"Hours_Coding": [1.0, 4.0, 8.0, 10.0], "Sleep_Hours": [5.0, 6.0, 7.0, 8.0]})
+    y = np.array([40.0, 55.0, 70.0, 80.0])
+    pipeline = Pipeline([("prep", make_preprocess(FEATURES)), ("model", LinearRegression())]).fit(X, y)
+    return save_artifact(pipeline, "LinearRegression", FEATURES, "Task_Success_Rate", {}, models_dir=tmp_path / "models")
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_header_only_csv_writes_empty_predictions(tmp_path, model_path, workers):
+    source = tmp_path / "rows.csv"
+    source.write_text(",".join(FEATURES) + "\n")
+    output, rows, _ = score_csv(source, tmp_path / "pred.npy", model_path, workers=workers)
+    assert rows == 0
+    assert np.load(output).shape == (0,)
+
+
+def test_predictions_follow_csv_rows(tmp_path, model_path):
+    source = tmp_path / "rows.csv"
+    pd.DataFrame({"Sleep_Hours": [6.0, 7.5, 5.0], "Hours_Coding": [3.0, 9.0, 1.0]}).to_csv(source, index=False)
+    output, rows, _ = score_csv(source, tmp_path / "pred.npy", model_path, chunksize=2, workers=2)
+    pipeline, _ = load_artifact(model_path)
+    expected = pipeline.predict(pd.read_csv(source)[FEATURES])
+    assert rows == 3
+    np.testing.assert_allclose(np.load(output), expected)
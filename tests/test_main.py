@@ -0,0 +1,34 @@
+import contextlib
+import io
+import shutil
+from pathlib import Path
+
+import pytest
+
+import Main
+import rendering
+
+CSV = Path(__file__).resolve().parent.parent / "AI_Developer_Performance_Extended_1000.csv"
+
+
+def run(argv):
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        Main.main(argv)
+    return out.getvalue()
+
+
+@pytest.fixture
+def csv(tmp_path, monkeypatch):
+    # figures/ créé dans tmp_path ; le rendu des figures n'est pas testé ici
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(rendering, "render_all", lambda *args, **kwargs: None)
+    monkeypatch.setattr(rendering, "render_spec", lambda *args, **kwargs: None)
+    return str(shutil.copy(CSV, tmp_path))
+
+
+def test_group_prints_same_tables_as_all(csv):
+    grouped = run(["group", csv])
+    everything = run(["all", csv])
+    start = everything.index(grouped.lstrip().splitlines()[0])
+    assert everything[start:start + len(grouped.lstrip())] == grouped.lstrip()
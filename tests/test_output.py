@@ -0,0 +1,17 @@
+import os
+
+import pandas as pd
+
+import output
+
+
+def test_partitioned_rewrite_leaves_no_old_output(tmp_path):
+    df = pd.DataFrame({"Sleep_Group": ["<5h", "5-7h", "<5h"], "Coffee": [1.0, 2.0, 3.0]})
+    dest = tmp_path / "out_by_Sleep_Group"
+    output.write_frame(df, dest, partition_by="Sleep_Group")
+    output.write_frame(df, dest, partition_by="Sleep_Group")
+
+    assert sorted(os.listdir(dest)) == ["Sleep_Group=%3C5h", "Sleep_Group=5-7h"]
+    assert os.listdir(tmp_path) == ["out_by_Sleep_Group"]
+    back = output.read_frame(dest).sort_values("Coffee", ignore_index=True)
+    pd.testing.assert_frame_equal(back, df.sort_values("Coffee", ignore_index=True))